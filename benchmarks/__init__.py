@@ -0,0 +1 @@
+"""Benchmark suite for the Balatro automation (run: task bench)."""
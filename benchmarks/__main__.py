@@ -0,0 +1,140 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks [--suite {micro,macro,all}] [--filter NAME]
+                         [--threshold PERCENT] [--update-baseline]
+                         [--allow-missing-baseline]
+
+Micro results are written to benchmarks/results.json and compared
+against benchmarks/baseline.json, the macro result likewise to
+macro_results.json and macro_baseline.json; the exit code is 1 if
+anything regressed by more than the threshold. Baselines are machine
+specific and not committed: without one the gate cannot run, so the
+exit code is 2 unless --allow-missing-baseline is given.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .harness import compare, load_results, run_benchmark, save_results
+from .macro import compare_macro, load_macro, run_macro, save_macro
+from .micro import MICRO_BENCHMARKS
+
+BENCH_DIR = Path(__file__).parent
+
+
+def run_micro(args: argparse.Namespace) -> Optional[list[str]]:
+    """Run the micro-benchmarks; None if there is no baseline yet."""
+    results = []
+    for name, setup in MICRO_BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        result = run_benchmark(name, setup(), min_time=args.min_time)
+        print(result)
+        results.append(result)
+
+    save_results(args.output, results)
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f'Baseline updated: {args.baseline}')
+        return []
+    if not args.baseline.exists():
+        return None
+    return compare(results, load_results(args.baseline), args.threshold)
+
+
+def run_macro_suite(args: argparse.Namespace) -> Optional[list[str]]:
+    """Run the macro benchmark; None if there is no baseline yet."""
+    result = run_macro(args.iterations)
+    print(result.report())
+
+    output = args.output.with_name('macro_' + args.output.name)
+    baseline = args.baseline.with_name('macro_' + args.baseline.name)
+    save_macro(output, result)
+    if args.update_baseline:
+        save_macro(baseline, result)
+        print(f'Baseline updated: {baseline}')
+        return []
+    if not baseline.exists():
+        return None
+    return compare_macro(result, load_macro(baseline), args.threshold)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the selected benchmarks and gate on regressions."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        '--suite', choices=('micro', 'macro', 'all'), default='all'
+    )
+    parser.add_argument(
+        '--filter', default='', help='only run benchmarks containing this'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10.0,
+        help='allowed regression in percent (default: 10)',
+    )
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=100,
+        help='farming iterations of the macro benchmark (default: 100)',
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=BENCH_DIR / 'baseline.json'
+    )
+    parser.add_argument(
+        '--output', type=Path, default=BENCH_DIR / 'results.json'
+    )
+    parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='store these results as the new baseline',
+    )
+    parser.add_argument(
+        '--allow-missing-baseline',
+        action='store_true',
+        help='exit 0 instead of 2 when no baseline is stored',
+    )
+    args = parser.parse_args(argv)
+
+    # Keep match logging out of the measurements' output
+    logging.disable(logging.INFO)
+
+    suites = []
+    if args.suite in {'micro', 'all'}:
+        suites.append(run_micro)
+    if args.suite in {'macro', 'all'}:
+        suites.append(run_macro_suite)
+
+    regressions = []
+    missing_baseline = False
+    for suite in suites:
+        found = suite(args)
+        if found is None:
+            missing_baseline = True
+        else:
+            regressions.extend(found)
+
+    if args.update_baseline:
+        return 0
+    for message in regressions:
+        print(f'REGRESSION {message}')
+    if regressions:
+        return 1
+    if missing_baseline:
+        print('No baseline yet; run with --update-baseline to store one.')
+        if not args.allow_missing_baseline:
+            return 2
+    print(f'No regressions above {args.threshold:g}%.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
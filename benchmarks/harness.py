@@ -0,0 +1,145 @@
+"""
+Minimal benchmark harness.
+
+Times a callable with an auto-calibrated loop count, measures the peak
+memory it allocates per call with tracemalloc, and compares results
+against a stored JSON baseline.
+"""
+
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+# Allocation growth below this many bytes is never a regression
+ALLOCATION_SLACK = 1024
+
+
+@dataclass
+class BenchmarkResult:
+    """Value object with the measurements of one benchmark."""
+
+    name: str
+    ns_per_op: float
+    median_ns_per_op: float
+    peak_bytes_per_op: int
+    loops: int
+
+    def __str__(self) -> str:
+        return (
+            f'{self.name:<36} {self.ns_per_op:>14,.0f} ns/op '
+            f'{self.peak_bytes_per_op:>12,} B peak'
+        )
+
+
+def _time_loops(op: Callable[[], object], loops: int) -> int:
+    """Run the op in a tight loop and return elapsed nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        op()
+    return time.perf_counter_ns() - start
+
+
+def run_benchmark(
+    name: str,
+    op: Callable[[], object],
+    min_time: float = 0.2,
+    repeats: int = 5,
+) -> BenchmarkResult:
+    """
+    Measure a callable.
+
+    The loop count is doubled until one repeat takes at least
+    ``min_time / repeats`` seconds. The reported time is the best repeat,
+    which is the least disturbed by other processes.
+
+    Args:
+        name: Benchmark name.
+        op: Zero-argument callable to measure.
+        min_time: Approximate total measuring time in seconds.
+        repeats: Number of timed repeats.
+
+    Returns:
+        The measurements.
+    """
+    op()  # warm caches and lazy initialization
+
+    target_ns = min_time / repeats * 1e9
+    loops = 1
+    while _time_loops(op, loops) < target_ns and loops < 1 << 20:
+        loops *= 2
+
+    per_op = [_time_loops(op, loops) / loops for _ in range(repeats)]
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        ns_per_op=min(per_op),
+        median_ns_per_op=statistics.median(per_op),
+        peak_bytes_per_op=max(peak - baseline, 0),
+        loops=loops,
+    )
+
+
+def save_results(path: Path, results: list[BenchmarkResult]) -> None:
+    """Write results as JSON, keyed by benchmark name."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {result.name: asdict(result) for result in results}
+    path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+
+def load_results(path: Path) -> dict[str, BenchmarkResult]:
+    """Read results written by save_results."""
+    data = json.loads(path.read_text(encoding='utf-8'))
+    return {name: BenchmarkResult(**values) for name, values in data.items()}
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    threshold: float,
+) -> list[str]:
+    """
+    Find benchmarks that regressed against the baseline.
+
+    Args:
+        results: Fresh measurements.
+        baseline: Stored measurements by name.
+        threshold: Allowed slowdown or allocation growth in percent.
+
+    Returns:
+        One message per regression (empty if none).
+    """
+    regressions = []
+    limit = 1 + threshold / 100
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        if result.ns_per_op > reference.ns_per_op * limit:
+            change = result.ns_per_op / reference.ns_per_op - 1
+            regressions.append(
+                f'{result.name}: {change:+.1%} time '
+                f'({reference.ns_per_op:,.0f} -> {result.ns_per_op:,.0f} ns)'
+            )
+        if (
+            result.peak_bytes_per_op
+            > reference.peak_bytes_per_op * limit + ALLOCATION_SLACK
+        ):
+            regressions.append(
+                f'{result.name}: peak allocation '
+                f'{reference.peak_bytes_per_op:,} -> '
+                f'{result.peak_bytes_per_op:,} bytes'
+            )
+    return regressions
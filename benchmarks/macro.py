@@ -0,0 +1,233 @@
+"""
+Macro benchmark: full farming iterations against the headless game.
+
+Drives FarmingService.run_iteration on the simulated screen and input
+adapters with a virtual clock, so waits cost nothing and the measured
+CPU time is the automation's own overhead. Reports iterations per
+second, CPU time per iteration split by stage, peak RSS, and projected
+resets per hour (virtual waiting time plus measured CPU time).
+"""
+
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.simulated_game import (
+    SimulatedGame,
+    SimulatedInputAdapter,
+    SimulatedScreenAdapter,
+)
+from balatro.domain.model import ProfileConfig
+from balatro.service_layer.farming import FarmingService
+
+from .micro import ASSETS_DIR, load_profile
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Methods of FarmingService timed as separate stages
+STAGES = {
+    'scan': 'scan_and_decide',
+    'execute': '_execute_decision',
+    'reset': '_new_game',
+}
+
+
+@dataclass
+class MacroResult:
+    """Value object with the measurements of a macro benchmark run."""
+
+    iterations: int
+    wall_seconds: float
+    cpu_seconds: float
+    virtual_seconds: float
+    stage_cpu_seconds: dict[str, float] = field(default_factory=dict)
+    peak_rss_bytes: Optional[int] = None
+
+    @property
+    def iterations_per_second(self) -> float:
+        """Iterations processed per wall-clock second."""
+        return self.iterations / self.wall_seconds
+
+    @property
+    def cpu_ms_per_iteration(self) -> float:
+        """CPU milliseconds spent per iteration."""
+        return self.cpu_seconds / self.iterations * 1000
+
+    @property
+    def projected_resets_per_hour(self) -> float:
+        """Resets per hour with real waits plus the measured CPU time."""
+        per_iteration = (self.virtual_seconds + self.cpu_seconds) / (
+            self.iterations
+        )
+        return 3600 / per_iteration
+
+    def report(self) -> str:
+        """Human readable summary."""
+        lines = [
+            f'iterations               {self.iterations}',
+            f'iterations/sec           {self.iterations_per_second:,.1f}',
+            f'cpu per iteration        {self.cpu_ms_per_iteration:,.2f} ms',
+        ]
+        for stage, seconds in self.stage_cpu_seconds.items():
+            per_iteration = seconds / self.iterations * 1000
+            lines.append(f'  {stage:<22} {per_iteration:,.2f} ms')
+        lines.append(
+            f'projected resets/hour    {self.projected_resets_per_hour:,.1f}'
+        )
+        if self.peak_rss_bytes is not None:
+            lines.append(
+                f'peak RSS                 {self.peak_rss_bytes / 2**20:,.1f}'
+                ' MiB'
+            )
+        return '\n'.join(lines)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, if the OS reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _StaticConfig:
+    """Config port serving one profile and discarding saves."""
+
+    def __init__(self, profile: ProfileConfig):
+        self.profile = profile
+
+    def get_current_profile_name(self) -> str:
+        return self.profile.name
+
+    def list_profiles(self) -> list[str]:
+        return [self.profile.name]
+
+    def load_profile(self, profile_name: str) -> ProfileConfig:
+        return self.profile
+
+    def save_profile(self, config: ProfileConfig) -> None:
+        pass
+
+
+def _timed(
+    method: Callable[..., object], stage: str, totals: dict[str, float]
+) -> Callable[..., object]:
+    """Wrap a method to accumulate its CPU time under a stage."""
+
+    def wrapper(*args, **kwargs):
+        start = time.process_time()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            totals[stage] += time.process_time() - start
+
+    return wrapper
+
+
+def run_macro(iterations: int = 100, seed: int = 0) -> MacroResult:
+    """
+    Run farming iterations against the simulated game.
+
+    Args:
+        iterations: Number of run_iteration calls.
+        seed: Seed of the simulated game.
+
+    Returns:
+        The measurements.
+    """
+    profile = load_profile()
+    clock = VirtualClock()
+    game = SimulatedGame(
+        profile,
+        ASSETS_DIR,
+        clock,
+        seed=seed,
+        charm_probability=0.3,
+        double_probability=0.2,
+        soul_per_pack=0.05,
+    )
+    farming = FarmingService(
+        SimulatedScreenAdapter(game),
+        SimulatedInputAdapter(game),
+        _StaticConfig(profile),
+        clock=clock,
+    )
+
+    totals = dict.fromkeys(STAGES, 0.0)
+    for stage, name in STAGES.items():
+        setattr(farming, name, _timed(getattr(farming, name), stage, totals))
+
+    farming.run_iteration()  # warm-up: template cache, lazy imports
+    for stage in totals:
+        totals[stage] = 0.0
+    virtual_start = clock.now()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        farming.run_iteration()
+    cpu_seconds = time.process_time() - cpu_start
+    wall_seconds = time.perf_counter() - wall_start
+
+    totals['other'] = max(cpu_seconds - sum(totals.values()), 0.0)
+    return MacroResult(
+        iterations=iterations,
+        wall_seconds=wall_seconds,
+        cpu_seconds=cpu_seconds,
+        virtual_seconds=clock.now() - virtual_start,
+        stage_cpu_seconds=totals,
+        peak_rss_bytes=peak_rss_bytes(),
+    )
+
+
+def save_macro(path: Path, result: MacroResult) -> None:
+    """Write a macro result as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(result), indent=2) + '\n', 'utf-8')
+
+
+def load_macro(path: Path) -> MacroResult:
+    """Read a macro result written by save_macro."""
+    return MacroResult(**json.loads(path.read_text(encoding='utf-8')))
+
+
+def compare_macro(
+    result: MacroResult, baseline: MacroResult, threshold: float
+) -> list[str]:
+    """
+    Find regressions of a macro run against the baseline.
+
+    CPU time per iteration may not grow, and projected resets per hour
+    may not drop, by more than ``threshold`` percent. Peak RSS is
+    reported only, as it depends on everything else the process did.
+
+    Returns:
+        One message per regression (empty if none).
+    """
+    regressions = []
+    limit = threshold / 100
+    cpu_change = result.cpu_ms_per_iteration / baseline.cpu_ms_per_iteration
+    if cpu_change - 1 > limit:
+        regressions.append(
+            f'macro: cpu per iteration {cpu_change - 1:+.1%} '
+            f'({baseline.cpu_ms_per_iteration:.2f} -> '
+            f'{result.cpu_ms_per_iteration:.2f} ms)'
+        )
+    rate_change = (
+        result.projected_resets_per_hour / baseline.projected_resets_per_hour
+    )
+    if 1 - rate_change > limit:
+        regressions.append(
+            f'macro: projected resets/hour {rate_change - 1:+.1%} '
+            f'({baseline.projected_resets_per_hour:,.1f} -> '
+            f'{result.projected_resets_per_hour:,.1f})'
+        )
+    return regressions
@@ -0,0 +1,226 @@
+"""
+Micro-benchmarks for the scanning hot path, logging and log parsing.
+
+Every benchmark runs on fixed, seeded synthetic inputs at the sizes of
+the 1080p profile ROIs, so results are comparable across runs and
+machines with the same hardware. Screen capture is measured on the
+headless simulator since the real screen is not available everywhere.
+"""
+
+import logging
+import queue
+import tempfile
+from logging.handlers import QueueListener
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+import balatro
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.config import JsonConfigRepository
+from balatro.adapters.log_queue import DeferredQueueHandler
+from balatro.adapters.matcher import TemplateMatcher
+from balatro.adapters.simulated_game import (
+    SimulatedGame,
+    SimulatedInputAdapter,
+    SimulatedScreenAdapter,
+)
+from balatro.adapters.synthetic import (
+    GeneratorSettings,
+    SyntheticFrameGenerator,
+)
+from balatro.domain.model import ProfileConfig, Region
+from balatro.service_layer.analytics import AnalyticsService
+from balatro.service_layer.scanning import ScanService
+
+PACKAGE_DIR = Path(balatro.__file__).parent
+ASSETS_DIR = PACKAGE_DIR / 'assets'
+
+Setup = Callable[[], Callable[[], object]]
+
+
+def load_profile() -> ProfileConfig:
+    """Load the 1080p profile shipped with the package."""
+    return JsonConfigRepository(PACKAGE_DIR / 'config.json').load_profile(
+        '1080p'
+    )
+
+
+def roi_frame(region: Region, asset_name: str, seed: int) -> np.ndarray:
+    """Synthetic capture of a ROI containing one asset."""
+    settings = GeneratorSettings(
+        width=region.width,
+        height=region.height,
+        assets=(asset_name,),
+        instances=(1, 1),
+        noise=3.0,
+    )
+    return SyntheticFrameGenerator(ASSETS_DIR, settings, seed).generate().image
+
+
+def simulated_adapters() -> tuple[SimulatedGame, ScanService]:
+    """Simulated game showing a charm in both slots, and a scanner."""
+    profile = load_profile()
+    clock = VirtualClock()
+    game = SimulatedGame(
+        profile, ASSETS_DIR, clock, seed=0, charm_probability=1.0
+    )
+    scanner = ScanService(
+        SimulatedScreenAdapter(game),
+        SimulatedInputAdapter(game),
+        profile,
+        clock,
+    )
+    return game, scanner
+
+
+def bench_match_charm_slot() -> Callable[[], object]:
+    """match_template for charm.png on a blind slot ROI."""
+    matcher = TemplateMatcher(ASSETS_DIR)
+    haystack = roi_frame(
+        load_profile().get_rois('skip_slots_1')[0], 'charm.png', 1
+    )
+    return lambda: matcher.match_template(haystack, 'charm.png', slot=1)
+
+
+def bench_match_soul_card() -> Callable[[], object]:
+    """match_template for the_soul.png on a card ROI."""
+    matcher = TemplateMatcher(ASSETS_DIR)
+    haystack = roi_frame(
+        load_profile().get_rois('the_soul')[0], 'the_soul.png', 2
+    )
+    return lambda: matcher.match_template(haystack, 'the_soul.png', slot=1)
+
+
+def bench_match_dedup_dense() -> Callable[[], object]:
+    """match_template with many candidates, dominated by deduplication."""
+    matcher = TemplateMatcher(ASSETS_DIR)
+    template = matcher.load_asset('charm.png')
+    rng = np.random.default_rng(3)
+    haystack = np.tile(template, (2, 4, 1)).astype(np.int16)
+    haystack += rng.integers(-20, 20, haystack.shape, dtype=np.int16)
+    haystack = np.clip(haystack, 0, 255).astype(np.uint8)
+    return lambda: matcher.match_template(
+        haystack, 'charm.png', confidence_threshold=0.3
+    )
+
+
+def bench_capture_slot() -> Callable[[], object]:
+    """capture_region of a blind slot ROI on the simulated screen."""
+    game, scanner = simulated_adapters()
+    roi = scanner.profile.get_rois('skip_slots_1')[0]
+    return lambda: scanner.screen.capture_region(roi)
+
+
+def bench_scan_slots_for_tags() -> Callable[[], object]:
+    """ScanService.scan_slots_for_tags on the simulated screen."""
+    _, scanner = simulated_adapters()
+    return scanner.scan_slots_for_tags
+
+
+def iteration_logger(name: str) -> logging.Logger:
+    """Logger writing the session log format to a temporary file."""
+    # Flushed after every record like the session log's FileHandler
+    handler = logging.StreamHandler(tempfile.TemporaryFile('w'))
+    handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    )
+    log = logging.getLogger(f'benchmarks.{name}')
+    log.handlers = [handler]
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return log
+
+
+def log_iteration(log: logging.Logger) -> None:
+    """The lines a farming iteration with a decision logs."""
+    # The benchmark runner disables INFO logging for the other benchmarks
+    previous = logging.root.manager.disable
+    logging.disable(logging.NOTSET)
+    try:
+        log_lines(log)
+    finally:
+        logging.disable(previous)
+
+
+def log_lines(log: logging.Logger) -> None:
+    log.info(
+        'Found %s | Slot %s | Conf: %.2f | Pos: (%s, %s)',
+        'charm.png',
+        1,
+        0.97,
+        691,
+        860,
+    )
+    log.info('SCAN_RESULT: detected %s', 'Charm(Slot1)')
+    log.info('DECISION: %s', 'Skip for charm (slot 1)')
+    log.info('ACTION: %s', 'skip_slot_1')
+    log.info('ACTION: New Game Started')
+    log.info('TIMING: saved %.2fs this reset (avg %.2fs)', 0.42, 0.4)
+    log.debug('TIMELINE: run %d took %.2fs', 12, 3.1)
+
+
+def bench_log_iteration_sync() -> Callable[[], object]:
+    """Logging one iteration straight to a file handler."""
+    log = iteration_logger('sync')
+    return lambda: log_iteration(log)
+
+
+def bench_log_iteration_queue() -> Callable[[], object]:
+    """Logging one iteration through the queue handler."""
+    log = iteration_logger('queue')
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, *log.handlers)
+    log.handlers = [DeferredQueueHandler(records)]
+    # Daemon thread, drains the queue for the rest of the process
+    listener.start()
+    return lambda: log_iteration(log)
+
+
+def synthetic_log(lines: int, seed: int = 0) -> str:
+    """Representative farming log with the given number of lines."""
+    rng = np.random.default_rng(seed)
+    messages = [
+        'ACTION: New Game Started',
+        'ACTION: skip_slot_1',
+        'SCAN_RESULT: detected Charm(Slot1)',
+        'DECISION: Skip for charm (slot 1)',
+        'DECISION: Skip for charm (slot 2)',
+        'DECISION: Skip for double and charm',
+        'Found charm.png | Slot 1 | Conf: 0.97 | Pos: (691, 860)',
+        'Selecting SOUL card at (700, 770)',
+        'TIMING: saved 0.42s this reset (avg 0.40s)',
+    ]
+    weights = np.array([30, 20, 10, 5, 5, 2, 25, 1, 2], dtype=float)
+    picks = rng.choice(len(messages), lines, p=weights / weights.sum())
+    output = []
+    for i, pick in enumerate(picks):
+        seconds = i * 0.7
+        minutes, second = divmod(int(seconds), 60)
+        hour, minute = divmod(minutes, 60)
+        millis = int(seconds % 1 * 1000)
+        output.append(
+            f'2025-12-29 {hour % 24:02d}:{minute:02d}:{second:02d},'
+            f'{millis:03d} - INFO - {messages[pick]}'
+        )
+    return '\n'.join(output) + '\n'
+
+
+def bench_parse_log() -> Callable[[], object]:
+    """AnalyticsService.parse_log on a 10,000 line log."""
+    service = AnalyticsService()
+    text = synthetic_log(10_000)
+    return lambda: service.parse_log(text)
+
+
+MICRO_BENCHMARKS: dict[str, Setup] = {
+    'match_template.charm_slot': bench_match_charm_slot,
+    'match_template.soul_card': bench_match_soul_card,
+    'match_template.dedup_dense': bench_match_dedup_dense,
+    'capture_region.slot_roi': bench_capture_slot,
+    'scan_slots_for_tags': bench_scan_slots_for_tags,
+    'log_iteration.sync': bench_log_iteration_sync,
+    'log_iteration.queue': bench_log_iteration_queue,
+    'parse_log.10k_lines': bench_parse_log,
+}
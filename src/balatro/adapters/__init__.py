@@ -1,16 +1,47 @@
 # Adapters layer - external I/O abstractions
+from .clock import SystemClock, VirtualClock
 from .config import JsonConfigRepository
+from .event_log import JsonlEventLog, NullEventLog
+from .file_cache import JsonFileCache
 from .input import DirectInputAdapter
-from .ports import AbstractConfigPort, AbstractInputPort, AbstractScreenPort
+from .log_index import SqliteLogIndex
+from .log_tail import LogTailer
+from .matcher import TemplateMatcher
+from .ports import (
+    AbstractClockPort,
+    AbstractConfigPort,
+    AbstractEventPort,
+    AbstractInputPort,
+    AbstractScreenPort,
+)
 from .screen import PyAutoGuiScreenAdapter
+from .simulated_game import (
+    SimulatedGame,
+    SimulatedInputAdapter,
+    SimulatedScreenAdapter,
+)
 
 __all__ = [
     # Ports (interfaces)
     'AbstractScreenPort',
     'AbstractInputPort',
     'AbstractConfigPort',
+    'AbstractClockPort',
+    'AbstractEventPort',
     # Real implementations
     'PyAutoGuiScreenAdapter',
     'DirectInputAdapter',
     'JsonConfigRepository',
+    'SystemClock',
+    'VirtualClock',
+    'TemplateMatcher',
+    'LogTailer',
+    'JsonFileCache',
+    'SqliteLogIndex',
+    'JsonlEventLog',
+    'NullEventLog',
+    # Headless simulation
+    'SimulatedGame',
+    'SimulatedScreenAdapter',
+    'SimulatedInputAdapter',
 ]
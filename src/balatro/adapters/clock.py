@@ -0,0 +1,105 @@
+"""
+Clock adapter implementations.
+
+SystemClock waits in real time; VirtualClock advances instantly so
+simulations and tests can run thousands of iterations in seconds.
+"""
+
+import threading
+import time
+
+
+class SystemClock:
+    """
+    Clock adapter backed by the system monotonic clock.
+    """
+
+    def now(self) -> float:
+        """Get the current monotonic time in seconds."""
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Block for the given duration.
+
+        Args:
+            seconds: Duration to wait.
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Block until the event is set or the timeout elapses.
+
+        Args:
+            event: Event that cuts the wait short when set.
+            timeout: Maximum duration to wait, in seconds.
+
+        Returns:
+            True if the event was set, False on timeout.
+        """
+        return event.wait(max(timeout, 0.0))
+
+
+class VirtualClock:
+    """
+    Simulated clock where sleeping advances time without blocking.
+
+    Records how much simulated time was spent waiting so timing
+    statistics stay accurate without any wall time passing.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize the virtual clock.
+
+        Args:
+            start: Initial simulated time in seconds.
+        """
+        self._now = start
+        self.total_slept = 0.0
+        self.sleep_calls = 0
+
+    def now(self) -> float:
+        """Get the current simulated time in seconds."""
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Advance simulated time by the given duration instantly.
+
+        Args:
+            seconds: Duration to wait.
+        """
+        if seconds > 0:
+            self._now += seconds
+            self.total_slept += seconds
+        self.sleep_calls += 1
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Advance simulated time by the timeout unless the event is set.
+
+        Args:
+            event: Event that cuts the wait short when set.
+            timeout: Maximum duration to wait, in seconds.
+
+        Returns:
+            True if the event was set, False on timeout.
+        """
+        if event.is_set():
+            return True
+        self.sleep(timeout)
+        return event.is_set()
+
+    def advance(self, seconds: float) -> None:
+        """
+        Advance simulated time without counting it as a wait.
+
+        Used by simulated adapters to model the cost of work.
+
+        Args:
+            seconds: Duration of the simulated work.
+        """
+        self._now += seconds
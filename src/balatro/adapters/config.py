@@ -145,11 +145,18 @@ class JsonConfigRepository:
         # Parse ROIs
         rois = _parse_rois(profile_data.get('rois', {}))
 
+        # Parse learned delays
+        delays = {
+            name: float(value)
+            for name, value in profile_data.get('delays', {}).items()
+        }
+
         return ProfileConfig(
             name=profile_name,
             description=profile_data.get('desc', ''),
             actions=actions,
             rois=rois,
+            delays=delays,
         )
 
     def save_profile(self, config: ProfileConfig) -> None:
@@ -175,11 +182,13 @@ class JsonConfigRepository:
                     [r.left, r.top, r.width, r.height] for r in regions
                 ]
 
-        profile_data = {
+        profile_data: dict[str, Any] = {
             'desc': config.description,
             'actions': actions_data,
             'rois': rois_data,
         }
+        if config.delays:
+            profile_data['delays'] = dict(config.delays)
 
         self._config.setdefault('profiles', {})[config.name] = profile_data
 
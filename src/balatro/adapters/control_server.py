@@ -0,0 +1,74 @@
+"""
+Local control and metrics server for a farming service.
+
+Speaks a line-based protocol over TCP: each request line is one of
+``start``, ``pause``, ``stop`` or ``metrics`` and each reply is a single
+JSON line. Binds to localhost by default.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+class ControllableService(Protocol):
+    """Control surface exposed by AsyncFarmingService."""
+
+    def start(self) -> None: ...
+
+    def pause(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def metrics(self) -> dict[str, object]: ...
+
+
+async def serve_control(
+    service: ControllableService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> asyncio.Server:
+    """
+    Start the control server for a farming service.
+
+    Args:
+        service: The farming service to control.
+        host: Interface to bind to.
+        port: TCP port (0 picks a free port).
+
+    Returns:
+        The running asyncio server.
+    """
+    commands = {
+        'start': service.start,
+        'pause': service.pause,
+        'stop': service.stop,
+    }
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                command = line.decode('utf-8').strip().lower()
+                if command in commands:
+                    commands[command]()
+                    reply = {'ok': True, 'command': command}
+                elif command == 'metrics':
+                    reply = {'ok': True, 'metrics': service.metrics()}
+                else:
+                    reply = {'ok': False, 'error': f'unknown: {command}'}
+                writer.write(json.dumps(reply).encode('utf-8') + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(f'Control server listening on {host}:{port}')
+    return server
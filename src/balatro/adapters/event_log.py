@@ -0,0 +1,94 @@
+"""
+Append-only event log in JSON Lines format.
+
+One compact JSON object per line. Events are buffered and flushed in
+batches: every FLUSH_EVERY events, once FLUSH_INTERVAL seconds passed,
+on flush() and on close(), so a crash loses at most the last batch.
+Readers skip a torn last line.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, TextIO
+
+from ..domain.events import DomainEvent, event_from_dict
+
+
+class JsonlEventLog:
+    """
+    Event adapter appending events to a ``.jsonl`` file.
+    """
+
+    FLUSH_EVERY = 256
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, path: Path, now: Callable[[], float] = time.monotonic):
+        """
+        Open the event file for appending.
+
+        Args:
+            path: Event file, created if missing.
+            now: Monotonic time source timing the flushes.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open('a', encoding='utf-8')
+        self._now = now
+        self._pending = 0
+        self._flushed_at = now()
+
+    def emit(self, event: DomainEvent) -> None:
+        """Append one event, flushing if the batch is due."""
+        record = {'type': event.TYPE, **asdict(event)}
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._pending += 1
+        if (
+            self._pending >= self.FLUSH_EVERY
+            or self._now() - self._flushed_at >= self.FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered events to the file."""
+        self._file.flush()
+        self._pending = 0
+        self._flushed_at = self._now()
+
+    def close(self) -> None:
+        """Close the event file."""
+        self._file.close()
+
+
+class NullEventLog:
+    """
+    Event adapter discarding all events.
+    """
+
+    def emit(self, event: DomainEvent) -> None:
+        """Discard the event."""
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+
+def read_events(stream: TextIO) -> Iterator[DomainEvent]:
+    """
+    Read events written by JsonlEventLog.
+
+    Unknown event types and a torn (unterminated) last line are skipped.
+
+    Args:
+        stream: Open event file.
+
+    Yields:
+        The recorded events in order.
+    """
+    for line in stream:
+        if not line.endswith('\n'):
+            break
+        event = event_from_dict(json.loads(line))
+        if event is not None:
+            yield event
@@ -0,0 +1,106 @@
+"""
+Async adapters running blocking ports in an executor.
+
+Screen capture, template matching and DirectInput calls block; these
+wrappers move them off the event loop so other coroutines keep running.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional
+
+import numpy as np
+
+from ..domain.model import Coordinates, Region, ScanResult
+from .ports import AbstractInputPort, AbstractScreenPort
+
+
+class ExecutorScreenAdapter:
+    """
+    Async screen adapter delegating to a blocking screen port.
+    """
+
+    def __init__(
+        self, screen: AbstractScreenPort, executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            screen: Blocking screen adapter to wrap.
+            executor: Executor to run calls in (defaults to the loop's).
+        """
+        self.screen = screen
+        self.executor = executor
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(func, *args, **kwargs)
+        )
+
+    async def capture_region(
+        self, region: Optional[Region] = None
+    ) -> np.ndarray:
+        """Capture a region in the executor."""
+        return await self._run(self.screen.capture_region, region)
+
+    async def match_template(
+        self,
+        haystack: np.ndarray,
+        asset_name: str,
+        confidence_threshold: Optional[float] = None,
+        slot: int = 0,
+        region_offset: Optional[Coordinates] = None,
+    ) -> list[ScanResult]:
+        """Match a template in the executor."""
+        kwargs = {'slot': slot, 'region_offset': region_offset}
+        if confidence_threshold is not None:
+            kwargs['confidence_threshold'] = confidence_threshold
+        return await self._run(
+            self.screen.match_template, haystack, asset_name, **kwargs
+        )
+
+
+class ExecutorInputAdapter:
+    """
+    Async input adapter delegating to a blocking input port.
+
+    Calls are serialized so clicks never interleave.
+    """
+
+    def __init__(
+        self,
+        input_adapter: AbstractInputPort,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            input_adapter: Blocking input adapter to wrap.
+            executor: Executor to run calls in (defaults to the loop's).
+        """
+        self.input = input_adapter
+        self.executor = executor
+        self._lock = asyncio.Lock()
+
+    async def _run(self, func, *args):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, partial(func, *args)
+            )
+
+    async def click(self, coords: Coordinates) -> None:
+        """Click in the executor."""
+        await self._run(self.input.click, coords)
+
+    async def move_to(self, coords: Coordinates) -> None:
+        """Move the mouse in the executor."""
+        await self._run(self.input.move_to, coords)
+
+    async def press_key(self, key: str) -> None:
+        """Press a key in the executor."""
+        await self._run(self.input.press_key, key)
@@ -0,0 +1,87 @@
+"""
+Per-file result cache persisted as JSON.
+
+Entries are keyed by file path and valid only while the file's size and
+modification time are unchanged, so reprocessing only touches new or
+modified files.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+Signature = tuple[int, int]
+
+
+class JsonFileCache:
+    """
+    Cache of JSON-serializable results for files.
+    """
+
+    def __init__(self, cache_path: Path):
+        """
+        Initialize the cache, loading existing entries.
+
+        Args:
+            cache_path: JSON file the cache is stored in.
+        """
+        self.cache_path = cache_path
+        self._entries: dict[str, dict[str, Any]] = {}
+        if cache_path.exists():
+            try:
+                self._entries = json.loads(
+                    cache_path.read_text(encoding='utf-8')
+                )
+            except (OSError, ValueError):
+                logger.warning(f'Ignoring unreadable cache: {cache_path}')
+
+    @staticmethod
+    def signature(path: Path) -> Signature:
+        """Size and modification time identifying a file's content."""
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, path: Path, signature: Signature) -> Optional[Any]:
+        """
+        Cached result for a file, if its signature still matches.
+
+        Args:
+            path: File the result was computed from.
+            signature: Current signature of the file.
+        """
+        entry = self._entries.get(str(path))
+        if entry is None or tuple(entry['signature']) != signature:
+            return None
+        return entry['value']
+
+    def put(self, path: Path, signature: Signature, value: Any) -> None:
+        """
+        Store the result computed from a file.
+
+        Args:
+            path: File the result was computed from.
+            signature: Signature of the file before it was processed.
+            value: JSON-serializable result.
+        """
+        self._entries[str(path)] = {
+            'signature': list(signature),
+            'value': value,
+        }
+
+    def retain(self, paths: list[Path]) -> None:
+        """Drop entries of files not in the given list."""
+        keep = {str(path) for path in paths}
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if key in keep
+        }
+
+    def save(self) -> None:
+        """Write the cache atomically."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.cache_path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(self._entries), encoding='utf-8')
+        os.replace(temporary, self.cache_path)
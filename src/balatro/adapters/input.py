@@ -46,7 +46,7 @@ class DirectInputAdapter:
         """
         pydirectinput.moveTo(coords.x, coords.y)
         pydirectinput.click()
-        logger.debug(f'Clicked at ({coords.x}, {coords.y})')
+        logger.debug('Clicked at (%s, %s)', coords.x, coords.y)
 
     def move_to(self, coords: Coordinates) -> None:
         """
@@ -65,7 +65,7 @@ class DirectInputAdapter:
             key: Key name (e.g., 'esc', 'enter').
         """
         pydirectinput.press(key)
-        logger.debug(f'Pressed key: {key}')
+        logger.debug('Pressed key: %s', key)
 
     def register_hotkey(self, key: str, callback: Callable[[], None]) -> None:
         """
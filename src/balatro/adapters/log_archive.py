@@ -0,0 +1,113 @@
+"""
+Compressed session log storage.
+
+Finished session logs are compressed in place (``.log`` to ``.log.gz``
+or ``.log.zst``) keeping their modification time, and every reader
+opens them through open_log(), which decompresses while streaming.
+zstd needs Python 3.14's ``compression.zstd`` or the ``zstandard``
+package; gzip is always available.
+"""
+
+import gzip
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+LOG_SUFFIX = '.log'
+# Compressed log suffix -> module with a gzip-style open()
+COMPRESSORS = {'.gz': gzip, '.zst': zstd}
+
+
+def is_compressed(path: Path) -> bool:
+    """Whether a session log is stored compressed."""
+    return path.suffix in COMPRESSORS
+
+
+def session_name(path: Path) -> str:
+    """Log file name without its ``.log`` and compression suffixes."""
+    name = path.name
+    if is_compressed(path):
+        name = name[: -len(path.suffix)]
+    return name.removesuffix(LOG_SUFFIX)
+
+
+def _compressor(suffix: str):
+    module = COMPRESSORS[suffix]
+    if module is None:
+        raise ImportError(
+            'zstd logs need Python 3.14+ or the zstandard package. '
+            'Install with: pip install zstandard'
+        )
+    return module
+
+
+def open_log(path: Path) -> BinaryIO:
+    """
+    Open a session log for binary reading, decompressing if needed.
+
+    Raises:
+        ImportError: For ``.zst`` logs when no zstd module is available.
+    """
+    if is_compressed(path):
+        return _compressor(path.suffix).open(path, 'rb')
+    return path.open('rb')
+
+
+def find_logs(log_dir: Path) -> list[Path]:
+    """
+    Session logs in a directory, plain or compressed, sorted by name.
+
+    If compression was interrupted and both forms exist, the plain log
+    is returned.
+    """
+    logs: dict[str, Path] = {}
+    patterns = [f'*{LOG_SUFFIX}'] + [
+        f'*{LOG_SUFFIX}{suffix}' for suffix in COMPRESSORS
+    ]
+    for pattern in patterns:
+        for path in log_dir.glob(pattern):
+            logs.setdefault(session_name(path), path)
+    return sorted(logs.values())
+
+
+def compress_log(path: Path, suffix: str = '.gz') -> Path:
+    """
+    Compress a finished log and remove the original.
+
+    The compressed file is written under a temporary name and renamed,
+    so an interruption never leaves a truncated log behind.
+
+    Args:
+        path: Plain ``.log`` file.
+        suffix: '.gz' or '.zst'.
+
+    Returns:
+        Path of the compressed log.
+
+    Raises:
+        ImportError: For '.zst' when no zstd module is available.
+    """
+    module = _compressor(suffix)
+    target = path.with_name(path.name + suffix)
+    temporary = target.with_name(target.name + '.tmp')
+    with path.open('rb') as source, module.open(temporary, 'wb') as sink:
+        shutil.copyfileobj(source, sink, 1024 * 1024)
+    # Keep the mtime so newest-log and age checks are unchanged
+    shutil.copystat(path, temporary)
+    os.replace(temporary, target)
+    path.unlink()
+    return target
+
+
+def events_file_for(log_file: Path) -> Path:
+    """Event file written next to a session log."""
+    return log_file.with_name(session_name(log_file) + '.events.jsonl')
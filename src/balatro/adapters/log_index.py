@@ -0,0 +1,268 @@
+"""
+SQLite index of session logs.
+
+Stores one row per session with its running totals, one row per
+iteration (new game) and one per executed decision. Each session keeps
+the byte offset up to which its log was ingested, so indexing only
+reads what was appended since.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    byte_offset INTEGER NOT NULL DEFAULT 0,
+    profile TEXT,
+    delays TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    duration_seconds REAL NOT NULL DEFAULT 0,
+    lines INTEGER NOT NULL DEFAULT 0,
+    doubles INTEGER NOT NULL DEFAULT 0,
+    charms INTEGER NOT NULL DEFAULT 0,
+    souls INTEGER NOT NULL DEFAULT 0,
+    new_games INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS iterations (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    started TEXT,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE TABLE IF NOT EXISTS decisions (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    at TEXT,
+    decision TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decisions_session ON decisions(session_id);
+"""
+
+# Session columns souls/hour can be grouped by
+GROUPINGS = {
+    'profile': "COALESCE(profile, '?')",
+    'delays': "COALESCE(delays, '?')",
+    'week': "COALESCE(iso_week(start_time), '?')",
+}
+
+
+def _iso_week(stamp: Optional[str]) -> Optional[str]:
+    """ISO week ('YYYY-Www') of a log timestamp, for use in SQL."""
+    if stamp is None:
+        return None
+    year, week, _ = date.fromisoformat(stamp[:10]).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+@dataclass
+class SessionBatch:
+    """
+    Value object with what one ingestion pass read from a log.
+
+    Counters and rows cover only the new bytes; ``start`` and ``end``
+    are the session's first and last timestamp including this batch.
+    """
+
+    byte_offset: int
+    lines: int = 0
+    profile: Optional[str] = None
+    delays: Optional[str] = None
+    start: Optional[str] = None
+    end: Optional[str] = None
+    doubles: int = 0
+    charms: int = 0
+    souls: int = 0
+    # Start timestamp of every new game, in order
+    iterations: list[Optional[str]] = field(default_factory=list)
+    # (timestamp, decision) of every executed decision
+    decisions: list[tuple[Optional[str], str]] = field(default_factory=list)
+
+
+@dataclass
+class SessionRow:
+    """Value object with the indexed totals of one session."""
+
+    path: str
+    byte_offset: int
+    profile: Optional[str]
+    delays: Optional[str]
+    start: Optional[str]
+    end: Optional[str]
+    lines: int
+    doubles: int
+    charms: int
+    souls: int
+    new_games: int
+
+
+@dataclass
+class GroupRate:
+    """Value object with souls and resets per hour of a session group."""
+
+    key: str
+    sessions: int
+    hours: float
+    resets: int
+    souls: int
+
+    @property
+    def resets_per_hour(self) -> float:
+        return self.resets / self.hours if self.hours else 0.0
+
+    @property
+    def souls_per_hour(self) -> float:
+        return self.souls / self.hours if self.hours else 0.0
+
+
+class SqliteLogIndex:
+    """
+    Incrementally maintained SQLite index of session logs.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the index database.
+
+        Args:
+            db_path: SQLite database file, or ':memory:'.
+        """
+        if str(db_path) != ':memory:':
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(db_path))
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.create_function(
+            'iso_week', 1, _iso_week, deterministic=True
+        )
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def session(self, path: Path) -> Optional[SessionRow]:
+        """Indexed totals of a session log, if it was indexed."""
+        row = self.connection.execute(
+            'SELECT path, byte_offset, profile, delays, start_time,'
+            ' end_time, lines, doubles, charms, souls, new_games'
+            ' FROM sessions WHERE path = ?',
+            (str(path),),
+        ).fetchone()
+        return SessionRow(*row) if row else None
+
+    def byte_offset(self, path: Path) -> int:
+        """Offset up to which a log was ingested (0 if never)."""
+        session = self.session(path)
+        return session.byte_offset if session else 0
+
+    def forget(self, path: Path) -> None:
+        """Drop a session, e.g. because its log was truncated."""
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM sessions WHERE path = ?', (str(path),)
+            )
+
+    def rename(self, path: Path, new_path: Path) -> None:
+        """
+        Move a session to the new path of its log, e.g. compressed.
+
+        A session already stored under the new path is replaced: it is
+        a stale copy left by an interrupted compression.
+        """
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM sessions WHERE path = ? AND EXISTS '
+                '(SELECT 1 FROM sessions WHERE path = ?)',
+                (str(new_path), str(path)),
+            )
+            self.connection.execute(
+                'UPDATE sessions SET path = ? WHERE path = ?',
+                (str(new_path), str(path)),
+            )
+
+    def ingest(
+        self, path: Path, batch: SessionBatch, duration_seconds: float
+    ) -> None:
+        """
+        Add what was read past the stored offset, in one transaction.
+
+        Args:
+            path: Session log file.
+            batch: Totals and rows read from the new bytes.
+            duration_seconds: Session duration after this batch.
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO sessions (path) VALUES (?)'
+                ' ON CONFLICT(path) DO NOTHING',
+                (str(path),),
+            )
+            session_id, new_games = self.connection.execute(
+                'SELECT id, new_games FROM sessions WHERE path = ?',
+                (str(path),),
+            ).fetchone()
+            self.connection.execute(
+                'UPDATE sessions SET'
+                ' byte_offset = ?,'
+                ' profile = COALESCE(profile, ?),'
+                ' delays = COALESCE(delays, ?),'
+                ' start_time = ?,'
+                ' end_time = ?,'
+                ' duration_seconds = ?,'
+                ' lines = lines + ?,'
+                ' doubles = doubles + ?,'
+                ' charms = charms + ?,'
+                ' souls = souls + ?,'
+                ' new_games = new_games + ?'
+                ' WHERE id = ?',
+                (
+                    batch.byte_offset,
+                    batch.profile,
+                    batch.delays,
+                    batch.start,
+                    batch.end,
+                    duration_seconds,
+                    batch.lines,
+                    batch.doubles,
+                    batch.charms,
+                    batch.souls,
+                    len(batch.iterations),
+                    session_id,
+                ),
+            )
+            self.connection.executemany(
+                'INSERT INTO iterations (session_id, seq, started)'
+                ' VALUES (?, ?, ?)',
+                (
+                    (session_id, new_games + i, started)
+                    for i, started in enumerate(batch.iterations)
+                ),
+            )
+            self.connection.executemany(
+                'INSERT INTO decisions (session_id, at, decision)'
+                ' VALUES (?, ?, ?)',
+                ((session_id, at, kind) for at, kind in batch.decisions),
+            )
+
+    def rates(self, by: str) -> list[GroupRate]:
+        """
+        Souls and resets per hour of all sessions, grouped.
+
+        Args:
+            by: 'profile', 'week' or 'delays'.
+
+        Returns:
+            One entry per group, ordered by key.
+        """
+        key = GROUPINGS[by]
+        rows = self.connection.execute(
+            f'SELECT {key} AS grp, COUNT(*), SUM(duration_seconds) / 3600.0,'
+            ' SUM(new_games), SUM(souls)'
+            ' FROM sessions WHERE start_time IS NOT NULL'
+            ' GROUP BY grp ORDER BY grp'
+        ).fetchall()
+        return [GroupRate(*row) for row in rows]
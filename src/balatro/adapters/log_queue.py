@@ -0,0 +1,91 @@
+"""
+Queue-based logging off the farming hot path.
+
+Log calls only put the record on an in-memory queue; a listener thread
+formats it and writes it to the file and console handlers. Combined
+with lazy %-style arguments, a log call in the scan loop costs an
+enqueue, not string formatting and disk I/O. High-volume lines can be
+sampled before they are even enqueued.
+"""
+
+import itertools
+import logging
+import queue
+from collections.abc import Iterable
+from logging.handlers import QueueHandler, QueueListener
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats each record before enqueuing so it can
+    cross process boundaries; within one process the record can be passed
+    as is. Log arguments must therefore not be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every ``every`` records of a high-volume message.
+
+    Records are matched on their unformatted message template, so
+    sampled-out records are never formatted. Other records pass.
+    """
+
+    def __init__(self, prefix: str, every: int):
+        """
+        Initialize the filter.
+
+        Args:
+            prefix: Start of the message template to sample, e.g.
+                'Found '.
+            every: Keep the first and then every ``every``-th record.
+        """
+        super().__init__()
+        self.prefix = prefix
+        self.every = every
+        self._seen = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not str(record.msg).startswith(self.prefix):
+            return True
+        return next(self._seen) % self.every == 0
+
+
+def start_queue_logging(
+    handlers: Iterable[logging.Handler],
+    level: int = logging.INFO,
+    filters: Iterable[logging.Filter] = (),
+) -> QueueListener:
+    """
+    Route all logging through a queue to handlers on a listener thread.
+
+    Replaces the root logger's handlers. Stop the returned listener to
+    flush the remaining records before reading the log files.
+
+    Args:
+        handlers: Handlers that format and write records.
+        level: Root logger level.
+        filters: Filters applied before records are enqueued.
+
+    Returns:
+        The started listener.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(records)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,119 @@
+"""
+Log tailing adapter.
+
+Follows the newest session log in a directory, returning only the
+complete lines appended since the last poll. Partial lines are held
+back until their newline arrives, and the file is reopened when it is
+rotated (replaced) or truncated. A newer log appearing in the directory
+starts a new session.
+"""
+
+import fnmatch
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+
+class LogTailer:
+    """
+    Incremental reader of the current ``*.log`` file in a directory.
+
+    Each poll costs one directory scan and one ``stat``; only the
+    appended bytes are read.
+    """
+
+    def __init__(self, log_dir: Path, pattern: str = '*.log'):
+        """
+        Initialize the tailer.
+
+        Args:
+            log_dir: Directory the automation writes its logs to.
+            pattern: Glob selecting session logs.
+        """
+        self.log_dir = log_dir
+        self.pattern = pattern
+        self.path: Optional[Path] = None
+        self._file: Optional[BinaryIO] = None
+        self._identity: Optional[tuple[int, int]] = None
+        self._partial = b''
+
+    def latest_log(self) -> Optional[Path]:
+        """Newest session log by modification time, if any."""
+        newest = None
+        try:
+            entries = os.scandir(self.log_dir)
+        except FileNotFoundError:
+            return None
+        with entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, self.pattern):
+                    continue
+                try:
+                    key = (entry.stat().st_mtime, entry.name)
+                except FileNotFoundError:
+                    continue
+                if newest is None or key > newest:
+                    newest = key
+        return self.log_dir / newest[1] if newest else None
+
+    def poll(self) -> list[str]:
+        """
+        Read the complete lines appended since the last poll.
+
+        The returned lines always belong to ``path`` as it is after the
+        call. When a newer session log appears, the rest of the current
+        one is returned first and the switch happens on the next poll.
+
+        Returns:
+            Decoded lines including their trailing newline.
+        """
+        latest = self.latest_log()
+        if latest is None:
+            return []
+        if self._file is None:
+            self._open(latest)
+            return self._read()
+
+        lines = self._read()
+        if latest != self.path:
+            if lines:
+                return lines  # finish the previous session first
+            self._open(latest)
+            return self._read()
+
+        try:
+            stat = os.stat(latest)
+        except FileNotFoundError:
+            return lines
+        if (stat.st_dev, stat.st_ino) != self._identity or (
+            stat.st_size < self._file.tell()
+        ):
+            # Rotated or truncated in place: same session, fresh file
+            self._open(latest)
+            lines += self._read()
+        return lines
+
+    def close(self) -> None:
+        """Close the followed file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self, path: Path) -> None:
+        """Start following a file from its beginning."""
+        self.close()
+        self._file = path.open('rb')
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._partial = b''
+        self.path = path
+
+    def _read(self) -> list[str]:
+        """Read appended bytes and split off complete lines."""
+        data = self._file.read()
+        if not data:
+            return []
+        data = self._partial + data
+        end = data.rfind(b'\n') + 1
+        self._partial = data[end:]
+        return data[:end].decode('utf-8', 'replace').splitlines(keepends=True)
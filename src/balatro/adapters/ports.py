@@ -5,12 +5,14 @@ These protocols define the contracts that adapters must implement.
 Using protocols allows for easy testing with fakes and future flexibility.
 """
 
+import threading
 from abc import abstractmethod
 from pathlib import Path
 from typing import Callable, Optional, Protocol, runtime_checkable
 
 import numpy as np
 
+from ..domain.events import DomainEvent
 from ..domain.model import Coordinates, ProfileConfig, Region, ScanResult
 
 
@@ -127,6 +129,89 @@ class AbstractInputPort(Protocol):
         ...
 
 
+@runtime_checkable
+class AbstractAsyncScreenPort(Protocol):
+    """
+    Async port for screen capture and image matching operations.
+    """
+
+    @abstractmethod
+    async def capture_region(
+        self, region: Optional[Region] = None
+    ) -> np.ndarray:
+        """
+        Capture a screenshot of the screen or a specific region.
+
+        Args:
+            region: Optional region to capture. None captures full screen.
+
+        Returns:
+            NumPy array of the captured image in BGR format.
+        """
+        ...
+
+    @abstractmethod
+    async def match_template(
+        self,
+        haystack: np.ndarray,
+        asset_name: str,
+        confidence_threshold: Optional[float] = None,
+        slot: int = 0,
+        region_offset: Optional[Coordinates] = None,
+    ) -> list[ScanResult]:
+        """
+        Find occurrences of an asset template in the haystack image.
+
+        Args:
+            haystack: The image to search in (BGR format).
+            asset_name: Name of the asset file to search for.
+            confidence_threshold: Minimum confidence for a match.
+            slot: Slot number to assign to found matches.
+            region_offset: Offset to add to coordinates (for ROI scanning).
+
+        Returns:
+            List of ScanResult objects for each match found.
+        """
+        ...
+
+
+@runtime_checkable
+class AbstractAsyncInputPort(Protocol):
+    """
+    Async port for mouse and keyboard input operations.
+    """
+
+    @abstractmethod
+    async def click(self, coords: Coordinates) -> None:
+        """
+        Move to coordinates and click.
+
+        Args:
+            coords: Screen coordinates to click.
+        """
+        ...
+
+    @abstractmethod
+    async def move_to(self, coords: Coordinates) -> None:
+        """
+        Move mouse to coordinates.
+
+        Args:
+            coords: Screen coordinates to move to.
+        """
+        ...
+
+    @abstractmethod
+    async def press_key(self, key: str) -> None:
+        """
+        Press and release a keyboard key.
+
+        Args:
+            key: Key name (e.g., 'esc', 'enter').
+        """
+        ...
+
+
 @runtime_checkable
 class AbstractConfigPort(Protocol):
     """
@@ -170,6 +255,42 @@ class AbstractConfigPort(Protocol):
         ...
 
 
+@runtime_checkable
+class AbstractClockPort(Protocol):
+    """
+    Port for reading time and waiting.
+    """
+
+    @abstractmethod
+    def now(self) -> float:
+        """Get the current monotonic time in seconds."""
+        ...
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """
+        Block for the given duration.
+
+        Args:
+            seconds: Duration to wait.
+        """
+        ...
+
+    @abstractmethod
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Block until the event is set or the timeout elapses.
+
+        Args:
+            event: Event that cuts the wait short when set.
+            timeout: Maximum duration to wait, in seconds.
+
+        Returns:
+            True if the event was set, False on timeout.
+        """
+        ...
+
+
 @runtime_checkable
 class AbstractLogPort(Protocol):
     """
@@ -185,3 +306,44 @@ class AbstractLogPort(Protocol):
     def read_log(self) -> str:
         """Read the contents of the current log file."""
         ...
+
+
+@runtime_checkable
+class AbstractLogTailPort(Protocol):
+    """
+    Port for following a growing log file.
+    """
+
+    path: Optional[Path]
+
+    @abstractmethod
+    def poll(self) -> list[str]:
+        """
+        Read the complete lines appended since the last poll.
+
+        Returns:
+            New lines, all belonging to ``path`` after the call.
+        """
+        ...
+
+
+@runtime_checkable
+class AbstractEventPort(Protocol):
+    """
+    Port for recording domain events.
+    """
+
+    @abstractmethod
+    def emit(self, event: DomainEvent) -> None:
+        """
+        Record an event.
+
+        Args:
+            event: The event that happened.
+        """
+        ...
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Make the events recorded so far durable."""
+        ...
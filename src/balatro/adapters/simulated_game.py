@@ -0,0 +1,478 @@
+"""
+Headless simulation of the Balatro screens used by the automation.
+
+SimulatedGame is a small state machine (blind selection, booster pack,
+options menu, new-run confirmation) that renders synthetic frames by
+compositing the real assets at the profile ROIs and reacts to clicks at
+the profile's action coordinates. The screen and input adapters expose
+it through the regular ports so FarmingService runs end-to-end without a
+display. Input latency and transition animations are simulated against
+the injected clock; clicks landing during an animation are dropped, like
+in the real game.
+"""
+
+import logging
+from enum import Enum, auto
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..domain.model import Coordinates, ProfileConfig, Region
+from .matcher import TemplateMatcher
+from .ports import AbstractClockPort
+
+logger = logging.getLogger(__name__)
+
+
+class GamePhase(Enum):
+    """Screen the simulated game is showing."""
+
+    BLIND_SELECT = auto()
+    PACK = auto()
+    MENU = auto()
+    CONFIRM_NEW_RUN = auto()
+
+
+class SimulatedGame:
+    """
+    Simulated game state, input handling and frame rendering.
+
+    Tags are drawn per run: each slot shows a double tag, a charm tag or
+    one of several distractor tags. Skipping a charm opens a pack of
+    3-5 cards that contains The Soul with probability soul_per_pack; a
+    preceding double tag opens the pack twice.
+    """
+
+    # Maximum distance in pixels between a click and an action's coords
+    CLICK_TOLERANCE = 30
+
+    # Pixels a selected card is raised by
+    SELECTED_OFFSET = 8
+
+    # Distractor tag designs drawn for slots without double or charm
+    DISTRACTOR_TAGS = 12
+
+    def __init__(
+        self,
+        profile: ProfileConfig,
+        assets_dir: Path,
+        clock: AbstractClockPort,
+        *,
+        seed: Optional[int] = None,
+        double_probability: float = 0.1,
+        charm_probability: float = 0.1,
+        soul_per_pack: float = 0.05,
+        latency: float = 0.02,
+        animation: float = 0.1,
+        screen_size: tuple[int, int] = (1920, 1080),
+    ):
+        """
+        Initialize the simulated game and start the first run.
+
+        Args:
+            profile: Resolution profile providing ROIs and action coords.
+            assets_dir: Directory containing the image assets.
+            clock: Clock shared with the automation under test.
+            seed: Seed for reproducible tag draws and packs.
+            double_probability: Chance of a double tag in slot 1.
+            charm_probability: Chance of a charm tag in each slot.
+            soul_per_pack: Chance that a pack contains The Soul.
+            latency: Seconds between an input and its effect.
+            animation: Seconds a transition animates after taking effect.
+            screen_size: Screen (width, height) in pixels.
+        """
+        self.profile = profile
+        self.assets = TemplateMatcher(assets_dir)
+        self.clock = clock
+        self.rng = np.random.default_rng(seed)
+        self.double_probability = double_probability
+        self.charm_probability = charm_probability
+        self.soul_per_pack = soul_per_pack
+        self.latency = latency
+        self.animation = animation
+        self.width, self.height = screen_size
+
+        self.phase = GamePhase.BLIND_SELECT
+        self._menu_return = GamePhase.BLIND_SELECT
+        self.slot_tags: list[str] = []
+        self.slot_skipped = [False, False]
+        self.slot_tints: list[np.ndarray] = []
+        self.pending_doubles = 0
+        self.pending_packs = 0
+        self.pack_cards: list[Optional[np.ndarray]] = []
+        self.soul_card: Optional[int] = None
+        self.selected_card: Optional[int] = None
+        self.cursor = Coordinates(0, 0)
+
+        self.runs = 0
+        self.packs_opened = 0
+        self.souls_offered = 0
+        self.souls_obtained = 0
+        self.dropped_clicks = 0
+
+        self._events: list[tuple[float, Callable[[], None]]] = []
+        self._frame: Optional[np.ndarray] = None
+        self._animating_from = float('-inf')
+        self._busy_until = float('-inf')
+        self._background = self._make_background()
+        self._tag_images = {
+            'double': self.assets.load_asset('double.png'),
+            'charm': self.assets.load_asset('charm.png'),
+        }
+        self._soul_image = self.assets.load_asset('the_soul.png')
+        self._start_run()
+
+    # --- Input ---------------------------------------------------------
+
+    def click(self, coords: Coordinates) -> None:
+        """Handle a click; it takes effect after the input latency."""
+        self._advance()
+        now = self.clock.now()
+        if now < self._busy_until:
+            self.dropped_clicks += 1
+            logger.debug(f'SIM: click at {coords.to_tuple()} dropped')
+            return
+
+        effect = self._click_effect(coords)
+        if effect is not None:
+            self._schedule(effect)
+
+    def press_key(self, key: str) -> None:
+        """Handle a key press; only Escape has an effect."""
+        self._advance()
+        if key != 'esc' or self.clock.now() < self._busy_until:
+            return
+
+        def toggle_menu() -> None:
+            if self.phase in (GamePhase.MENU, GamePhase.CONFIRM_NEW_RUN):
+                self.phase = self._menu_return
+            else:
+                self._menu_return = self.phase
+                self.phase = GamePhase.MENU
+
+        self._schedule(toggle_menu)
+
+    def _click_effect(
+        self, coords: Coordinates
+    ) -> Optional[Callable[[], None]]:
+        """Get the state change a click at the given position triggers."""
+        buttons = {
+            GamePhase.BLIND_SELECT: [
+                ('skip_slot_1', lambda: self._skip_slot(0)),
+                ('skip_slot_2', lambda: self._skip_slot(1)),
+            ],
+            GamePhase.PACK: [('package_specialized_skip', self._close_pack)],
+            GamePhase.MENU: [('new_game_top', self._confirm_new_run)],
+            GamePhase.CONFIRM_NEW_RUN: [('new_game_confirm', self._start_run)],
+        }
+        for action_name, effect in buttons[self.phase]:
+            if self._is_action(coords, action_name):
+                return effect
+
+        if self.phase == GamePhase.PACK:
+            return self._pack_click_effect(coords)
+        return None
+
+    def _pack_click_effect(
+        self, coords: Coordinates
+    ) -> Optional[Callable[[], None]]:
+        """Get the effect of clicking a card or its Use button."""
+        for index, roi in enumerate(self._card_rois()):
+            if not roi.left <= coords.x < roi.left + roi.width:
+                continue
+            if self.pack_cards[index] is None:
+                return None
+
+            use_button_top = roi.top + roi.height * 3 // 4
+            if self.selected_card == index and coords.y >= use_button_top:
+                return lambda i=index: self._use_card(i)
+            if roi.contains(coords):
+                return lambda i=index: self._toggle_card(i)
+        return None
+
+    def _is_action(self, coords: Coordinates, action_name: str) -> bool:
+        """Check whether a click lands on a profile action."""
+        target = self.profile.get_action(action_name)
+        return target is not None and (
+            abs(coords.x - target.x) <= self.CLICK_TOLERANCE
+            and abs(coords.y - target.y) <= self.CLICK_TOLERANCE
+        )
+
+    # --- State machine -------------------------------------------------
+
+    def _schedule(self, effect: Callable[[], None]) -> None:
+        """Apply an effect after the latency and animate it."""
+        at = self.clock.now() + self.latency
+        self._events.append((at, effect))
+        self._busy_until = at + self.animation
+
+    def _advance(self) -> None:
+        """Apply scheduled effects that are due."""
+        now = self.clock.now()
+        due = [event for event in self._events if event[0] <= now]
+        if not due:
+            return
+        self._events = [event for event in self._events if event[0] > now]
+        for at, effect in due:
+            effect()
+            self._animating_from = at
+        self._frame = None
+
+    def _confirm_new_run(self) -> None:
+        """Ask for confirmation before abandoning the run."""
+        self.phase = GamePhase.CONFIRM_NEW_RUN
+
+    def _start_run(self) -> None:
+        """Start a new run with freshly drawn tags."""
+        self.runs += 1
+        self.phase = GamePhase.BLIND_SELECT
+        self.slot_tags = [self._draw_tag(1), self._draw_tag(2)]
+        self.slot_skipped = [False, False]
+        self.slot_tints = [
+            self.rng.integers(40, 200, 3).astype(np.uint8) for _ in range(2)
+        ]
+        self.pending_doubles = 0
+        self.pending_packs = 0
+        self.pack_cards = []
+        self.soul_card = self.selected_card = None
+
+    def _draw_tag(self, slot: int) -> str:
+        """Draw the tag shown in a blind slot."""
+        roll = self.rng.random()
+        if slot == 1 and roll < self.double_probability:
+            return 'double'
+        if roll > 1 - self.charm_probability:
+            return 'charm'
+        return f'tag_{self.rng.integers(self.DISTRACTOR_TAGS)}'
+
+    def _skip_slot(self, index: int) -> None:
+        """Skip a blind and receive its tag."""
+        if self.slot_skipped[index] or (
+            index == 1 and not self.slot_skipped[0]
+        ):
+            return
+        self.slot_skipped[index] = True
+        tag = self.slot_tags[index]
+        copies = 1 + self.pending_doubles
+        self.pending_doubles = 0
+        if tag == 'double':
+            self.pending_doubles = copies
+        elif tag == 'charm':
+            self.pending_packs = copies - 1
+            self._open_pack()
+
+    def _open_pack(self) -> None:
+        """Open a pack with 3-5 cards, possibly including The Soul."""
+        self.phase = GamePhase.PACK
+        self.packs_opened += 1
+        size = int(self.rng.integers(3, 6))
+        self.pack_cards = [None] * len(self.profile.get_rois('the_soul'))
+        first = (len(self.pack_cards) - size) // 2
+        for index in range(first, first + size):
+            self.pack_cards[index] = self._card_image(index)
+
+        self.soul_card = None
+        if self.rng.random() < self.soul_per_pack:
+            self.soul_card = int(self.rng.integers(first, first + size))
+            self.pack_cards[self.soul_card] = self._soul_image
+            self.souls_offered += 1
+        self.selected_card = None
+
+    def _close_pack(self) -> None:
+        """Skip the pack, opening the next one if several are pending."""
+        if self.pending_packs:
+            self.pending_packs -= 1
+            self._open_pack()
+        else:
+            self.phase = GamePhase.BLIND_SELECT
+            self.pack_cards = []
+
+    def _toggle_card(self, index: int) -> None:
+        """Select a card, or deselect it if already selected."""
+        self.selected_card = None if self.selected_card == index else index
+
+    def _use_card(self, index: int) -> None:
+        """Use the selected card, removing it from the pack."""
+        if index == self.soul_card:
+            self.souls_obtained += 1
+            self.soul_card = None
+        self.pack_cards[index] = None
+        self.selected_card = None
+
+    # --- Rendering -----------------------------------------------------
+
+    def render(self, region: Optional[Region] = None) -> np.ndarray:
+        """
+        Render the current screen, or part of it.
+
+        Args:
+            region: Region to render (None for the full screen).
+
+        Returns:
+            The frame in BGR format.
+        """
+        self._advance()
+        if self._frame is None:
+            self._frame = self._compose()
+
+        frame = self._frame
+        if region is not None:
+            frame = frame[
+                region.top : region.top + region.height,
+                region.left : region.left + region.width,
+            ]
+
+        progress = (self.clock.now() - self._animating_from) / self.animation
+        if 0 <= progress < 1:
+            return (frame * (0.4 + 0.6 * progress)).astype(np.uint8)
+        return frame.copy()
+
+    def _compose(self) -> np.ndarray:
+        """Compose the full frame for the current state."""
+        frame = self._background.copy()
+
+        if self.phase == GamePhase.BLIND_SELECT:
+            self._draw_blinds(frame)
+        elif self.phase == GamePhase.PACK:
+            frame //= 2
+            self._draw_pack(frame)
+        else:
+            self._draw_blinds(frame)
+            frame //= 3
+            target = self.profile.get_action(
+                'new_game_top'
+                if self.phase == GamePhase.MENU
+                else 'new_game_confirm'
+            )
+            if target is not None:
+                button = Region(target.x - 150, target.y - 30, 300, 60)
+                self._fill(frame, button, 200)
+        return frame
+
+    def _draw_blinds(self, frame: np.ndarray) -> None:
+        """Draw both blind panels with their tags."""
+        for index in range(2):
+            rois = self.profile.get_rois(f'skip_slots_{index + 1}')
+            if not rois:
+                continue
+            panel = rois[0]
+            self._fill(frame, panel, self.slot_tints[index])
+            if self.slot_skipped[index]:
+                self._fill(frame, panel, self.slot_tints[index] // 3)
+                continue
+            tag = self._tag_image(self.slot_tags[index])
+            self._paste(frame, tag, panel)
+
+    def _draw_pack(self, frame: np.ndarray) -> None:
+        """Draw the cards of the open pack."""
+        for index, roi in enumerate(self._card_rois()):
+            card = self.pack_cards[index]
+            if card is None:
+                continue
+            raise_by = (
+                self.SELECTED_OFFSET if index == self.selected_card else 0
+            )
+            self._paste(frame, card, roi, raise_by)
+
+    def _card_rois(self) -> list[Region]:
+        """Card ROIs of the current pack layout."""
+        return self.profile.get_rois('the_soul')[: len(self.pack_cards)]
+
+    def _tag_image(self, tag: str) -> np.ndarray:
+        """Get the image of a tag, generating distractors on demand."""
+        if tag not in self._tag_images:
+            design = np.random.default_rng(int(tag.rsplit('_', 1)[1]))
+            base = design.integers(0, 256, 3)
+            noise = design.integers(-60, 60, (68, 68, 3))
+            self._tag_images[tag] = np.clip(base + noise, 0, 255).astype(
+                np.uint8
+            )
+        return self._tag_images[tag]
+
+    def _card_image(self, index: int) -> np.ndarray:
+        """Generate the face of an ordinary card."""
+        height, width = self._soul_image.shape[:2]
+        base = self.rng.integers(60, 200, 3)
+        noise = self.rng.integers(-70, 70, (height, width, 3))
+        return np.clip(base + noise, 0, 255).astype(np.uint8)
+
+    def _make_background(self) -> np.ndarray:
+        """Smooth vertical gradient, like the game's backdrop."""
+        rows = np.linspace(30, 70, self.height, dtype=np.float32)
+        column = np.stack([rows, rows * 0.6, rows * 0.4], axis=-1)
+        return np.ascontiguousarray(
+            np.broadcast_to(column[:, None, :], (self.height, self.width, 3)),
+            dtype=np.uint8,
+        )
+
+    @staticmethod
+    def _fill(frame: np.ndarray, region: Region, color) -> None:
+        """Fill a region of the frame with a color."""
+        frame[
+            region.top : region.top + region.height,
+            region.left : region.left + region.width,
+        ] = color
+
+    @staticmethod
+    def _paste(
+        frame: np.ndarray, image: np.ndarray, region: Region, raise_by: int = 0
+    ) -> None:
+        """Paste an image centered in a region, optionally raised."""
+        height, width = image.shape[:2]
+        top = region.top + (region.height - height) // 2 - raise_by
+        left = region.left + (region.width - width) // 2
+        frame[top : top + height, left : left + width] = image
+
+
+class SimulatedScreenAdapter(TemplateMatcher):
+    """
+    Screen port rendering frames from a SimulatedGame.
+
+    Matching is inherited from TemplateMatcher, exactly as on the real
+    screen.
+    """
+
+    def __init__(self, game: SimulatedGame):
+        """
+        Initialize the adapter.
+
+        Args:
+            game: The simulated game to capture.
+        """
+        super().__init__(game.assets.assets_dir)
+        self.game = game
+
+    def capture_region(self, region: Optional[Region] = None) -> np.ndarray:
+        """Capture the simulated screen or a region of it."""
+        return self.game.render(region)
+
+
+class SimulatedInputAdapter:
+    """Input port forwarding mouse and keyboard input to a SimulatedGame."""
+
+    def __init__(self, game: SimulatedGame):
+        """
+        Initialize the adapter.
+
+        Args:
+            game: The simulated game receiving input.
+        """
+        self.game = game
+        self.hotkeys: dict[str, Callable[[], None]] = {}
+
+    def click(self, coords: Coordinates) -> None:
+        self.game.cursor = coords
+        self.game.click(coords)
+
+    def move_to(self, coords: Coordinates) -> None:
+        self.game.cursor = coords
+
+    def press_key(self, key: str) -> None:
+        self.game.press_key(key)
+
+    def register_hotkey(self, key: str, callback: Callable[[], None]) -> None:
+        self.hotkeys[key] = callback
+
+    def unregister_all_hotkeys(self) -> None:
+        self.hotkeys.clear()
@@ -0,0 +1,343 @@
+"""
+Synthetic frame generation for matcher benchmarks and accuracy tests.
+
+Composites the real assets onto generated backgrounds at random
+positions, with controllable noise, scaling, color jitter, partial
+occlusion and distractor shapes, and records ground-truth labels.
+Frames can be written to and read from a compressed ``.npz`` corpus so
+benchmarks and accuracy checks are reproducible without screenshots.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from ..domain.model import Coordinates, ScanResult
+from .matcher import TemplateMatcher
+
+DEFAULT_ASSETS = ('charm.png', 'double.png', 'the_soul.png')
+
+
+@dataclass(frozen=True)
+class FrameLabel:
+    """Value object locating one composited asset in a frame."""
+
+    asset_name: str
+    position: Coordinates
+    width: int
+    height: int
+    scale: float = 1.0
+    occlusion: float = 0.0
+
+
+@dataclass
+class SyntheticFrame:
+    """A generated frame together with its ground truth."""
+
+    image: np.ndarray
+    labels: list[FrameLabel] = field(default_factory=list)
+
+
+@dataclass
+class GeneratorSettings:
+    """
+    Value object controlling the difficulty of generated frames.
+
+    Ranges are (low, high) and sampled uniformly per instance.
+    """
+
+    width: int = 1920
+    height: int = 1080
+    assets: tuple[str, ...] = DEFAULT_ASSETS
+    instances: tuple[int, int] = (1, 3)
+    noise: float = 0.0
+    scale: tuple[float, float] = (1.0, 1.0)
+    color_jitter: float = 0.0
+    occlusion: tuple[float, float] = (0.0, 0.0)
+    distractors: int = 0
+
+
+class SyntheticFrameGenerator:
+    """
+    Generates labelled frames from the real asset images.
+
+    Instances never overlap each other, so every label is recoverable
+    unless it is deliberately occluded.
+    """
+
+    # Placement attempts per instance before giving up on it
+    MAX_PLACEMENT_ATTEMPTS = 50
+
+    def __init__(
+        self,
+        assets_dir: Path,
+        settings: Optional[GeneratorSettings] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            assets_dir: Directory containing the image assets.
+            settings: Frame size and difficulty (defaults are clean).
+            seed: Seed for reproducible frames.
+        """
+        self.assets = TemplateMatcher(assets_dir)
+        self.settings = settings or GeneratorSettings()
+        self.rng = np.random.default_rng(seed)
+
+    def generate(self) -> SyntheticFrame:
+        """Generate one labelled frame."""
+        settings = self.settings
+        image = self._background()
+        occupied: list[tuple[int, int, int, int]] = []
+        labels = []
+
+        low, high = settings.instances
+        for _ in range(int(self.rng.integers(low, high + 1))):
+            asset_name = str(self.rng.choice(settings.assets))
+            label = self._place_asset(image, asset_name, occupied)
+            if label is not None:
+                labels.append(label)
+
+        for _ in range(settings.distractors):
+            self._place_distractor(image, occupied)
+
+        if settings.noise:
+            noise = self.rng.normal(0, settings.noise, image.shape)
+            image = np.clip(image + noise, 0, 255).astype(np.uint8)
+
+        return SyntheticFrame(image, labels)
+
+    def generate_many(self, count: int) -> list[SyntheticFrame]:
+        """Generate several labelled frames."""
+        return [self.generate() for _ in range(count)]
+
+    def _background(self) -> np.ndarray:
+        """Smooth two-color gradient background."""
+        settings = self.settings
+        top, bottom = self.rng.integers(20, 120, (2, 3))
+        rows = np.linspace(0.0, 1.0, settings.height)[:, None]
+        column = top + (bottom - top) * rows
+        return np.ascontiguousarray(
+            np.broadcast_to(
+                column[:, None, :], (settings.height, settings.width, 3)
+            ),
+            dtype=np.uint8,
+        )
+
+    def _free_spot(
+        self,
+        width: int,
+        height: int,
+        occupied: list[tuple[int, int, int, int]],
+    ) -> Optional[tuple[int, int]]:
+        """Find a top-left corner not overlapping occupied boxes."""
+        settings = self.settings
+        if width > settings.width or height > settings.height:
+            return None
+
+        for _ in range(self.MAX_PLACEMENT_ATTEMPTS):
+            left = int(self.rng.integers(0, settings.width - width + 1))
+            top = int(self.rng.integers(0, settings.height - height + 1))
+            if not any(
+                left < ol + ow
+                and ol < left + width
+                and top < ot + oh
+                and ot < top + height
+                for ol, ot, ow, oh in occupied
+            ):
+                occupied.append((left, top, width, height))
+                return left, top
+        return None
+
+    def _place_asset(
+        self,
+        image: np.ndarray,
+        asset_name: str,
+        occupied: list[tuple[int, int, int, int]],
+    ) -> Optional[FrameLabel]:
+        """Composite one transformed asset and return its label."""
+        settings = self.settings
+        template = self.assets.load_asset(asset_name)
+
+        scale = float(self.rng.uniform(*settings.scale))
+        if scale != 1.0:
+            template = cv2.resize(
+                template,
+                None,
+                fx=scale,
+                fy=scale,
+                interpolation=cv2.INTER_AREA
+                if scale < 1
+                else cv2.INTER_LINEAR,
+            )
+        if settings.color_jitter:
+            shift = self.rng.uniform(
+                -settings.color_jitter, settings.color_jitter, 3
+            )
+            template = np.clip(template + shift, 0, 255).astype(np.uint8)
+
+        height, width = template.shape[:2]
+        spot = self._free_spot(width, height, occupied)
+        if spot is None:
+            return None
+        left, top = spot
+        image[top : top + height, left : left + width] = template
+
+        occlusion = float(self.rng.uniform(*settings.occlusion))
+        if occlusion:
+            covered = max(int(width * occlusion), 1)
+            image[
+                top : top + height, left + width - covered : left + width
+            ] = self.rng.integers(0, 256, 3)
+
+        return FrameLabel(
+            asset_name=asset_name,
+            position=Coordinates(left + width // 2, top + height // 2),
+            width=width,
+            height=height,
+            scale=scale,
+            occlusion=occlusion,
+        )
+
+    def _place_distractor(
+        self, image: np.ndarray, occupied: list[tuple[int, int, int, int]]
+    ) -> None:
+        """Draw a textured block about the size of an asset."""
+        width, height = (int(v) for v in self.rng.integers(40, 160, 2))
+        spot = self._free_spot(width, height, occupied)
+        if spot is None:
+            return
+        left, top = spot
+        base = self.rng.integers(0, 256, 3)
+        texture = self.rng.integers(-50, 50, (height, width, 3))
+        image[top : top + height, left : left + width] = np.clip(
+            base + texture, 0, 255
+        )
+
+
+def save_corpus(path: Path, frames: list[SyntheticFrame]) -> None:
+    """
+    Write frames and their labels to a compressed ``.npz`` corpus.
+
+    Args:
+        path: Destination file.
+        frames: Frames of identical size.
+    """
+    assets = sorted({label.asset_name for f in frames for label in f.labels})
+    rows = [
+        (
+            index,
+            assets.index(label.asset_name),
+            label.position.x,
+            label.position.y,
+            label.width,
+            label.height,
+            label.scale,
+            label.occlusion,
+        )
+        for index, frame in enumerate(frames)
+        for label in frame.labels
+    ]
+    np.savez_compressed(
+        path,
+        images=np.stack([frame.image for frame in frames]),
+        assets=np.array(assets),
+        labels=np.array(rows, dtype=np.float64).reshape(-1, 8),
+    )
+
+
+def load_corpus(path: Path) -> list[SyntheticFrame]:
+    """
+    Read a corpus written by save_corpus.
+
+    Args:
+        path: Corpus file.
+
+    Returns:
+        The frames with their labels.
+    """
+    with np.load(path) as data:
+        images, assets, rows = data['images'], data['assets'], data['labels']
+        frames = [SyntheticFrame(image) for image in images]
+        for index, asset, x, y, width, height, scale, occlusion in rows:
+            frames[int(index)].labels.append(
+                FrameLabel(
+                    asset_name=str(assets[int(asset)]),
+                    position=Coordinates(int(x), int(y)),
+                    width=int(width),
+                    height=int(height),
+                    scale=float(scale),
+                    occlusion=float(occlusion),
+                )
+            )
+    return frames
+
+
+@dataclass
+class AccuracyReport:
+    """Value object with matcher accuracy against ground truth."""
+
+    true_positives: int = 0
+    false_positives: int = 0
+    false_negatives: int = 0
+
+    @property
+    def precision(self) -> float:
+        found = self.true_positives + self.false_positives
+        return self.true_positives / found if found else 1.0
+
+    @property
+    def recall(self) -> float:
+        expected = self.true_positives + self.false_negatives
+        return self.true_positives / expected if expected else 1.0
+
+
+def evaluate_matches(
+    frame: SyntheticFrame,
+    matches: list[ScanResult],
+    asset_name: str,
+    tolerance: int = 10,
+    report: Optional[AccuracyReport] = None,
+) -> AccuracyReport:
+    """
+    Compare matches for one asset against a frame's labels.
+
+    A match is correct if it lies within ``tolerance`` pixels of a not
+    yet matched label of the same asset.
+
+    Args:
+        frame: Frame with ground truth.
+        matches: Matcher output for the frame.
+        asset_name: Asset the matches were searched for.
+        tolerance: Maximum distance per axis in pixels.
+        report: Report to accumulate into (a new one if omitted).
+
+    Returns:
+        The updated accuracy report.
+    """
+    report = report or AccuracyReport()
+    expected = [
+        label for label in frame.labels if label.asset_name == asset_name
+    ]
+    for match in matches:
+        hit = next(
+            (
+                label
+                for label in expected
+                if abs(label.position.x - match.position.x) <= tolerance
+                and abs(label.position.y - match.position.y) <= tolerance
+            ),
+            None,
+        )
+        if hit is None:
+            report.false_positives += 1
+        else:
+            expected.remove(hit)
+            report.true_positives += 1
+    report.false_negatives += len(expected)
+    return report
@@ -5,8 +5,11 @@ Pure functions that contain the core business rules for farming decisions.
 These functions have no I/O dependencies and are easily testable.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import product
+from typing import Callable, Optional
 
 from .model import ScanResult
 
@@ -80,8 +83,22 @@ def decide_farming_action(context: DecisionContext) -> FarmingDecision:
     return FarmingDecision.NONE
 
 
-def get_decision_description(decision: FarmingDecision) -> str:
-    """Get a human-readable description of the decision."""
+def get_decision_description(
+    decision: FarmingDecision, context: Optional[DecisionContext] = None
+) -> str:
+    """
+    Get a human-readable description of the decision.
+
+    With the context, skipping both slots names the slot 1 tag taken.
+    """
+    if decision == FarmingDecision.SKIP_BOTH_SLOTS and context is not None:
+        doubles, _ = tags_taken(decision, context)
+        return (
+            'Skip for double and charm'
+            if doubles
+            else 'Skip for charm and charm'
+        )
+
     descriptions = {
         FarmingDecision.NONE: 'No matching tags found',
         FarmingDecision.SKIP_SLOT_1: 'Skip for charm (slot 1)',
@@ -89,3 +106,155 @@ def get_decision_description(decision: FarmingDecision) -> str:
         FarmingDecision.SKIP_BOTH_SLOTS: 'Skip for double/charm and charm',
     }
     return descriptions.get(decision, 'Unknown decision')
+
+
+def tags_taken(
+    decision: FarmingDecision, context: DecisionContext
+) -> tuple[int, int]:
+    """
+    Count the tags a decision takes by skipping blinds.
+
+    Each skipped slot yields the tag detected in it; slot 1 can show a
+    double or a charm, slot 2 only matters for charms.
+
+    Returns:
+        (doubles, charms) taken.
+    """
+    doubles = charms = 0
+    if decision in (
+        FarmingDecision.SKIP_SLOT_1,
+        FarmingDecision.SKIP_BOTH_SLOTS,
+    ):
+        if context.has_double_slot1:
+            doubles += 1
+        elif context.has_charm_slot1:
+            charms += 1
+    if decision in (
+        FarmingDecision.SKIP_SLOT_2,
+        FarmingDecision.SKIP_BOTH_SLOTS,
+    ):
+        if context.has_charm_slot2:
+            charms += 1
+    return doubles, charms
+
+
+class TagPredicate(Enum):
+    """A single tag check the decision table may ask for."""
+
+    DOUBLE_SLOT1 = ('has_double_slot1', 'double.png', 1, 'Double(Slot1)')
+    CHARM_SLOT1 = ('has_charm_slot1', 'charm.png', 1, 'Charm(Slot1)')
+    CHARM_SLOT2 = ('has_charm_slot2', 'charm.png', 2, 'Charm(Slot2)')
+
+    def __init__(
+        self, field_name: str, asset_name: str, slot: int, label: str
+    ):
+        self.field_name = field_name
+        self.asset_name = asset_name
+        self.slot = slot
+        self.label = label
+
+
+@dataclass
+class ProbeStatistics:
+    """
+    Entity tracking observed hit rates and costs of tag predicates.
+
+    Hit rates use Laplace smoothing around the prior; costs are an
+    exponential moving average of measured probe durations.
+    """
+
+    prior_hit_probability: float = 0.05
+    prior_cost: float = 1.0
+    smoothing: float = 0.1
+    hits: dict[TagPredicate, int] = field(default_factory=dict)
+    probes: dict[TagPredicate, int] = field(default_factory=dict)
+    costs: dict[TagPredicate, float] = field(default_factory=dict)
+
+    def record(self, predicate: TagPredicate, hit: bool, cost: float) -> None:
+        """Record the outcome and duration of one probe."""
+        self.probes[predicate] = self.probes.get(predicate, 0) + 1
+        self.hits[predicate] = self.hits.get(predicate, 0) + int(hit)
+        previous = self.costs.get(predicate)
+        self.costs[predicate] = (
+            cost
+            if previous is None
+            else previous + self.smoothing * (cost - previous)
+        )
+
+    def hit_probability(self, predicate: TagPredicate) -> float:
+        """Smoothed probability that the predicate holds."""
+        hits = self.hits.get(predicate, 0) + self.prior_hit_probability
+        return hits / (self.probes.get(predicate, 0) + 1)
+
+    def cost(self, predicate: TagPredicate) -> float:
+        """Average cost of evaluating the predicate."""
+        return self.costs.get(predicate, self.prior_cost)
+
+
+def _context_from(known: dict[TagPredicate, bool]) -> DecisionContext:
+    """Build a context where unknown predicates are False."""
+    return DecisionContext(
+        **{p.field_name: value for p, value in known.items()}
+    )
+
+
+def decide_farming_action_lazily(
+    probe: Callable[[TagPredicate], bool],
+    decide: Callable[
+        [DecisionContext], FarmingDecision
+    ] = decide_farming_action,
+    statistics: Optional[ProbeStatistics] = None,
+) -> tuple[FarmingDecision, DecisionContext]:
+    """
+    Decide what to do while evaluating as few tag predicates as possible.
+
+    Predicates are only probed while the decision still depends on them,
+    in the order minimising expected probe cost given each predicate's
+    hit probability. ``decide`` must be a pure function of the context.
+
+    Args:
+        probe: Callable evaluating one predicate (e.g. by scanning).
+        decide: Decision function applied to the (partial) context.
+        statistics: Observed hit rates and costs (priors if omitted).
+
+    Returns:
+        The decision and the context of the predicates actually probed.
+    """
+    statistics = statistics or ProbeStatistics()
+    predicates = tuple(TagPredicate)
+    probability = {p: statistics.hit_probability(p) for p in predicates}
+    cost = {p: statistics.cost(p) for p in predicates}
+
+    def outcomes(known: frozenset) -> set[FarmingDecision]:
+        values = dict(known)
+        unknown = [p for p in predicates if p not in values]
+        decisions = set()
+        for assignment in product((False, True), repeat=len(unknown)):
+            values.update(zip(unknown, assignment))
+            decisions.add(decide(_context_from(values)))
+        return decisions
+
+    @lru_cache(maxsize=None)
+    def plan(known: frozenset) -> tuple[float, Optional[TagPredicate]]:
+        if len(outcomes(known)) == 1:
+            return 0.0, None
+        values = dict(known)
+        best: tuple[float, Optional[TagPredicate]] = (float('inf'), None)
+        for p in predicates:
+            if p in values:
+                continue
+            expected = (
+                cost[p]
+                + probability[p] * plan(known | {(p, True)})[0]
+                + (1 - probability[p]) * plan(known | {(p, False)})[0]
+            )
+            if expected < best[0]:
+                best = (expected, p)
+        return best
+
+    known: frozenset = frozenset()
+    while (predicate := plan(known)[1]) is not None:
+        known = known | {(predicate, probe(predicate))}
+
+    context = _context_from(dict(known))
+    return decide(context), context
@@ -0,0 +1,118 @@
+"""
+Domain events emitted by the farming loop.
+
+Typed records of what happened, with monotonic timestamps (seconds on
+the service clock). They are the machine-readable counterpart of the
+human log and what analytics counts, so no log text has to be parsed.
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar, Optional, Union
+
+
+@dataclass(frozen=True)
+class SessionStarted:
+    """A farming session started; anchors monotonic time to wall time."""
+
+    TYPE: ClassVar[str] = 'session'
+
+    at: float
+    wall_time: float
+    profile: str
+    delays: dict[str, float]
+
+
+@dataclass(frozen=True)
+class ScanCompleted:
+    """
+    Tags detected by a blind selection scan.
+
+    A tag a lazy scan did not need to check is None, not False.
+    """
+
+    TYPE: ClassVar[str] = 'scan'
+
+    at: float
+    double_slot1: Optional[bool]
+    charm_slot1: Optional[bool]
+    charm_slot2: Optional[bool]
+
+
+@dataclass(frozen=True)
+class DecisionMade:
+    """A decision to execute, with the tags it takes."""
+
+    TYPE: ClassVar[str] = 'decision'
+
+    at: float
+    decision: str
+    doubles: int
+    charms: int
+
+
+@dataclass(frozen=True)
+class ActionClicked:
+    """A named profile action was clicked."""
+
+    TYPE: ClassVar[str] = 'action'
+
+    at: float
+    name: str
+
+
+@dataclass(frozen=True)
+class NewGameStarted:
+    """A reset completed and a new run started."""
+
+    TYPE: ClassVar[str] = 'new_game'
+
+    at: float
+    run: int
+
+
+@dataclass(frozen=True)
+class SoulFound:
+    """The Soul card was found in an opened pack."""
+
+    TYPE: ClassVar[str] = 'soul'
+
+    at: float
+    x: int
+    y: int
+
+
+DomainEvent = Union[
+    SessionStarted,
+    ScanCompleted,
+    DecisionMade,
+    ActionClicked,
+    NewGameStarted,
+    SoulFound,
+]
+
+EVENT_TYPES: dict[str, type] = {
+    cls.TYPE: cls
+    for cls in (
+        SessionStarted,
+        ScanCompleted,
+        DecisionMade,
+        ActionClicked,
+        NewGameStarted,
+        SoulFound,
+    )
+}
+
+
+def event_from_dict(data: dict) -> Optional[DomainEvent]:
+    """
+    Rebuild an event from its serialized fields.
+
+    Args:
+        data: Event fields plus its 'type'.
+
+    Returns:
+        The event, or None for unknown types (newer writers).
+    """
+    fields = dict(data)
+    cls = EVENT_TYPES.get(fields.pop('type', None))
+    return cls(**fields) if cls else None
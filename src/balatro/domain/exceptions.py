@@ -46,3 +46,20 @@ class ActionNotFoundError(ConfigurationError):
         super().__init__(
             f"Action '{action_name}' not found in profile '{profile_name}'"
         )
+
+
+class FarmingInterrupted(BalatroError):
+    """Raised when a pause or stop interrupts an in-progress iteration."""
+
+    pass
+
+
+class ScanTimeoutError(BalatroError):
+    """Raised when a screen scan does not finish before its deadline."""
+
+    def __init__(self, asset_name: str, timeout: float):
+        self.asset_name = asset_name
+        self.timeout = timeout
+        super().__init__(
+            f"Scan for '{asset_name}' exceeded its {timeout:.2f}s deadline"
+        )
@@ -5,10 +5,13 @@ These are pure Python data classes with no external dependencies.
 They represent the core concepts of the domain.
 """
 
+import threading
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
+from .statistics import LiveStatistics
+
 
 @dataclass(frozen=True)
 class Coordinates:
@@ -60,6 +63,15 @@ class Region:
             x=local_coords.x + self.left, y=local_coords.y + self.top
         )
 
+    @classmethod
+    def bounding(cls, regions: list['Region']) -> 'Region':
+        """Smallest region containing all of the given regions."""
+        left = min(r.left for r in regions)
+        top = min(r.top for r in regions)
+        right = max(r.left + r.width for r in regions)
+        bottom = max(r.top + r.height for r in regions)
+        return cls(left, top, right - left, bottom - top)
+
 
 @dataclass(frozen=True)
 class AssetConfig:
@@ -106,30 +118,84 @@ class GameState:
     """
     Entity representing the current state of the automation.
 
-    Mutable state that tracks whether the automation is running/paused.
+    Running/farming flags are backed by thread-safe events because they
+    are flipped from the hotkey thread. Pausing or stopping also sets the
+    ``interrupted`` event so in-progress waits can be cut short.
+    ``stats`` is only updated by the farming loop's thread.
     """
 
-    is_running: bool = True
-    is_farming: bool = False
     phase: FarmingPhase = FarmingPhase.IDLE
     current_run: int = 0
     souls_found: int = 0
+    stats: LiveStatistics = field(
+        default_factory=LiveStatistics, repr=False, compare=False
+    )
+    interrupted: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+    _running: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+    _farming: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+    _changed: threading.Condition = field(
+        default_factory=threading.Condition, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._running.set()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the automation has not been stopped."""
+        return self._running.is_set()
+
+    @property
+    def is_farming(self) -> bool:
+        """Whether the farming loop is active (not paused)."""
+        return self._farming.is_set()
 
     def start_farming(self) -> None:
         """Resume the farming loop."""
-        self.is_farming = True
-        self.phase = FarmingPhase.SCANNING
+        with self._changed:
+            self.interrupted.clear()
+            self._farming.set()
+            self.phase = FarmingPhase.SCANNING
+            self._changed.notify_all()
 
     def pause_farming(self) -> None:
-        """Pause the farming loop."""
-        self.is_farming = False
-        self.phase = FarmingPhase.IDLE
+        """Pause the farming loop, interrupting any in-progress wait."""
+        with self._changed:
+            self._farming.clear()
+            self.interrupted.set()
+            self.phase = FarmingPhase.IDLE
+            self._changed.notify_all()
 
     def stop(self) -> None:
         """Stop the automation completely."""
-        self.is_running = False
-        self.is_farming = False
-        self.phase = FarmingPhase.IDLE
+        with self._changed:
+            self._running.clear()
+            self._farming.clear()
+            self.interrupted.set()
+            self.phase = FarmingPhase.IDLE
+            self._changed.notify_all()
+
+    def wait_until_active(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until farming is resumed or the automation is stopped.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever).
+
+        Returns:
+            True if farming is active when this returns.
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self.is_farming or not self.is_running, timeout
+            )
+            return self.is_farming and self.is_running
 
     def increment_run(self) -> None:
         """Record a new game reset."""
@@ -145,13 +211,15 @@ class ProfileConfig:
     """
     Value Object representing a resolution profile configuration.
 
-    Contains named coordinates for UI actions and regions for scanning.
+    Contains named coordinates for UI actions, regions for scanning
+    and any delays learned by the adaptive timing controller.
     """
 
     name: str
     description: str
     actions: dict[str, Coordinates] = field(default_factory=dict)
     rois: dict[str, list[Region]] = field(default_factory=dict)
+    delays: dict[str, float] = field(default_factory=dict)
 
     def get_action(self, action_name: str) -> Optional[Coordinates]:
         """Get coordinates for a named action."""
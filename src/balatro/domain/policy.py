@@ -0,0 +1,157 @@
+"""
+Farming policies for the Balatro automation.
+
+A policy turns a decision context into a farming decision and may learn
+from the observed outcome of each iteration. The rule table in
+decisions.py is one policy; the expected-value policy weighs the souls a
+decision can yield against the time it costs. Pure logic, no I/O.
+"""
+
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from .decisions import DecisionContext, FarmingDecision, decide_farming_action
+
+# Number of packs (soul checks) each decision opens
+PACKS_OPENED = {
+    FarmingDecision.NONE: 0,
+    FarmingDecision.SKIP_SLOT_1: 1,
+    FarmingDecision.SKIP_SLOT_2: 1,
+    FarmingDecision.SKIP_BOTH_SLOTS: 2,
+}
+
+
+def feasible_decisions(context: DecisionContext) -> list[FarmingDecision]:
+    """
+    List the decisions that make sense for the detected tags.
+
+    Resetting immediately (NONE) is always feasible.
+
+    Args:
+        context: The decision context with detected tags.
+
+    Returns:
+        Feasible decisions, NONE first.
+    """
+    decisions = [FarmingDecision.NONE]
+    if context.has_charm_slot1:
+        decisions.append(FarmingDecision.SKIP_SLOT_1)
+    if context.has_charm_slot2:
+        decisions.append(FarmingDecision.SKIP_SLOT_2)
+        if context.has_double_slot1 or context.has_charm_slot1:
+            decisions.append(FarmingDecision.SKIP_BOTH_SLOTS)
+    return decisions
+
+
+class FarmingPolicy(Protocol):
+    """Strategy choosing what to do after a scan."""
+
+    def decide(self, context: DecisionContext) -> FarmingDecision:
+        """Choose a decision; must not change state (it may be re-run)."""
+        ...
+
+    def observe(
+        self,
+        decision: FarmingDecision,
+        duration: float,
+        packs: int,
+        souls: int,
+        iteration_time: float,
+    ) -> None:
+        """
+        Learn from the outcome of an executed decision.
+
+        Args:
+            decision: The decision that was executed.
+            duration: Seconds spent executing the decision.
+            packs: Packs that were checked for a soul.
+            souls: Souls found.
+            iteration_time: Seconds the whole iteration took.
+        """
+        ...
+
+
+class RuleBasedPolicy:
+    """Policy applying the fixed decision table."""
+
+    def decide(self, context: DecisionContext) -> FarmingDecision:
+        return decide_farming_action(context)
+
+    def observe(
+        self,
+        decision: FarmingDecision,
+        duration: float,
+        packs: int,
+        souls: int,
+        iteration_time: float,
+    ) -> None:
+        pass
+
+
+@dataclass
+class ExpectedValuePolicy:
+    """
+    Policy maximising expected souls per second.
+
+    A decision is worth ``packs * p_soul - rate * duration``, where
+    ``rate`` is the souls per second the farm currently achieves; NONE
+    (reset immediately) is worth zero. Durations are exponential moving
+    averages of measured execution times, and the soul probability is
+    smoothed towards a prior until enough packs have been seen.
+    """
+
+    prior_soul_probability: float = 0.01
+    prior_packs: float = 50.0
+    smoothing: float = 0.2
+    durations: dict[FarmingDecision, float] = field(
+        default_factory=lambda: {
+            FarmingDecision.SKIP_SLOT_1: 7.0,
+            FarmingDecision.SKIP_SLOT_2: 7.5,
+            FarmingDecision.SKIP_BOTH_SLOTS: 14.5,
+        }
+    )
+    packs_opened: int = 0
+    souls_found: int = 0
+    total_time: float = 0.0
+
+    @property
+    def soul_probability(self) -> float:
+        """Smoothed probability of a soul in one pack."""
+        prior = self.prior_soul_probability * self.prior_packs
+        return (self.souls_found + prior) / (
+            self.packs_opened + self.prior_packs
+        )
+
+    @property
+    def rate(self) -> float:
+        """Expected souls per second achieved so far."""
+        if self.total_time <= 0:
+            return 0.0
+        return self.soul_probability * self.packs_opened / self.total_time
+
+    def value(self, decision: FarmingDecision) -> float:
+        """Expected souls gained minus the time cost, in souls."""
+        if decision == FarmingDecision.NONE:
+            return 0.0
+        souls = PACKS_OPENED[decision] * self.soul_probability
+        return souls - self.rate * self.durations[decision]
+
+    def decide(self, context: DecisionContext) -> FarmingDecision:
+        return max(feasible_decisions(context), key=self.value)
+
+    def observe(
+        self,
+        decision: FarmingDecision,
+        duration: float,
+        packs: int,
+        souls: int,
+        iteration_time: float,
+    ) -> None:
+        if decision != FarmingDecision.NONE:
+            previous = self.durations[decision]
+            self.durations[decision] = previous + self.smoothing * (
+                duration - previous
+            )
+        self.packs_opened += packs
+        self.souls_found += souls
+        self.total_time += iteration_time
@@ -0,0 +1,137 @@
+"""
+Live statistics of a farming session.
+
+Counters, active time, rolling rates and an iteration duration
+histogram are updated as the farming loop runs, so throughput is known
+at any moment without re-reading the session log. Time only runs while
+farming is active: paused stretches count toward neither durations nor
+rates. Pure logic; callers pass clock timestamps in.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Upper bounds (seconds) of the iteration duration histogram buckets;
+# a last bucket holds everything longer
+HISTOGRAM_BOUNDS = (2.0, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0, 15.0, 20.0, 30.0)
+# Active seconds covered by the rolling rates
+RATE_WINDOW = 3600.0
+
+
+@dataclass
+class LiveStatistics:
+    """
+    Entity accumulating the statistics of the running session.
+
+    Event times are mapped onto an active clock that stands still while
+    paused; the rolling rates count events within the last ``window``
+    seconds of that clock.
+    """
+
+    window: float = RATE_WINDOW
+    bounds: tuple[float, ...] = HISTOGRAM_BOUNDS
+    resets: int = 0
+    souls: int = 0
+    doubles: int = 0
+    charms: int = 0
+    iterations: int = 0
+    iteration_seconds: float = 0.0
+    histogram: list[int] = field(default_factory=list)
+    _active_before: float = field(default=0.0, repr=False)
+    _resumed_at: Optional[float] = field(default=None, repr=False)
+    # Active time of the resets and souls still inside the window
+    _reset_times: deque = field(default_factory=deque, repr=False)
+    _soul_times: deque = field(default_factory=deque, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.histogram:
+            self.histogram = [0] * (len(self.bounds) + 1)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the active clock is running."""
+        return self._resumed_at is not None
+
+    def resume(self, at: float) -> None:
+        """Start the active clock; no-op if it is running."""
+        if self._resumed_at is None:
+            self._resumed_at = at
+
+    def pause(self, at: float) -> None:
+        """Stop the active clock; no-op if it is stopped."""
+        if self._resumed_at is not None:
+            self._active_before += max(0.0, at - self._resumed_at)
+            self._resumed_at = None
+
+    def active_time(self, now: float) -> float:
+        """
+        Seconds spent farming, excluding pauses.
+
+        Args:
+            now: Current clock time (ignored while paused).
+        """
+        if self._resumed_at is None:
+            return self._active_before
+        return self._active_before + max(0.0, now - self._resumed_at)
+
+    def record_reset(self, at: float) -> None:
+        """Count a new game started at clock time ``at``."""
+        self.resets += 1
+        self._remember(self._reset_times, at)
+
+    def record_soul(self, at: float) -> None:
+        """Count a soul found at clock time ``at``."""
+        self.souls += 1
+        self._remember(self._soul_times, at)
+
+    def record_decision(self, doubles: int, charms: int) -> None:
+        """Count the tags an executed decision takes."""
+        self.doubles += doubles
+        self.charms += charms
+
+    def record_iteration(self, seconds: float) -> None:
+        """Add a completed iteration's duration to the histogram."""
+        self.iterations += 1
+        self.iteration_seconds += seconds
+        self.histogram[bisect_left(self.bounds, seconds)] += 1
+
+    def _remember(self, times: deque, at: float) -> None:
+        active = self.active_time(at)
+        times.append(active)
+        while times[0] <= active - self.window:
+            times.popleft()
+
+    @property
+    def average_iteration(self) -> float:
+        """Mean duration of the completed iterations in seconds."""
+        if self.iterations == 0:
+            return 0.0
+        return self.iteration_seconds / self.iterations
+
+    def resets_per_hour(self, now: float) -> float:
+        """Resets per active hour over the rolling window."""
+        return self._rolling_rate(self._reset_times, now)
+
+    def souls_per_hour(self, now: float) -> float:
+        """Souls per active hour over the rolling window."""
+        return self._rolling_rate(self._soul_times, now)
+
+    def _rolling_rate(self, times: deque, now: float) -> float:
+        active = self.active_time(now)
+        span = min(active, self.window)
+        if span <= 0:
+            return 0.0
+        recent = len(times) - bisect_right(times, active - self.window)
+        return recent / span * 3600
+
+    def histogram_rows(self) -> list[tuple[Optional[float], int]]:
+        """
+        Iteration counts by duration bucket.
+
+        Returns:
+            (upper bound in seconds, count) per bucket; the bound of the
+            last, open-ended bucket is None.
+        """
+        return list(zip((*self.bounds, None), self.histogram))
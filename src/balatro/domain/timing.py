@@ -0,0 +1,153 @@
+"""
+Adaptive timing logic for the Balatro automation.
+
+Delays between actions are tuned with an AIMD-style controller:
+each verified success shaves a small fixed step off the delay, each
+failure multiplies it back up. Pure logic with no I/O dependencies.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class AdaptiveDelay:
+    """
+    Entity holding the learned value of a single named delay.
+
+    The delay never drops below ``minimum`` nor exceeds ``maximum``.
+    """
+
+    name: str
+    baseline: float
+    value: float
+    minimum: float
+    maximum: float
+    decrease_step: float = 0.02
+    backoff_factor: float = 1.5
+    successes: int = 0
+    failures: int = 0
+
+    @classmethod
+    def from_baseline(
+        cls, name: str, baseline: float, value: Optional[float] = None
+    ) -> 'AdaptiveDelay':
+        """
+        Factory method creating a delay bounded around its baseline.
+
+        Args:
+            name: Delay name (e.g. 'action', 'click', 'reset').
+            baseline: The original hand-tuned delay in seconds.
+            value: Previously learned value to resume from, if any.
+        """
+        minimum = baseline * 0.25
+        maximum = baseline * 2.0
+        start = baseline if value is None else value
+        return cls(
+            name=name,
+            baseline=baseline,
+            value=min(max(start, minimum), maximum),
+            minimum=minimum,
+            maximum=maximum,
+            decrease_step=baseline * 0.02,
+        )
+
+    def record_success(self) -> None:
+        """Additively shrink the delay after a verified action."""
+        self.successes += 1
+        self.value = max(self.minimum, self.value - self.decrease_step)
+
+    def record_failure(self) -> None:
+        """Multiplicatively back off the delay after a failed action."""
+        self.failures += 1
+        self.value = min(self.maximum, self.value * self.backoff_factor)
+
+    @property
+    def saving(self) -> float:
+        """Seconds saved per use compared to the baseline."""
+        return self.baseline - self.value
+
+
+@dataclass
+class DelayTuner:
+    """
+    Aggregate managing all adaptive delays of a farming session.
+
+    Tracks how much time the learned delays saved per reset.
+    """
+
+    delays: dict[str, AdaptiveDelay] = field(default_factory=dict)
+    total_saved: float = 0.0
+    resets: int = 0
+    _pending_saved: float = field(default=0.0, repr=False)
+
+    @classmethod
+    def from_baselines(
+        cls,
+        baselines: dict[str, float],
+        learned: Optional[dict[str, float]] = None,
+    ) -> 'DelayTuner':
+        """
+        Factory method building a tuner from baseline delays.
+
+        Args:
+            baselines: Mapping of delay name to baseline seconds.
+            learned: Previously persisted values to resume from.
+        """
+        learned = learned or {}
+        return cls(
+            delays={
+                name: AdaptiveDelay.from_baseline(
+                    name, baseline, learned.get(name)
+                )
+                for name, baseline in baselines.items()
+            }
+        )
+
+    def get(self, name: str) -> float:
+        """
+        Get the current value of a delay and account for its saving.
+
+        Args:
+            name: Name of the delay.
+
+        Returns:
+            The delay to wait, in seconds.
+        """
+        delay = self.delays[name]
+        self._pending_saved += delay.saving
+        return delay.value
+
+    def record(self, name: str, success: bool) -> None:
+        """Feed a verification outcome for the named delay."""
+        delay = self.delays[name]
+        if success:
+            delay.record_success()
+        else:
+            delay.record_failure()
+
+    def complete_reset(self) -> float:
+        """
+        Close the accounting window for one reset.
+
+        Returns:
+            Seconds saved (negative if slower) during this reset.
+        """
+        saved = self._pending_saved
+        self._pending_saved = 0.0
+        self.total_saved += saved
+        self.resets += 1
+        return saved
+
+    @property
+    def average_saved_per_reset(self) -> float:
+        """Average seconds saved per reset over the session."""
+        if self.resets == 0:
+            return 0.0
+        return self.total_saved / self.resets
+
+    def learned_values(self) -> dict[str, float]:
+        """Get the learned delay values for persistence."""
+        return {
+            name: round(delay.value, 4) for name, delay in self.delays.items()
+        }
@@ -4,18 +4,35 @@ CLI entrypoint for the Balatro Soul Farm automation.
 This module wires up all dependencies and starts the application.
 """
 
+import argparse
+import asyncio
 import logging
 import sys
+import threading
 import time
+from logging.handlers import QueueListener
 from pathlib import Path
+from typing import Callable, Optional, Union
 
 import pyautogui
 
 from ..adapters.config import JsonConfigRepository
+from ..adapters.control_server import serve_control
+from ..adapters.event_log import JsonlEventLog, read_events
+from ..adapters.executor import ExecutorInputAdapter, ExecutorScreenAdapter
+from ..adapters.file_cache import JsonFileCache
 from ..adapters.input import DirectInputAdapter
+from ..adapters.log_archive import events_file_for, find_logs
+from ..adapters.log_index import SqliteLogIndex
+from ..adapters.log_queue import SamplingFilter, start_queue_logging
+from ..adapters.log_tail import LogTailer
 from ..adapters.screen import PyAutoGuiScreenAdapter
 from ..service_layer.analytics import AnalyticsService
+from ..service_layer.async_farming import AsyncFarmingService
 from ..service_layer.farming import FarmingService
+from ..service_layer.report import ReportService
+from ..service_layer.retention import RetentionPolicy, RetentionService
+from ..service_layer.session_analysis import SessionAnalysisService
 
 # Setup directories
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -23,58 +40,436 @@ ASSETS_DIR = BASE_DIR / 'assets'
 ASSETS_DIR.mkdir(exist_ok=True)
 
 LOG_DIR = Path.home() / '.balatro' / 'logs'
-LOG_DIR.mkdir(parents=True, exist_ok=True)
-LOG_FILE = LOG_DIR / f'{time.strftime("%Y-%m-%d_%H-%M-%S")}.log'
+REPORT_CACHE_FILE = LOG_DIR.parent / 'report_cache.json'
+INDEX_FILE = LOG_DIR.parent / 'index.sqlite3'
 CONFIG_FILE = BASE_DIR / 'config.json'
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
 logger = logging.getLogger(__name__)
 
+# Either engine; both keep live statistics in ``state.stats``
+Farming = Union[FarmingService, AsyncFarmingService]
+
 
-def main() -> None:
+def configure_logging(
+    sample_every: int = 1,
+) -> tuple[Path, QueueListener]:
     """
-    Main entry point for the Balatro automation CLI.
+    Log to a new timestamped session file and to stdout.
 
-    Wires up all dependencies and starts the farming service.
+    Records are written by a listener thread, so the farming loop never
+    waits on formatting or disk I/O.
+
+    Args:
+        sample_every: Keep one in this many template match lines.
+
+    Returns:
+        Path of the session log file and the started listener; stop it
+        to flush the log.
     """
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = LOG_DIR / f'{time.strftime("%Y-%m-%d_%H-%M-%S")}.log'
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    # The format uses none of these; skipping them halves record creation
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+    filters = []
+    if sample_every > 1:
+        filters.append(SamplingFilter('Found ', sample_every))
+    listener = start_queue_logging(handlers, logging.INFO, filters)
+    return log_file, listener
 
-    logger.info('Balatro Automation Ready.')
-    logger.info(f'Resolution: {pyautogui.size()}')
-    logger.info(f'Log file: {LOG_FILE}')
 
-    # Wire up dependencies
-    screen = PyAutoGuiScreenAdapter(ASSETS_DIR)
+def start_retention(
+    log_file: Path, policy: RetentionPolicy
+) -> threading.Thread:
+    """
+    Compress and prune the logs of earlier sessions on a thread.
+
+    Started at shutdown, once farming no longer competes for CPU and
+    disk. The thread is a daemon: a second Ctrl+C abandons it, which is
+    safe because logs are compressed to a temporary file first.
+
+    Args:
+        log_file: Log of the current session, left untouched.
+        policy: Compression and pruning settings.
+
+    Returns:
+        The started thread.
+    """
+
+    def apply() -> None:
+        index = SqliteLogIndex(INDEX_FILE)
+        try:
+            analytics = AnalyticsService(index=index)
+            RetentionService(LOG_DIR, analytics, policy).run(log_file)
+        finally:
+            index.close()
+
+    thread = threading.Thread(target=apply, name='log-retention', daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_retention(thread: threading.Thread) -> None:
+    """Join the retention thread, showing that it is still working."""
+    print('\nCompressing and pruning earlier session logs...', flush=True)
+    # Join in slices so Ctrl+C is still delivered (not on Windows otherwise)
+    while thread.is_alive():
+        thread.join(0.5)
+    print('Log retention done.')
+
+
+def run_session(
+    build: Callable[[JsonlEventLog], Farming],
+    drive: Callable[[Farming], None],
+    policy: RetentionPolicy,
+    log_sample: int,
+) -> None:
+    """
+    Run one farming session with logging, events and log retention.
+
+    Shared by the hotkey and the asyncio engine: the session gets a log
+    and event file, its live statistics are shown on exit, then earlier
+    logs are tidied up and this one is indexed.
+
+    Args:
+        build: Creates the farming service around the event log.
+        drive: Runs the service until it stops.
+        policy: What to do with the logs of earlier sessions.
+        log_sample: Keep one in this many template match lines.
+    """
+    log_file, listener = configure_logging(log_sample)
+    logger.info('Log file: %s', log_file)
+    event_log = JsonlEventLog(events_file_for(log_file))
+
+    try:
+        try:
+            farming = build(event_log)
+            drive(farming)
+        finally:
+            event_log.close()
+
+        # Statistics are live: show them before the slow log retention
+        analytics = AnalyticsService(index=SqliteLogIndex(INDEX_FILE))
+        analytics.display_live(farming.state.stats, farming.clock.now())
+        wait_for_retention(start_retention(log_file, policy))
+    finally:
+        # Flush queued records before the log is read back
+        listener.stop()
+
+    if log_file.exists():
+        print(f'\nLOG FILE: {log_file.absolute()}')
+        analytics.index_log(log_file)
+    else:
+        print('No log file generated.')
+
+
+def run(policy: Optional[RetentionPolicy] = None, log_sample: int = 1) -> None:
+    """
+    Run the farming automation.
+
+    Wires up all dependencies and starts the farming service.
+
+    Args:
+        policy: What to do with the logs of earlier sessions.
+        log_sample: Keep one in this many template match lines.
+    """
     input_adapter = DirectInputAdapter()
-    config = JsonConfigRepository(CONFIG_FILE)
 
-    # Create and run farming service
-    farming = FarmingService(
-        screen=screen,
-        input_adapter=input_adapter,
-        config=config,
-    )
+    def build(event_log: JsonlEventLog) -> FarmingService:
+        logger.info('Balatro Automation Ready.')
+        logger.info('Resolution: %s', pyautogui.size())
+        return FarmingService(
+            screen=PyAutoGuiScreenAdapter(ASSETS_DIR),
+            input_adapter=input_adapter,
+            config=JsonConfigRepository(CONFIG_FILE),
+            events=event_log,
+        )
+
+    def drive(farming: FarmingService) -> None:
+        try:
+            farming.run()
+        except KeyboardInterrupt:
+            logger.info('Automation stopped by user.')
+            input_adapter.unregister_all_hotkeys()
+
+    run_session(build, drive, policy or RetentionPolicy(), log_sample)
+
+
+def run_async(
+    port: int,
+    policy: Optional[RetentionPolicy] = None,
+    log_sample: int = 1,
+) -> None:
+    """
+    Run the asyncio farming automation, controlled over localhost TCP.
+
+    The loop starts paused; send ``start``, ``pause``, ``stop`` or
+    ``metrics`` lines to the control port instead of using hotkeys.
+
+    Args:
+        port: Control server port on 127.0.0.1.
+        policy: What to do with the logs of earlier sessions.
+        log_sample: Keep one in this many template match lines.
+    """
+
+    def build(event_log: JsonlEventLog) -> AsyncFarmingService:
+        return AsyncFarmingService(
+            ExecutorScreenAdapter(PyAutoGuiScreenAdapter(ASSETS_DIR)),
+            ExecutorInputAdapter(DirectInputAdapter()),
+            JsonConfigRepository(CONFIG_FILE),
+            events=event_log,
+        )
+
+    def drive(farming: AsyncFarmingService) -> None:
+        async def serve() -> None:
+            server = await serve_control(farming, port=port)
+            async with server:
+                await farming.run()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            logger.info('Automation stopped by user.')
+
+    run_session(build, drive, policy or RetentionPolicy(), log_sample)
+
+
+def stats(follow: bool, interval: float) -> None:
+    """
+    Show statistics of the latest session log.
+
+    Args:
+        follow: Keep tailing the log and refresh in place.
+        interval: Seconds between refreshes when following.
+    """
+    tailer = LogTailer(LOG_DIR)
+    if not follow:
+        log_file = tailer.latest_log()
+        if log_file is None:
+            print(f'No logs in {LOG_DIR}')
+            return
+        print(f'LOG FILE: {log_file}')
+        analytics = AnalyticsService(index=SqliteLogIndex(INDEX_FILE))
+        events_file = events_file_for(log_file)
+        if events_file.exists():
+            analytics.index_log(log_file)
+            analytics.process_event_file(events_file)
+        else:
+            analytics.process_log_file(log_file)
+        return
 
     try:
-        farming.run()
+        AnalyticsService().follow(tailer, interval=interval)
     except KeyboardInterrupt:
-        logger.info('Automation stopped by user.')
-        input_adapter.unregister_all_hotkeys()
-
-    # Process and display statistics
-    if LOG_FILE.exists():
-        print(f'\nLOG FILE: {LOG_FILE.absolute()}')
-        analytics = AnalyticsService()
-        analytics.process_log_file(LOG_FILE)
+        print()
+    finally:
+        tailer.close()
+
+
+def report(by: str, workers: Optional[int], use_cache: bool) -> None:
+    """
+    Show lifetime and per-period statistics of all session logs.
+
+    Args:
+        by: Period of the summary rows ('day', 'week' or 'month').
+        workers: Parser processes (CPU count if None).
+        use_cache: Reuse results of unchanged logs.
+    """
+    cache = JsonFileCache(REPORT_CACHE_FILE) if use_cache else None
+    service = ReportService(cache=cache, workers=workers)
+    service.report(find_logs(LOG_DIR), by=by)
+
+
+def query(by: str) -> None:
+    """
+    Index all session logs and show souls per hour by a dimension.
+
+    Args:
+        by: 'profile', 'week' or 'delays'.
+    """
+    analytics = AnalyticsService(index=SqliteLogIndex(INDEX_FILE))
+    for log_file in find_logs(LOG_DIR):
+        analytics.index_log(log_file)
+    analytics.display_rates(by)
+
+
+def analyze(window: float, step: float, csv_dir: Optional[Path]) -> None:
+    """
+    Show reset time percentiles, decision breakdown and throughput.
+
+    Args:
+        window: Rolling throughput window in minutes.
+        step: Rolling throughput sampling interval in minutes.
+        csv_dir: Directory to also write CSV files to.
+    """
+    log_file = LogTailer(LOG_DIR).latest_log()
+    if log_file is None:
+        print(f'No logs in {LOG_DIR}')
+        return
+    events_file = events_file_for(log_file)
+    if not events_file.exists():
+        print(f'No event file for {log_file}')
+        return
+
+    print(f'EVENT FILE: {events_file}')
+    service = SessionAnalysisService(window=window * 60, step=step * 60)
+    with events_file.open(encoding='utf-8') as stream:
+        iterations = service.analyze(read_events(stream))
+    service.display_analysis(iterations)
+    if csv_dir is not None:
+        service.write_csv(iterations, csv_dir)
+        print(f'CSV written to {csv_dir}')
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Main entry point for the Balatro automation CLI.
+
+    Without a command the farming automation is run.
+    """
+    parser = argparse.ArgumentParser(prog='soul_farm')
+    commands = parser.add_subparsers(dest='command')
+    parser.set_defaults(
+        compress='gz',
+        keep_days=None,
+        max_logs_mb=None,
+        log_sample=1,
+        control_port=None,
+    )
+    run_parser = commands.add_parser(
+        'run', help='run the farming automation (default)'
+    )
+    run_parser.add_argument(
+        '--compress',
+        choices=('gz', 'zst', 'none'),
+        default='gz',
+        help='compression of earlier session logs, applied at exit '
+        '(default: gz)',
+    )
+    run_parser.add_argument(
+        '--keep-days',
+        type=float,
+        default=None,
+        help='delete session logs older than this many days',
+    )
+    run_parser.add_argument(
+        '--max-logs-mb',
+        type=float,
+        default=None,
+        help='delete the oldest session logs above this total size',
+    )
+    run_parser.add_argument(
+        '--log-sample',
+        type=int,
+        default=1,
+        metavar='N',
+        help='log only every Nth template match line (default: 1, all)',
+    )
+    run_parser.add_argument(
+        '--control-port',
+        type=int,
+        default=None,
+        metavar='PORT',
+        help='run the asyncio engine, controlled over localhost:PORT '
+        'instead of hotkeys (same logs, events and learned delays)',
+    )
+    stats_parser = commands.add_parser(
+        'stats', help='statistics of the latest session log'
+    )
+    stats_parser.add_argument(
+        '--follow',
+        action='store_true',
+        help='tail the log and refresh resets/souls per hour in place',
+    )
+    stats_parser.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='seconds between refreshes (default: 1)',
+    )
+    report_parser = commands.add_parser(
+        'report',
+        help='lifetime and per-period totals of the session logs on disk '
+        '(sessions pruned by --keep-days/--max-logs-mb are excluded)',
+    )
+    report_parser.add_argument(
+        '--by', choices=('day', 'week', 'month'), default='day'
+    )
+    report_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='parser processes (default: CPU count)',
+    )
+    report_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='reparse every log instead of reusing cached results',
+    )
+    query_parser = commands.add_parser(
+        'query', help='souls/hour by profile, week or delay configuration'
+    )
+    query_parser.add_argument(
+        '--by', choices=('profile', 'week', 'delays'), default='profile'
+    )
+    analyze_parser = commands.add_parser(
+        'analyze',
+        help='reset time percentiles, decision breakdown and throughput',
+    )
+    analyze_parser.add_argument(
+        '--window',
+        type=float,
+        default=60.0,
+        help='rolling throughput window in minutes (default: 60)',
+    )
+    analyze_parser.add_argument(
+        '--step',
+        type=float,
+        default=1.0,
+        help='throughput sampling interval in minutes (default: 1)',
+    )
+    analyze_parser.add_argument(
+        '--csv',
+        type=Path,
+        default=None,
+        metavar='DIR',
+        help='also write iterations/decisions/throughput CSV files',
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == 'stats':
+        stats(args.follow, args.interval)
+    elif args.command == 'report':
+        report(args.by, args.workers, not args.no_cache)
+    elif args.command == 'query':
+        query(args.by)
+    elif args.command == 'analyze':
+        analyze(args.window, args.step, args.csv)
     else:
-        print('No log file generated.')
+        policy = RetentionPolicy(
+            compression=(
+                None if args.compress == 'none' else f'.{args.compress}'
+            ),
+            max_age_days=args.keep_days,
+            max_total_bytes=(
+                None
+                if args.max_logs_mb is None
+                else int(args.max_logs_mb * 1024 * 1024)
+            ),
+        )
+        if args.control_port is not None:
+            run_async(args.control_port, policy, args.log_sample)
+        else:
+            run(policy, args.log_sample)
 
 
 if __name__ == '__main__':
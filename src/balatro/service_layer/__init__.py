@@ -1,10 +1,14 @@
 # Service layer - use cases and orchestration
 from .analytics import AnalyticsService
+from .async_farming import AsyncFarmingService
 from .farming import FarmingService
+from .report import ReportService
 from .scanning import ScanService
 
 __all__ = [
     'FarmingService',
+    'AsyncFarmingService',
     'ScanService',
     'AnalyticsService',
+    'ReportService',
 ]
@@ -4,11 +4,44 @@ Analytics service for processing automation logs.
 Parses log files and calculates statistics for farming sessions.
 """
 
+import io
+import mmap
+import os
 import re
+import sys
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, TextIO
+
+from ..adapters.clock import SystemClock
+from ..adapters.event_log import read_events
+from ..adapters.log_archive import is_compressed, open_log
+from ..adapters.log_index import (
+    GroupRate,
+    SessionBatch,
+    SessionRow,
+    SqliteLogIndex,
+)
+from ..adapters.ports import AbstractClockPort, AbstractLogTailPort
+from ..domain.decisions import TagPredicate
+from ..domain.events import (
+    DecisionMade,
+    DomainEvent,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+    SoulFound,
+)
+from ..domain.statistics import LiveStatistics
+
+# Logs are read in windows of this many bytes (plus the rest of a line)
+WINDOW_BYTES = 16 * 1024 * 1024
+# Below this size a process pool costs more than it saves
+MIN_PARALLEL_BYTES = 64 * 1024 * 1024
 
 
 @dataclass
@@ -24,6 +57,670 @@ class FarmingStatistics:
     resets_per_hour: float = 0.0
     avg_reset_time: float = 0.0
     souls_per_hour: float = 0.0
+    # First and last log timestamp ('YYYY-MM-DD HH:MM:SS,mmm')
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+    @classmethod
+    def from_totals(
+        cls,
+        *,
+        total_doubles: int,
+        total_charms: int,
+        total_souls: int,
+        new_game_count: int,
+        duration_seconds: float,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> 'FarmingStatistics':
+        """Build statistics from counters, deriving the rates."""
+        hours, remainder = divmod(int(duration_seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        # Calculate derived metrics
+        resets_per_hour = 0.0
+        avg_reset_time = 0.0
+        souls_per_hour = 0.0
+
+        if duration_seconds > 0:
+            resets_per_hour = new_game_count / (duration_seconds / 3600)
+            souls_per_hour = total_souls / (duration_seconds / 3600)
+
+            if new_game_count > 0:
+                avg_reset_time = duration_seconds / new_game_count
+
+        return cls(
+            total_doubles=total_doubles,
+            total_charms=total_charms,
+            total_souls=total_souls,
+            new_game_count=new_game_count,
+            duration_seconds=duration_seconds,
+            run_time_str=f'{hours}h {minutes}m {seconds}s',
+            resets_per_hour=resets_per_hour,
+            avg_reset_time=avg_reset_time,
+            souls_per_hour=souls_per_hour,
+            start=start,
+            end=end,
+        )
+
+
+def merge_statistics(
+    sessions: Iterable[FarmingStatistics],
+) -> FarmingStatistics:
+    """
+    Combine the statistics of separate sessions.
+
+    Counters and durations are summed, so idle time between sessions
+    does not dilute the rates.
+
+    Args:
+        sessions: Statistics of individual sessions.
+
+    Returns:
+        Aggregate statistics spanning the earliest start to latest end.
+    """
+    sessions = list(sessions)
+    starts = [s.start for s in sessions if s.start is not None]
+    ends = [s.end for s in sessions if s.end is not None]
+    return FarmingStatistics.from_totals(
+        total_doubles=sum(s.total_doubles for s in sessions),
+        total_charms=sum(s.total_charms for s in sessions),
+        total_souls=sum(s.total_souls for s in sessions),
+        new_game_count=sum(s.new_game_count for s in sessions),
+        duration_seconds=sum(s.duration_seconds for s in sessions),
+        start=min(starts, default=None),
+        end=max(ends, default=None),
+    )
+
+
+class StatisticsAccumulator:
+    """
+    Incrementally computes FarmingStatistics from log lines.
+
+    Memory use is constant: only counters and the earliest and latest
+    timestamp are kept, so logs of any size can be streamed through it.
+    """
+
+    # Matches the asctime prefix written by logging (ASCII digits only)
+    TIME_RE = re.compile(
+        r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}', re.ASCII
+    )
+    # All counted events in one alternation
+    EVENT_RE = re.compile(
+        r'DECISION: Skip for (?:double and charm|charm and charm'
+        r'|charm \(slot 1\)|charm \(slot 2\)|double/charm and charm)'
+        r'|Selecting SOUL card'
+        r'|ACTION: New Game Started'
+    )
+    # Decision text -> (priority, doubles, charms); one decision per line
+    DECISIONS = {
+        'DECISION: Skip for double and charm': (0, 1, 1),
+        'DECISION: Skip for charm and charm': (1, 0, 2),
+        'DECISION: Skip for charm (slot 1)': (2, 0, 1),
+        'DECISION: Skip for charm (slot 2)': (3, 0, 1),
+        # Older logs did not name the slot 1 tag; only the charm is certain
+        'DECISION: Skip for double/charm and charm': (4, 0, 1),
+    }
+    SOUL_EVENT = 'Selecting SOUL card'
+    NEW_GAME_EVENT = 'ACTION: New Game Started'
+
+    def __init__(self):
+        self.total_doubles = 0
+        self.total_charms = 0
+        self.total_souls = 0
+        self.new_game_count = 0
+        self.lines = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        # Last validated 'YYYY-MM-DD HH:MM:SS' prefix and its validity
+        self._second = ''
+        self._second_valid = False
+
+    def feed(self, line: str) -> None:
+        """Account for one log line."""
+        if not line.isspace():
+            self.lines += 1
+
+        time_match = self.TIME_RE.search(line)
+        if time_match:
+            self._add_timestamp(time_match.group())
+
+        decision = None
+        for event in self.EVENT_RE.findall(line):
+            if event == self.NEW_GAME_EVENT:
+                self.new_game_count += 1
+            elif event == self.SOUL_EVENT:
+                self.total_souls += 1
+            else:
+                counts = self.DECISIONS[event]
+                if decision is None or counts < decision:
+                    decision = counts
+        if decision is not None:
+            self.total_doubles += decision[1]
+            self.total_charms += decision[2]
+
+    def feed_lines(self, lines: Iterable[str]) -> 'StatisticsAccumulator':
+        """Account for many log lines; returns self for chaining."""
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def _add_timestamp(self, stamp: str) -> None:
+        """Track the earliest and latest valid timestamp."""
+        second = stamp[:19]
+        if second != self._second:
+            self._second = second
+            try:
+                _parse_timestamp(stamp)
+                self._second_valid = True
+            except ValueError:
+                self._second_valid = False
+        if not self._second_valid:
+            return
+
+        # Fixed-width ASCII timestamps sort chronologically as strings
+        if self.first_timestamp is None or stamp < self.first_timestamp:
+            self.first_timestamp = stamp
+        if self.last_timestamp is None or stamp > self.last_timestamp:
+            self.last_timestamp = stamp
+
+    def result(self) -> FarmingStatistics:
+        """Statistics for all lines fed so far."""
+        duration_seconds = 0.0
+        if self.first_timestamp is not None:
+            duration = _parse_timestamp(
+                self.last_timestamp
+            ) - _parse_timestamp(self.first_timestamp)
+            duration_seconds = duration.total_seconds()
+
+        return FarmingStatistics.from_totals(
+            total_doubles=self.total_doubles,
+            total_charms=self.total_charms,
+            total_souls=self.total_souls,
+            new_game_count=self.new_game_count,
+            duration_seconds=duration_seconds,
+            start=self.first_timestamp,
+            end=self.last_timestamp,
+        )
+
+
+def _parse_timestamp(stamp: str) -> datetime:
+    """
+    Parse a 'YYYY-MM-DD HH:MM:SS,mmm' timestamp by fixed offsets.
+
+    Raises:
+        ValueError: If a field is out of range.
+    """
+    return datetime(
+        int(stamp[0:4]),
+        int(stamp[5:7]),
+        int(stamp[8:10]),
+        int(stamp[11:13]),
+        int(stamp[14:16]),
+        int(stamp[17:19]),
+        int(stamp[20:23]) * 1000,
+    )
+
+
+class ByteStatisticsAccumulator(StatisticsAccumulator):
+    """
+    Accumulator over raw log bytes, without decoding.
+
+    Blocks of whole lines are scanned in C: literal events are counted
+    with ``bytes.count`` and the regexes start with a literal (newline or
+    'DECISION'), which lets the regex engine skip ahead. Only decisions
+    are visited in Python. Timestamps are taken from the start of lines
+    (the logging asctime prefix). Partial results of separate chunks of
+    a log are combined with merge().
+    """
+
+    STAMP = rb'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3})'
+    TIME_RE = re.compile(STAMP, re.ASCII)
+    LINE_TIME_RE = re.compile(rb'\n' + STAMP, re.ASCII)
+    DECISION_RE = re.compile(
+        rb'DECISION: Skip for (?:double and charm|charm and charm'
+        rb'|charm \(slot 1\)|charm \(slot 2\)|double/charm and charm)'
+    )
+    # Whitespace-only line after a newline (first line checked apart)
+    BLANK_LINE_RE = re.compile(rb'\n[ \t\r\x0b\x0c]*(?=\n)')
+    DECISIONS = {
+        text.encode(): counts
+        for text, counts in StatisticsAccumulator.DECISIONS.items()
+    }
+    SOUL_EVENT = StatisticsAccumulator.SOUL_EVENT.encode()
+    NEW_GAME_EVENT = StatisticsAccumulator.NEW_GAME_EVENT.encode()
+
+    def feed_bytes(self, data: bytes) -> None:
+        """
+        Account for a block of whole lines.
+
+        Args:
+            data: Lines starting at a line start; a missing final newline
+                is only allowed at the end of the log.
+        """
+        if not data:
+            return
+        newlines = data.count(b'\n')
+        blank = len(self.BLANK_LINE_RE.findall(data))
+        if newlines:
+            blank += data[: data.find(b'\n') + 1].isspace()
+        tail = data[data.rfind(b'\n') + 1 :]
+        self.lines += newlines + bool(tail) - blank - tail.isspace()
+
+        stamps = self.LINE_TIME_RE.findall(data)
+        match = self.TIME_RE.match(data)
+        if match:
+            stamps.append(match.group())
+        if stamps:
+            self._add_stamps(stamps)
+
+        self.new_game_count += data.count(self.NEW_GAME_EVENT)
+        self.total_souls += data.count(self.SOUL_EVENT)
+
+        line_start = None
+        decision = None
+        for match in self.DECISION_RE.finditer(data):
+            # Several decisions on one line count as the first rule
+            start = data.rfind(b'\n', 0, match.start()) + 1
+            text = match.group()
+            if start != line_start:
+                self._add_decision(data, line_start, decision)
+                line_start, decision = start, text
+            elif self.DECISIONS[text] < self.DECISIONS[decision]:
+                decision = text
+        self._add_decision(data, line_start, decision)
+
+    def _add_decision(
+        self, data: bytes, line_start: int, text: Optional[bytes]
+    ) -> None:
+        """Count the decision of the line starting at line_start."""
+        if text is not None:
+            counts = self.DECISIONS[text]
+            self.total_doubles += counts[1]
+            self.total_charms += counts[2]
+
+    def _add_stamps(self, stamps: list[bytes]) -> None:
+        """Track the earliest and latest valid of a block's timestamps."""
+        earliest, latest = min(stamps), max(stamps)
+        if not (_is_valid_stamp(earliest) and _is_valid_stamp(latest)):
+            # Rare: walk in from both ends past invalid dates
+            ordered = sorted(set(stamps))
+            earliest = next(filter(_is_valid_stamp, ordered), None)
+            if earliest is None:
+                return
+            latest = next(filter(_is_valid_stamp, reversed(ordered)))
+
+        earliest, latest = earliest.decode(), latest.decode()
+        if self.first_timestamp is None or earliest < self.first_timestamp:
+            self.first_timestamp = earliest
+        if self.last_timestamp is None or latest > self.last_timestamp:
+            self.last_timestamp = latest
+
+    def merge(
+        self, other: 'ByteStatisticsAccumulator'
+    ) -> 'ByteStatisticsAccumulator':
+        """Combine with the result of another chunk; returns self."""
+        self.total_doubles += other.total_doubles
+        self.total_charms += other.total_charms
+        self.total_souls += other.total_souls
+        self.new_game_count += other.new_game_count
+        self.lines += other.lines
+        firsts = [self.first_timestamp, other.first_timestamp]
+        lasts = [self.last_timestamp, other.last_timestamp]
+        self.first_timestamp = min(filter(None, firsts), default=None)
+        self.last_timestamp = max(filter(None, lasts), default=None)
+        return self
+
+
+def _is_valid_stamp(stamp: bytes) -> bool:
+    try:
+        _parse_timestamp(stamp.decode())
+    except ValueError:
+        return False
+    return True
+
+
+def parse_log_range(
+    path: Path,
+    start: int,
+    end: int,
+    accumulator_type: type[ByteStatisticsAccumulator] = (
+        ByteStatisticsAccumulator
+    ),
+) -> ByteStatisticsAccumulator:
+    """
+    Parse a byte range of a log through a memory map.
+
+    Top-level so process pools can pickle it. The range is read in
+    windows of whole lines, so memory stays bounded by WINDOW_BYTES
+    (plus the index rows of an IndexingAccumulator).
+
+    Args:
+        path: Log file.
+        start: Offset of a line start.
+        end: Offset just past a newline, or the file size.
+        accumulator_type: Accumulator class to feed.
+
+    Returns:
+        Partial statistics of the range.
+    """
+    accumulator = accumulator_type()
+    if start >= end:
+        return accumulator
+    with (
+        path.open('rb') as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # Pages already scanned can be dropped early under pressure
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        position = start
+        while position < end:
+            stop = _line_boundary(mapped, position + WINDOW_BYTES, end)
+            accumulator.feed_bytes(mapped[position:stop])
+            position = stop
+    return accumulator
+
+
+def parse_log_stream(stream: BinaryIO) -> ByteStatisticsAccumulator:
+    """
+    Parse a binary log stream, e.g. a decompressing reader.
+
+    The stream is read in windows of WINDOW_BYTES cut at the last
+    newline, so memory stays bounded.
+
+    Args:
+        stream: Log opened for binary reading.
+
+    Returns:
+        Statistics of the whole stream.
+    """
+    accumulator = ByteStatisticsAccumulator()
+    _, rest = feed_complete_lines(stream, accumulator)
+    accumulator.feed_bytes(rest)
+    return accumulator
+
+
+def feed_complete_lines(
+    stream: BinaryIO, accumulator: ByteStatisticsAccumulator
+) -> tuple[int, bytes]:
+    """
+    Feed the complete lines of a binary stream to an accumulator.
+
+    Args:
+        stream: Stream positioned at a line start.
+        accumulator: Accumulator to feed.
+
+    Returns:
+        Number of bytes fed and the unterminated last line, if any.
+    """
+    fed = 0
+    rest = b''
+    while block := stream.read(WINDOW_BYTES):
+        block = rest + block
+        cut = block.rfind(b'\n') + 1
+        accumulator.feed_bytes(block[:cut])
+        fed += cut
+        rest = block[cut:]
+    return fed, rest
+
+
+def _line_boundary(mapped: mmap.mmap, offset: int, end: int) -> int:
+    """First line start at or after offset, capped at end."""
+    if offset <= 0:
+        return 0
+    if offset >= end:
+        return end
+    newline = mapped.find(b'\n', offset - 1, end)
+    return end if newline == -1 else newline + 1
+
+
+def split_log(
+    path: Path, chunks: int, start: int = 0, end: Optional[int] = None
+) -> list[tuple[int, int]]:
+    """
+    Split a log into about equal byte ranges at newline boundaries.
+
+    Args:
+        path: Log file.
+        chunks: Number of ranges wanted.
+        start: Offset of a line start to split from.
+        end: Offset to split up to (the file size if omitted).
+
+    Returns:
+        Consecutive (start, end) ranges covering [start, end).
+    """
+    end = path.stat().st_size if end is None else end
+    if end <= start:
+        return []
+    size = end - start
+    with (
+        path.open('rb') as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        bounds = sorted(
+            {start, end}
+            | {
+                _line_boundary(mapped, start + size * i // chunks, end)
+                for i in range(1, chunks)
+            }
+        )
+    return list(zip(bounds, bounds[1:]))
+
+
+def complete_lines_end(path: Path, start: int) -> int:
+    """Offset just past the last newline after start (start if none)."""
+    size = path.stat().st_size
+    if size <= start:
+        return start
+    with (
+        path.open('rb') as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        return mapped.rfind(b'\n', start, size) + 1 or start
+
+
+class IndexingAccumulator(ByteStatisticsAccumulator):
+    """
+    Byte accumulator that also collects the rows of the log index.
+
+    Keeps every iteration start and decision, so memory grows with the
+    batch; used for the bytes appended since the last indexing pass.
+    Chunks merged in log order keep the rows in log order.
+    """
+
+    PROFILE_RE = re.compile(rb'Using Profile: ([^\n]+)')
+    DELAYS_RE = re.compile(rb'TIMING: starting delays ([^\n]+)')
+    NEW_GAME_RE = re.compile(
+        re.escape(ByteStatisticsAccumulator.NEW_GAME_EVENT)
+    )
+    DECISION_KINDS = {
+        b'DECISION: Skip for double and charm': 'double_and_charm',
+        b'DECISION: Skip for charm and charm': 'charm_and_charm',
+        b'DECISION: Skip for charm (slot 1)': 'charm_slot_1',
+        b'DECISION: Skip for charm (slot 2)': 'charm_slot_2',
+        b'DECISION: Skip for double/charm and charm': 'either_and_charm',
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.profile: Optional[str] = None
+        self.delays: Optional[str] = None
+        self.iterations: list[Optional[str]] = []
+        self.decisions: list[tuple[Optional[str], str]] = []
+        # 'YYYY-MM-DD HH:MM:SS' prefix -> whether it is a valid date
+        self._valid_seconds: dict[bytes, bool] = {}
+
+    def feed_bytes(self, data: bytes) -> None:
+        """Account for a block of whole lines and collect its rows."""
+        super().feed_bytes(data)
+        for match in self.NEW_GAME_RE.finditer(data):
+            self.iterations.append(self._line_time(data, match.start()))
+        if self.profile is None:
+            self.profile = self._setting(self.PROFILE_RE, data)
+        if self.delays is None:
+            self.delays = self._setting(self.DELAYS_RE, data)
+
+    def _add_decision(
+        self, data: bytes, line_start: int, text: Optional[bytes]
+    ) -> None:
+        super()._add_decision(data, line_start, text)
+        if text is not None:
+            at = self._line_time(data, line_start)
+            self.decisions.append((at, self.DECISION_KINDS[text]))
+
+    def _line_time(self, data: bytes, position: int) -> Optional[str]:
+        """Valid timestamp of the line containing position, if any."""
+        start = data.rfind(b'\n', 0, position) + 1
+        end = data.find(b'\n', position)
+        match = self.TIME_RE.search(data, start, len(data) if end < 0 else end)
+        if match is None:
+            return None
+        stamp = match.group()
+        valid = self._valid_seconds.get(stamp[:19])
+        if valid is None:
+            valid = self._valid_seconds[stamp[:19]] = _is_valid_stamp(stamp)
+        return stamp.decode() if valid else None
+
+    @staticmethod
+    def _setting(pattern: re.Pattern, data: bytes) -> Optional[str]:
+        match = pattern.search(data)
+        if match is None:
+            return None
+        return match.group(1).decode('utf-8', 'replace').strip()
+
+    def merge(self, other: 'IndexingAccumulator') -> 'IndexingAccumulator':
+        """Combine with the result of the following chunk; returns self."""
+        super().merge(other)
+        self.profile = self.profile or other.profile
+        self.delays = self.delays or other.delays
+        self.iterations.extend(other.iterations)
+        self.decisions.extend(other.decisions)
+        return self
+
+
+class EventStatisticsAccumulator:
+    """
+    Computes FarmingStatistics from domain events.
+
+    Counts come straight from typed events. Durations use the monotonic
+    event timestamps; each SessionStarted begins a new clock segment
+    (a new process) and anchors it to wall time for start/end.
+    """
+
+    def __init__(self):
+        self.total_doubles = 0
+        self.total_charms = 0
+        self.total_souls = 0
+        self.new_game_count = 0
+        self.events = 0
+        # Scans that checked each tag, and that found it; a tag a lazy
+        # scan left unprobed (None) counts toward neither
+        self.tag_probes = dict.fromkeys(TagPredicate, 0)
+        self.tag_hits = dict.fromkeys(TagPredicate, 0)
+        self.start: Optional[str] = None
+        self.end: Optional[str] = None
+        self._closed_seconds = 0.0
+        self._first_at: Optional[float] = None
+        self._last_at: Optional[float] = None
+        # (monotonic, wall) time of the current segment's SessionStarted
+        self._anchor: Optional[tuple[float, float]] = None
+
+    def feed(self, event: DomainEvent) -> None:
+        """Account for one event."""
+        self.events += 1
+        if isinstance(event, SessionStarted):
+            self._close_segment()
+            self._anchor = (event.at, event.wall_time)
+        elif isinstance(event, DecisionMade):
+            self.total_doubles += event.doubles
+            self.total_charms += event.charms
+        elif isinstance(event, NewGameStarted):
+            self.new_game_count += 1
+        elif isinstance(event, SoulFound):
+            self.total_souls += 1
+        elif isinstance(event, ScanCompleted):
+            for predicate in TagPredicate:
+                found = getattr(event, _scan_field(predicate))
+                if found is not None:
+                    self.tag_probes[predicate] += 1
+                    self.tag_hits[predicate] += found
+
+        if self._first_at is None or event.at < self._first_at:
+            self._first_at = event.at
+        if self._last_at is None or event.at > self._last_at:
+            self._last_at = event.at
+
+    def feed_events(
+        self, events: Iterable[DomainEvent]
+    ) -> 'EventStatisticsAccumulator':
+        """Account for many events; returns self for chaining."""
+        for event in events:
+            self.feed(event)
+        return self
+
+    def tag_rates(self) -> dict[TagPredicate, Optional[float]]:
+        """
+        Share of the scans checking each tag that found it.
+
+        Returns:
+            The rate per tag, or None if no scan checked the tag.
+        """
+        return {
+            predicate: (
+                self.tag_hits[predicate] / probes
+                if (probes := self.tag_probes[predicate])
+                else None
+            )
+            for predicate in TagPredicate
+        }
+
+    def _open_segment(self) -> tuple[float, Optional[str], Optional[str]]:
+        """Duration and wall-time bounds of the current segment."""
+        if self._first_at is None:
+            return 0.0, None, None
+        seconds = self._last_at - self._first_at
+        if self._anchor is None:
+            return seconds, None, None
+        at, wall = self._anchor
+        return (
+            seconds,
+            _format_wall_time(wall + self._first_at - at),
+            _format_wall_time(wall + self._last_at - at),
+        )
+
+    def _close_segment(self) -> None:
+        """Fold the current clock segment into the totals."""
+        seconds, first, last = self._open_segment()
+        self._closed_seconds += seconds
+        self.start = min(filter(None, (self.start, first)), default=None)
+        self.end = max(filter(None, (self.end, last)), default=None)
+        self._first_at = self._last_at = None
+        self._anchor = None
+
+    def result(self) -> FarmingStatistics:
+        """Statistics for all events fed so far."""
+        seconds, first, last = self._open_segment()
+        return FarmingStatistics.from_totals(
+            total_doubles=self.total_doubles,
+            total_charms=self.total_charms,
+            total_souls=self.total_souls,
+            new_game_count=self.new_game_count,
+            duration_seconds=self._closed_seconds + seconds,
+            start=min(filter(None, (self.start, first)), default=None),
+            end=max(filter(None, (self.end, last)), default=None),
+        )
+
+
+def _scan_field(predicate: TagPredicate) -> str:
+    """Name of a tag predicate's field on ScanCompleted."""
+    return predicate.field_name.removeprefix('has_')
+
+
+def _format_wall_time(seconds: float) -> str:
+    """Format epoch seconds like the log's asctime."""
+    moment = datetime.fromtimestamp(seconds)
+    return moment.strftime('%Y-%m-%d %H:%M:%S,') + f'{moment:%f}'[:3]
 
 
 class AnalyticsService:
@@ -31,14 +728,21 @@ class AnalyticsService:
     Service for analyzing automation logs and generating statistics.
     """
 
-    # Regex patterns for log parsing
-    TIME_PATTERN = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3})'
-    DECISION_DOUBLE_CHARM = r'DECISION: Skip for double and charm'
-    DECISION_CHARM_CHARM = r'DECISION: Skip for charm and charm'
-    DECISION_CHARM_SLOT1 = r'DECISION: Skip for charm \(slot 1\)'
-    DECISION_CHARM_SLOT2 = r'DECISION: Skip for charm \(slot 2\)'
-    SOUL_ACTION = r'Selecting SOUL card'
-    NEW_GAME_ACTION = r'ACTION: New Game Started'
+    def __init__(
+        self,
+        index: Optional[SqliteLogIndex] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            index: Log index to ingest into and read statistics from.
+            workers: Parser processes for large logs (CPU count if
+                omitted, 1 to parse in this process).
+        """
+        self.index = index
+        self.workers = workers
 
     def parse_log(self, log_text: str) -> FarmingStatistics:
         """
@@ -50,78 +754,76 @@ class AnalyticsService:
         Returns:
             FarmingStatistics object with calculated metrics.
         """
-        total_doubles = 0
-        total_charms = 0
-        total_souls = 0
-        new_game_count = 0
-        timestamps: list[datetime] = []
+        return self.parse_stream(io.StringIO(log_text))
 
-        lines = log_text.strip().split('\n')
+    def parse_stream(self, stream: TextIO) -> FarmingStatistics:
+        """
+        Parse a log line by line in constant memory.
 
-        for line in lines:
-            # Extract timestamp
-            time_match = re.search(self.TIME_PATTERN, line)
-            if time_match:
-                try:
-                    timestamps.append(
-                        datetime.strptime(
-                            time_match.group(1), '%Y-%m-%d %H:%M:%S,%f'
-                        )
-                    )
-                except ValueError:
-                    pass
-
-            # Count decisions
-            if re.search(self.DECISION_DOUBLE_CHARM, line):
-                total_doubles += 1
-                total_charms += 1
-            elif re.search(self.DECISION_CHARM_CHARM, line):
-                total_charms += 2
-            elif re.search(self.DECISION_CHARM_SLOT1, line):
-                total_charms += 1
-            elif re.search(self.DECISION_CHARM_SLOT2, line):
-                total_charms += 1
-
-            # Count souls
-            total_souls += len(re.findall(self.SOUL_ACTION, line))
-
-            # Count new games
-            new_game_count += len(re.findall(self.NEW_GAME_ACTION, line))
-
-        # Calculate duration
-        duration_seconds = 0.0
-        run_time_str = '0h 0m 0s'
-        if timestamps:
-            duration = max(timestamps) - min(timestamps)
-            duration_seconds = duration.total_seconds()
-            hours, remainder = divmod(int(duration_seconds), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            run_time_str = f'{hours}h {minutes}m {seconds}s'
+        Args:
+            stream: Text file object (or any iterable of lines).
 
-        # Calculate derived metrics
-        resets_per_hour = 0.0
-        avg_reset_time = 0.0
-        souls_per_hour = 0.0
+        Returns:
+            FarmingStatistics object with calculated metrics.
+        """
+        return StatisticsAccumulator().feed_lines(stream).result()
 
-        if duration_seconds > 0:
-            resets_per_hour = new_game_count / (duration_seconds / 3600)
-            souls_per_hour = total_souls / (duration_seconds / 3600)
+    def parse_file(
+        self, log_path: Path, workers: Optional[int] = None
+    ) -> ByteStatisticsAccumulator:
+        """
+        Parse a log file through a memory map, in parallel if large.
 
-            if new_game_count > 0:
-                avg_reset_time = duration_seconds / new_game_count
+        Logs of at least MIN_PARALLEL_BYTES are split at newlines into
+        chunks that worker processes parse; their partial statistics are
+        merged. Compressed logs are decompressed while streaming, in this
+        process.
 
-        return FarmingStatistics(
-            total_doubles=total_doubles,
-            total_charms=total_charms,
-            total_souls=total_souls,
-            new_game_count=new_game_count,
-            duration_seconds=duration_seconds,
-            run_time_str=run_time_str,
-            resets_per_hour=resets_per_hour,
-            avg_reset_time=avg_reset_time,
-            souls_per_hour=souls_per_hour,
+        Args:
+            log_path: Log file.
+            workers: Process pool size (the service's workers if
+                omitted).
+
+        Returns:
+            Accumulated statistics of the whole log.
+        """
+        if is_compressed(log_path):
+            with open_log(log_path) as stream:
+                return parse_log_stream(stream)
+
+        size = log_path.stat().st_size
+        return self._parse_range(
+            log_path, 0, size, ByteStatisticsAccumulator, workers
         )
 
+    def _parse_range(
+        self,
+        log_path: Path,
+        start: int,
+        end: int,
+        accumulator_type: type[ByteStatisticsAccumulator],
+        workers: Optional[int] = None,
+    ) -> ByteStatisticsAccumulator:
+        """Parse [start, end) of a plain log, in parallel if large."""
+        workers = workers or self.workers or os.cpu_count() or 1
+        if workers == 1 or end - start < MIN_PARALLEL_BYTES:
+            return parse_log_range(log_path, start, end, accumulator_type)
+
+        # More chunks than workers evens out uneven chunk costs
+        ranges = split_log(log_path, workers * 4, start, end)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = pool.map(
+                parse_log_range,
+                [log_path] * len(ranges),
+                *zip(*ranges),
+                [accumulator_type] * len(ranges),
+            )
+            accumulator = accumulator_type()
+            # map() yields in submission order, keeping index rows ordered
+            for partial in partials:
+                accumulator.merge(partial)
+        return accumulator
+
     def display_statistics(self, stats: FarmingStatistics) -> None:
         """
         Display statistics to stdout.
@@ -143,6 +845,119 @@ class AnalyticsService:
         print(f'Souls per Hour:        {stats.souls_per_hour:.2f}')
         print('-' * 40)
 
+    def live_statistics(
+        self, stats: LiveStatistics, now: float
+    ) -> FarmingStatistics:
+        """
+        Session statistics from the in-process accumulator.
+
+        Args:
+            stats: Live statistics of the running session.
+            now: Current clock time.
+
+        Returns:
+            FarmingStatistics over the active (unpaused) time.
+        """
+        return FarmingStatistics.from_totals(
+            total_doubles=stats.doubles,
+            total_charms=stats.charms,
+            total_souls=stats.souls,
+            new_game_count=stats.resets,
+            duration_seconds=stats.active_time(now),
+        )
+
+    def display_live(self, stats: LiveStatistics, now: float) -> None:
+        """
+        Display session, rolling and iteration statistics to stdout.
+
+        Args:
+            stats: Live statistics of the session.
+            now: Current clock time.
+        """
+        self.display_statistics(self.live_statistics(stats, now))
+        minutes = stats.window / 60
+        print(f'Last {minutes:.0f} Active Minutes:')
+        print(f'  Resets per Hour:     {stats.resets_per_hour(now):.2f}')
+        print(f'  Souls per Hour:      {stats.souls_per_hour(now):.2f}')
+        print('-' * 40)
+        if not stats.iterations:
+            return
+        print(
+            f'Iterations: {stats.iterations} '
+            f'(avg {stats.average_iteration:.2f}s)'
+        )
+        lower = 0.0
+        for bound, count in stats.histogram_rows():
+            if count:
+                if bound is None:
+                    label = f'>{lower:g}s'
+                else:
+                    label = f'{lower:g}-{bound:g}s'
+                print(f'  {label:>10} {count:>6}')
+            lower = bound
+        print('-' * 40)
+
+    def format_live(self, stats: FarmingStatistics) -> str:
+        """
+        One-line summary for refreshing in place.
+
+        Args:
+            stats: The statistics so far.
+        """
+        return (
+            f'{stats.run_time_str} | '
+            f'Resets: {stats.new_game_count} '
+            f'({stats.resets_per_hour:.1f}/h) | '
+            f'Souls: {stats.total_souls} ({stats.souls_per_hour:.2f}/h)'
+        )
+
+    def follow(
+        self,
+        tailer: AbstractLogTailPort,
+        clock: Optional[AbstractClockPort] = None,
+        interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+        output: Optional[TextIO] = None,
+    ) -> Optional[FarmingStatistics]:
+        """
+        Follow the current log and refresh its statistics in place.
+
+        Only newly appended lines are parsed on each refresh; statistics
+        restart when the tailer moves on to a new session log.
+
+        Args:
+            tailer: Source of appended log lines.
+            clock: Clock for waiting between refreshes.
+            interval: Seconds between refreshes.
+            stop: Event that ends following when set.
+            output: Stream to render to (stdout by default).
+
+        Returns:
+            Statistics of the followed session when stopped.
+        """
+        clock = clock or SystemClock()
+        stop = stop or threading.Event()
+        output = output or sys.stdout
+        accumulator = StatisticsAccumulator()
+        path = None
+
+        while True:
+            lines = tailer.poll()
+            if tailer.path != path:
+                path = tailer.path
+                accumulator = StatisticsAccumulator()
+                output.write(f'\nFollowing {path}\n')
+            accumulator.feed_lines(lines)
+            if path is not None:
+                stats = accumulator.result()
+                output.write(f'\r\x1b[2K{self.format_live(stats)}')
+                output.flush()
+            if clock.wait(stop, interval):
+                break
+
+        output.write('\n')
+        return accumulator.result() if path is not None else None
+
     def process_log_file(self, log_path: Path) -> Optional[FarmingStatistics]:
         """
         Process a log file and display statistics.
@@ -157,15 +972,186 @@ class AnalyticsService:
             print(f'Log file not found: {log_path}')
             return None
 
-        content = log_path.read_text(encoding='utf-8')
-        if not content.strip():
+        if self.index is not None:
+            session = self.index_log(log_path)
+            lines = session.lines
+            stats = self.session_statistics(session)
+        else:
+            accumulator = self.parse_file(log_path)
+            lines = accumulator.lines
+            stats = accumulator.result()
+        if not lines:
             print('Log file is empty.')
             return None
 
-        stats = self.parse_log(content)
         self.display_statistics(stats)
         return stats
 
+    def parse_events(self, events: Iterable[DomainEvent]) -> FarmingStatistics:
+        """
+        Calculate statistics from domain events.
+
+        Args:
+            events: Events of one or more sessions.
+
+        Returns:
+            FarmingStatistics object with calculated metrics.
+        """
+        return EventStatisticsAccumulator().feed_events(events).result()
+
+    def process_event_file(
+        self, events_path: Path
+    ) -> Optional[FarmingStatistics]:
+        """
+        Process an event file and display statistics.
+
+        Args:
+            events_path: Path to the ``.jsonl`` event file.
+
+        Returns:
+            Statistics if file exists and has events, None otherwise.
+        """
+        if not events_path.exists():
+            print(f'Event file not found: {events_path}')
+            return None
+
+        with events_path.open(encoding='utf-8') as stream:
+            accumulator = EventStatisticsAccumulator().feed_events(
+                read_events(stream)
+            )
+        if not accumulator.events:
+            print('Event file is empty.')
+            return None
+
+        stats = accumulator.result()
+        self.display_statistics(stats)
+        self.display_tag_rates(accumulator)
+        return stats
+
+    def display_tag_rates(
+        self, accumulator: EventStatisticsAccumulator
+    ) -> None:
+        """
+        Display how often each tag was found by the scans checking it.
+
+        Args:
+            accumulator: Event statistics of the session.
+        """
+        print('Tag Rates (of scans checking the tag):')
+        for predicate, rate in accumulator.tag_rates().items():
+            probes = accumulator.tag_probes[predicate]
+            shown = (
+                'not checked' if rate is None else f'{rate:.1%} of {probes}'
+            )
+            print(f'  {predicate.label + ":":<20} {shown}')
+        print('-' * 40)
+
+    def index_log(self, log_path: Path) -> SessionRow:
+        """
+        Ingest the complete lines appended to a log since the last pass.
+
+        A log shorter than its stored offset was truncated or replaced
+        and is indexed again from the start. Offsets count decompressed
+        bytes, so a session keeps its offset when its log is compressed.
+        Plain logs are parsed like parse_file(), in parallel chunks when
+        the new bytes are large.
+
+        Args:
+            log_path: Session log file.
+
+        Returns:
+            The session's indexed totals.
+        """
+        index = self.index
+        offset = index.byte_offset(log_path)
+        if not is_compressed(log_path) and log_path.stat().st_size < offset:
+            index.forget(log_path)
+            offset = 0
+
+        # A trailing partial line is left for the next pass
+        if is_compressed(log_path):
+            accumulator = IndexingAccumulator()
+            with open_log(log_path) as log:
+                log.seek(offset)
+                complete, _ = feed_complete_lines(log, accumulator)
+        else:
+            end = complete_lines_end(log_path, offset)
+            accumulator = self._parse_range(
+                log_path, offset, end, IndexingAccumulator
+            )
+            complete = end - offset
+
+        session = index.session(log_path)
+        starts = [accumulator.first_timestamp, session and session.start]
+        ends = [accumulator.last_timestamp, session and session.end]
+        start = min((s for s in starts if s), default=None)
+        end = max((e for e in ends if e), default=None)
+        duration = 0.0
+        if start is not None:
+            duration = (
+                _parse_timestamp(end) - _parse_timestamp(start)
+            ).total_seconds()
+
+        index.ingest(
+            log_path,
+            SessionBatch(
+                byte_offset=offset + complete,
+                lines=accumulator.lines,
+                profile=accumulator.profile,
+                delays=accumulator.delays,
+                start=start,
+                end=end,
+                doubles=accumulator.total_doubles,
+                charms=accumulator.total_charms,
+                souls=accumulator.total_souls,
+                iterations=accumulator.iterations,
+                decisions=accumulator.decisions,
+            ),
+            duration,
+        )
+        return index.session(log_path)
+
+    def session_statistics(self, session: SessionRow) -> FarmingStatistics:
+        """Statistics of an indexed session."""
+        duration = 0.0
+        if session.start is not None:
+            duration = (
+                _parse_timestamp(session.end) - _parse_timestamp(session.start)
+            ).total_seconds()
+        return FarmingStatistics.from_totals(
+            total_doubles=session.doubles,
+            total_charms=session.charms,
+            total_souls=session.souls,
+            new_game_count=session.new_games,
+            duration_seconds=duration,
+            start=session.start,
+            end=session.end,
+        )
+
+    def display_rates(self, by: str) -> list[GroupRate]:
+        """
+        Display souls and resets per hour of indexed sessions, grouped.
+
+        Args:
+            by: 'profile', 'week' or 'delays'.
+
+        Returns:
+            The displayed groups.
+        """
+        rates = self.index.rates(by)
+        print(f'\n### Souls per Hour by {by.capitalize()} ###')
+        print(
+            f'{by.capitalize():<40}{"Sessions":>9}{"Hours":>9}'
+            f'{"Resets/h":>10}{"Souls":>7}{"Souls/h":>9}'
+        )
+        for rate in rates:
+            print(
+                f'{rate.key:<40}{rate.sessions:>9}{rate.hours:>9.2f}'
+                f'{rate.resets_per_hour:>10.1f}{rate.souls:>7}'
+                f'{rate.souls_per_hour:>9.2f}'
+            )
+        return rates
+
 
 # Backward compatibility functions
 def parse_log_statistics(log_text: str) -> dict:
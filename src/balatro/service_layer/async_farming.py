@@ -0,0 +1,540 @@
+"""
+Asyncio-based farming service.
+
+Mirrors FarmingService on top of async ports: blocking capture and
+matching run in executors, waits use asyncio.sleep, every scan has a
+deadline and pausing cancels the in-progress iteration. Decisions and
+their click sequences are shared with FarmingService; the next run's
+tag scan is started while the reset delay is still being awaited. The
+same domain events, live statistics, stall watchdog and learned delay
+persistence as the blocking service are wired in.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+
+from ..adapters.clock import SystemClock
+from ..adapters.event_log import NullEventLog
+from ..adapters.ports import (
+    AbstractAsyncInputPort,
+    AbstractAsyncScreenPort,
+    AbstractClockPort,
+    AbstractConfigPort,
+    AbstractEventPort,
+)
+from ..domain.decisions import (
+    DecisionContext,
+    FarmingDecision,
+    get_decision_description,
+    tags_taken,
+)
+from ..domain.events import (
+    ActionClicked,
+    DecisionMade,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+    SoulFound,
+)
+from ..domain.exceptions import ScanTimeoutError
+from ..domain.model import Coordinates, GameState, Region, ScanResult
+from ..domain.policy import FarmingPolicy, RuleBasedPolicy
+from ..domain.timing import DelayTuner
+from .farming import (
+    DECISION_PACKS,
+    NEW_GAME_CLICKS,
+    ClickStep,
+    FarmingService,
+    reset_landed,
+    save_learned_delays,
+)
+from .scanning import ScanService
+from .verification import ActionVerifier
+from .watchdog import StallWatchdog
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFarmingService:
+    """
+    Service orchestrating the soul farming loop with asyncio.
+
+    Control methods (start/pause/stop) must be called from the event
+    loop; use ``loop.call_soon_threadsafe`` from other threads.
+    """
+
+    # Timing constants (seconds), shared with the blocking service
+    SOUL_WAIT_TIME = FarmingService.SOUL_WAIT_TIME
+    ACTION_DELAY = FarmingService.ACTION_DELAY
+    CLICK_DELAY = FarmingService.CLICK_DELAY
+    RESET_DELAY = FarmingService.RESET_DELAY
+    SETTLE_CHECK_DELAY = FarmingService.SETTLE_CHECK_DELAY
+    CURSOR_SETTLE_DELAY = 0.1
+    SCAN_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        screen: AbstractAsyncScreenPort,
+        input_adapter: AbstractAsyncInputPort,
+        config: AbstractConfigPort,
+        profile_name: Optional[str] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        *,
+        policy: Optional[FarmingPolicy] = None,
+        clock: Optional[AbstractClockPort] = None,
+        events: Optional[AbstractEventPort] = None,
+    ):
+        """
+        Initialize the async farming service.
+
+        Args:
+            screen: Async screen adapter for capture and matching.
+            input_adapter: Async input adapter for mouse/keyboard.
+            config: Config repository for profile loading.
+            profile_name: Name of profile to use (defaults to current).
+            sleep: Coroutine function used for all waits.
+            policy: Decision policy (defaults to the fixed rule table).
+            clock: Clock timestamping events and statistics (defaults
+                to the system clock); waits use ``sleep``.
+            events: Sink for domain events (discarded if omitted).
+        """
+        self.screen = screen
+        self.input = input_adapter
+        self.config = config
+        self._sleep = sleep
+        self.clock = clock or SystemClock()
+        self.events = events or NullEventLog()
+
+        profile_name = profile_name or config.get_current_profile_name()
+        self.profile = config.load_profile(profile_name)
+        logger.info(f'Using Profile: {self.profile.name}')
+
+        self.state = GameState()
+        self.policy = policy or RuleBasedPolicy()
+        self.timing = DelayTuner.from_baselines(
+            {
+                'action': self.ACTION_DELAY,
+                'click': self.CLICK_DELAY,
+                'reset': self.RESET_DELAY,
+            },
+            learned=self.profile.delays,
+        )
+        self.watchdog = StallWatchdog()
+        self.scan_timeouts = 0
+        self.verify_failures = 0
+        # Post-reset capture and tags of the last run, for the watchdog
+        self._reset_frame: Optional[np.ndarray] = None
+        self._tags_found = False
+        self._active = asyncio.Event()
+        self._iteration: Optional[asyncio.Task] = None
+        # Tag scan of the next run, started during the reset delay
+        self._next_scan: Optional[asyncio.Task] = None
+
+        self.events.emit(
+            SessionStarted(
+                self.clock.now(),
+                time.time(),
+                self.profile.name,
+                self.timing.learned_values(),
+            )
+        )
+
+    # Control plane
+
+    def start(self) -> None:
+        """Resume the farming loop."""
+        self.state.start_farming()
+        self._active.set()
+
+    def pause(self) -> None:
+        """Pause the loop, cancelling the in-progress iteration."""
+        self.state.pause_farming()
+        self.state.stats.pause(self.clock.now())
+        self._active.clear()
+        self._cancel_iteration()
+
+    def stop(self) -> None:
+        """Stop the automation, cancelling the in-progress iteration."""
+        self.state.stop()
+        self.state.stats.pause(self.clock.now())
+        self._active.set()
+        self._cancel_iteration()
+
+    def _cancel_iteration(self) -> None:
+        # A pending scan is stale once the loop pauses
+        for task in (self._iteration, self._next_scan):
+            if task and not task.done():
+                task.cancel()
+        self._next_scan = None
+
+    def metrics(self) -> dict[str, object]:
+        """Get a snapshot of the session for a metrics endpoint."""
+        return {
+            'profile': self.profile.name,
+            'running': self.state.is_running,
+            'farming': self.state.is_farming,
+            'phase': self.state.phase.name,
+            'runs': self.state.current_run,
+            'souls': self.state.souls_found,
+            'scan_timeouts': self.scan_timeouts,
+            'verify_failures': self.verify_failures,
+            'stalls': self.watchdog.stalls,
+            'avg_saved_per_reset': self.timing.average_saved_per_reset,
+        }
+
+    # Scanning
+
+    async def _scan(
+        self, asset_name: str, region: Region, slot: int
+    ) -> list[ScanResult]:
+        """
+        Capture and match one region before the scan deadline.
+
+        Raises:
+            ScanTimeoutError: If capture and matching exceed SCAN_TIMEOUT.
+        """
+        try:
+            async with asyncio.timeout(self.SCAN_TIMEOUT):
+                haystack = await self.screen.capture_region(region)
+                return await self.screen.match_template(
+                    haystack=haystack,
+                    asset_name=asset_name,
+                    slot=slot,
+                    region_offset=Coordinates(region.left, region.top),
+                )
+        except TimeoutError as e:
+            raise ScanTimeoutError(asset_name, self.SCAN_TIMEOUT) from e
+
+    async def _park_cursor(self) -> None:
+        """Move the cursor off the scanned regions and let it settle."""
+        await self.input.move_to(Coordinates(10, 10))
+        await self._sleep(self.CURSOR_SETTLE_DELAY)
+
+    async def _scan_all(
+        self, targets: list[tuple[str, Region, int]], after: float = 0.0
+    ) -> list[list[ScanResult]]:
+        """
+        Scan several regions concurrently; timed-out scans find nothing.
+
+        Args:
+            targets: (asset name, region, slot) of each scan.
+            after: Seconds to wait before capturing; the cursor is parked
+                during the wait rather than after it.
+        """
+        if after:
+            await asyncio.gather(self._sleep(after), self._park_cursor())
+        else:
+            await self._park_cursor()
+
+        results = await asyncio.gather(
+            *(self._scan(*target) for target in targets),
+            return_exceptions=True,
+        )
+        matches: list[list[ScanResult]] = []
+        for result in results:
+            if isinstance(result, ScanTimeoutError):
+                self.scan_timeouts += 1
+                logger.warning(str(result))
+                matches.append([])
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                matches.append(result)
+        return matches
+
+    async def scan_and_decide(self, after: float = 0.0) -> FarmingDecision:
+        """
+        Scan both tag slots concurrently and decide what to do.
+
+        Args:
+            after: Seconds to wait before capturing.
+
+        Returns:
+            The farming decision based on detected tags.
+        """
+        targets = [
+            (asset, roi, slot)
+            for slot, roi_name in ((1, 'skip_slots_1'), (2, 'skip_slots_2'))
+            for roi in self.profile.get_rois(roi_name)
+            for asset in ('double.png', 'charm.png')
+        ]
+        results = await self._scan_all(targets, after)
+
+        double_matches: list[ScanResult] = []
+        charm_matches: list[ScanResult] = []
+        for (asset, _, _), matches in zip(targets, results):
+            if asset == 'double.png':
+                double_matches.extend(matches)
+            else:
+                charm_matches.extend(matches)
+
+        context = DecisionContext.from_scan_results(
+            double_matches, charm_matches
+        )
+        # Every tag is scanned, so none is left unprobed
+        now = self.clock.now()
+        self.events.emit(
+            ScanCompleted(
+                now,
+                context.has_double_slot1,
+                context.has_charm_slot1,
+                context.has_charm_slot2,
+            )
+        )
+        self._tags_found = bool(double_matches or charm_matches)
+
+        decision = self.policy.decide(context)
+        if decision != FarmingDecision.NONE:
+            logger.info(
+                'DECISION: %s', get_decision_description(decision, context)
+            )
+            doubles, charms = tags_taken(decision, context)
+            self.events.emit(DecisionMade(now, decision.name, doubles, charms))
+            self.state.stats.record_decision(doubles, charms)
+        return decision
+
+    async def scan_for_soul(self, after: float = 0.0) -> Optional[ScanResult]:
+        """
+        Scan all soul ROIs concurrently.
+
+        Args:
+            after: Seconds to wait before capturing.
+
+        Returns:
+            The best matching ScanResult if found, None otherwise.
+        """
+        targets = [
+            ('the_soul.png', roi, i + 1)
+            for i, roi in enumerate(self.profile.get_rois('the_soul'))
+        ]
+        results = await self._scan_all(targets, after)
+        matches = [m for result in results for m in result]
+        if not matches:
+            return None
+        return max(matches, key=lambda m: m.confidence)
+
+    # Actions
+
+    async def _confirm(
+        self,
+        name: str,
+        check: Callable[[], Awaitable[bool]],
+        delay: Optional[str],
+    ) -> bool:
+        """
+        Poll a click's postcondition and feed the outcome to its delay.
+
+        Like the timeline clicks of FarmingService the click itself is
+        never repeated; ActionVerifier's timeout and poll interval apply.
+
+        Returns:
+            True if the postcondition held before the timeout.
+        """
+        polls = round(ActionVerifier.TIMEOUT / ActionVerifier.POLL_INTERVAL)
+        verified = await check()
+        for _ in range(polls):
+            if verified:
+                break
+            await self._sleep(ActionVerifier.POLL_INTERVAL)
+            verified = await check()
+
+        if not verified:
+            self.verify_failures += 1
+            logger.warning('VERIFY: %s not confirmed', name)
+        if delay:
+            self.timing.record(delay, verified)
+        return verified
+
+    async def _click_step(self, click: ClickStep) -> bool:
+        """
+        Wait for a click's delay, then click and verify it.
+
+        Returns:
+            True if the action was found, clicked and (if checked)
+            confirmed.
+        """
+        if click.delay:
+            await self._sleep(self.timing.get(click.delay))
+        coords = self.profile.get_action(click.action)
+        if not coords:
+            logger.warning(f"Action '{click.action}' not found in profile")
+            return False
+
+        rois = (
+            self.profile.get_rois(click.verify_roi) if click.verify_roi else []
+        )
+        before = await self.screen.capture_region(rois[0]) if rois else None
+        await self.input.click(coords)
+        logger.info('ACTION: %s', click.action)
+        self.events.emit(ActionClicked(self.clock.now(), click.action))
+        if before is None:
+            return True
+
+        async def changed() -> bool:
+            current = await self.screen.capture_region(rois[0])
+            return ScanService.has_changed(before, current)
+
+        return await self._confirm(click.action, changed, click.delay)
+
+    async def _buy_the_soul(self) -> bool:
+        """Wait for the pack, then find and use The Soul card."""
+        soul_match = await self.scan_for_soul(after=self.SOUL_WAIT_TIME)
+        if not soul_match:
+            return False
+
+        position = soul_match.position.to_tuple()
+        logger.info('Selecting SOUL card at %s', position)
+        now = self.clock.now()
+        self.events.emit(SoulFound(now, *position))
+        self.state.record_soul_found()
+        self.state.stats.record_soul(now)
+
+        await self.input.click(soul_match.position)
+        await self._sleep(self.timing.get('click'))
+        await self.input.click(soul_match.position.offset(0, 100))
+
+        soul_rois = self.profile.get_rois('the_soul')
+        if 0 < soul_match.slot <= len(soul_rois):
+            roi = soul_rois[soul_match.slot - 1]
+
+            async def used() -> bool:
+                try:
+                    return not await self._scan(
+                        'the_soul.png', roi, soul_match.slot
+                    )
+                except ScanTimeoutError:
+                    return False
+
+            await self._confirm('use_soul', used, 'click')
+        await self._sleep(self.timing.get('action'))
+        return True
+
+    async def _execute_decision(self, decision: FarmingDecision) -> None:
+        """Execute the given farming decision."""
+        for clicks in DECISION_PACKS[decision]:
+            for click in clicks:
+                await self._click_step(click)
+            await self._buy_the_soul()
+
+    async def _new_game(self) -> None:
+        """
+        Reset game state and start a new run.
+
+        The next run's tag scan starts alongside the reset delay, while
+        the reset itself is verified.
+        """
+        slot_rois = self.profile.get_rois('skip_slots_1')
+        check_roi = slot_rois[0] if slot_rois else None
+        before = None
+        if check_roi is not None:
+            before = await self.screen.capture_region(check_roi)
+
+        await self.input.press_key('esc')
+        for click in NEW_GAME_CLICKS:
+            await self._click_step(click)
+        await self._sleep(self.timing.get('action'))
+        await self.input.move_to(Coordinates(5, 5))
+
+        reset = self.timing.get('reset')
+        self._next_scan = asyncio.create_task(
+            self.scan_and_decide(after=reset)
+        )
+        await self._sleep(reset)
+        if check_roi is not None:
+            first = await self.screen.capture_region(check_roi)
+            await self._sleep(self.SETTLE_CHECK_DELAY)
+            second = await self.screen.capture_region(check_roi)
+            success = reset_landed(
+                ScanService.has_changed, before, first, second
+            )
+            self.timing.record('action', success)
+            self.timing.record('reset', success)
+            self._reset_frame = second
+
+        self.state.increment_run()
+        self.timing.complete_reset()
+        logger.info('ACTION: New Game Started')
+        now = self.clock.now()
+        self.events.emit(NewGameStarted(now, self.state.current_run))
+        self.state.stats.record_reset(now)
+
+    async def _recover(self) -> None:
+        """Leave any open pack or menu and start a fresh run."""
+        await self._click_step(
+            ClickStep('package_specialized_skip', delay='action')
+        )
+        await self._new_game()
+        logger.info('ACTION: Recovery completed')
+
+    async def run_iteration(self) -> None:
+        """
+        Run a single farming iteration (scan, decide, act, reset).
+
+        Uses the tag scan the previous reset started, if any.
+        """
+        start = self.clock.now()
+        scan, self._next_scan = self._next_scan, None
+        if scan is None:
+            decision = await self.scan_and_decide()
+        else:
+            decision = await scan
+        # The next run's scan overwrites these during the reset
+        tags_found = self._tags_found
+        await self._execute_decision(decision)
+        await self._new_game()
+
+        now = self.clock.now()
+        self.state.stats.record_iteration(now - start)
+        self.events.flush()
+        reason = self.watchdog.observe(self._reset_frame, tags_found, now)
+        if reason:
+            lost = self.watchdog.record_stall(now)
+            logger.warning(
+                f'STALL: {reason}, lost {lost:.1f}s '
+                f'(total {self.watchdog.total_lost:.1f}s); recovering'
+            )
+            # The scan started by the stalled reset is stale
+            if self._next_scan is not None:
+                self._next_scan.cancel()
+                self._next_scan = None
+            await self._recover()
+
+    async def run(self) -> None:
+        """
+        Main farming loop.
+
+        Waits (without polling) until started, and runs iterations until
+        stop() is called. A pause cancels the current iteration. The
+        learned delays are saved when the loop ends.
+        """
+        try:
+            await self._run_loop()
+        finally:
+            self.state.stats.pause(self.clock.now())
+            self.events.flush()
+            self.profile = save_learned_delays(
+                self.config, self.profile, self.timing
+            )
+
+    async def _run_loop(self) -> None:
+        while self.state.is_running:
+            await self._active.wait()
+            if not self.state.is_running:
+                break
+
+            self.state.stats.resume(self.clock.now())
+            self._iteration = asyncio.create_task(self.run_iteration())
+            try:
+                await self._iteration
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+                run = self.state.current_run
+                logger.info('Run %d interrupted mid-iteration', run)
+            finally:
+                self._iteration = None
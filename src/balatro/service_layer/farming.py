@@ -7,25 +7,141 @@ and action execution.
 
 import logging
 import time
-from typing import Optional
+from dataclasses import replace
+from typing import Callable, NamedTuple, Optional
 
+import numpy as np
+
+from ..adapters.clock import SystemClock
+from ..adapters.event_log import NullEventLog
 from ..adapters.ports import (
+    AbstractClockPort,
     AbstractConfigPort,
+    AbstractEventPort,
     AbstractInputPort,
     AbstractScreenPort,
 )
 from ..domain.decisions import (
     DecisionContext,
     FarmingDecision,
-    decide_farming_action,
+    ProbeStatistics,
+    TagPredicate,
+    decide_farming_action_lazily,
     get_decision_description,
+    tags_taken,
+)
+from ..domain.events import (
+    ActionClicked,
+    DecisionMade,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+    SoulFound,
+)
+from ..domain.exceptions import FarmingInterrupted
+from ..domain.model import (
+    Coordinates,
+    GameState,
+    ProfileConfig,
+    Region,
+    ScanResult,
 )
-from ..domain.model import Coordinates, GameState
+from ..domain.policy import FarmingPolicy, RuleBasedPolicy
+from ..domain.timing import DelayTuner
 from .scanning import ScanService
+from .timeline import Timeline, TimelineReport, TimelineScheduler
+from .verification import (
+    ActionVerifier,
+    AssetAbsent,
+    Postcondition,
+    RoiChanged,
+)
+from .watchdog import StallWatchdog
 
 logger = logging.getLogger(__name__)
 
 
+class ClickStep(NamedTuple):
+    """A profile action clicked while executing a decision or reset."""
+
+    action: str
+    # ROI expected to change once the click lands
+    verify_roi: Optional[str] = None
+    # Adaptive delay waited before the click, fed with its verification
+    delay: Optional[str] = None
+
+
+SKIP_SLOT_1 = ClickStep('skip_slot_1', 'skip_slots_1')
+SKIP_SLOT_2 = ClickStep('skip_slot_2', 'skip_slots_2', 'action')
+
+# Clicks of each decision, grouped by the pack each group opens; every
+# pack is checked for The Soul before the next group
+DECISION_PACKS: dict[FarmingDecision, tuple[tuple[ClickStep, ...], ...]] = {
+    FarmingDecision.NONE: (),
+    FarmingDecision.SKIP_SLOT_1: ((SKIP_SLOT_1,),),
+    FarmingDecision.SKIP_SLOT_2: ((SKIP_SLOT_1, SKIP_SLOT_2),),
+    FarmingDecision.SKIP_BOTH_SLOTS: (
+        (SKIP_SLOT_1,),
+        (ClickStep('package_specialized_skip'), SKIP_SLOT_2),
+    ),
+}
+
+# Clicks starting a new run once the menu is open
+NEW_GAME_CLICKS = (
+    ClickStep('new_game_top', delay='action'),
+    ClickStep('new_game_confirm', delay='action'),
+)
+
+
+def reset_landed(
+    has_changed: Callable[[np.ndarray, np.ndarray], bool],
+    before: np.ndarray,
+    first: np.ndarray,
+    second: np.ndarray,
+) -> bool:
+    """
+    Check a reset landed on a new, settled blind selection screen.
+
+    Args:
+        has_changed: Comparison of two captures of the same region.
+        before: Tag slot capture taken before the reset.
+        first: Capture taken after the reset delay.
+        second: Capture taken shortly after ``first``.
+
+    Returns:
+        True if the region changed and is no longer animating.
+    """
+    return has_changed(before, second) and not has_changed(first, second)
+
+
+def save_learned_delays(
+    config: AbstractConfigPort, profile: ProfileConfig, timing: DelayTuner
+) -> ProfileConfig:
+    """
+    Persist learned delays into a profile, logging a failed save.
+
+    Args:
+        config: Config repository the profile is saved to.
+        profile: Active profile.
+        timing: Tuner whose learned delays are kept.
+
+    Returns:
+        The profile with the learned delays.
+    """
+    profile = replace(profile, delays=timing.learned_values())
+    try:
+        config.save_profile(profile)
+    except OSError as e:
+        logger.warning(f'Could not save learned delays: {e}')
+        return profile
+
+    logger.info(
+        f'TIMING: learned delays {profile.delays}, '
+        f'avg saved {timing.average_saved_per_reset:.2f}s per reset'
+    )
+    return profile
+
+
 class FarmingService:
     """
     Service that orchestrates the soul farming automation loop.
@@ -38,7 +154,9 @@ class FarmingService:
     ACTION_DELAY = 0.5
     CLICK_DELAY = 1.5
     RESET_DELAY = 2.0
-    IDLE_SLEEP = 0.1
+    SETTLE_CHECK_DELAY = 0.05
+    # Slice of a paused wait; an untimed lock wait blocks Ctrl+C on Windows
+    PAUSE_POLL_INTERVAL = 0.5
 
     def __init__(
         self,
@@ -46,6 +164,10 @@ class FarmingService:
         input_adapter: AbstractInputPort,
         config: AbstractConfigPort,
         profile_name: Optional[str] = None,
+        *,
+        clock: Optional[AbstractClockPort] = None,
+        policy: Optional[FarmingPolicy] = None,
+        events: Optional[AbstractEventPort] = None,
     ):
         """
         Initialize the farming service.
@@ -55,10 +177,15 @@ class FarmingService:
             input_adapter: Input adapter for mouse/keyboard.
             config: Config repository for profile loading.
             profile_name: Name of profile to use (defaults to current).
+            clock: Clock used for all waits (defaults to the system clock).
+            policy: Decision policy (defaults to the fixed rule table).
+            events: Sink for domain events (discarded if omitted).
         """
         self.screen = screen
         self.input = input_adapter
         self.config = config
+        self.clock = clock or SystemClock()
+        self.events = events or NullEventLog()
 
         # Load profile
         profile_name = profile_name or config.get_current_profile_name()
@@ -66,9 +193,59 @@ class FarmingService:
         logger.info(f'Using Profile: {self.profile.name}')
 
         # Initialize services
-        self.scanner = ScanService(screen, self.input, self.profile)
+        self.scanner = ScanService(
+            screen, self.input, self.profile, self.clock
+        )
         self.state = GameState()
 
+        # Timeline scheduler; warm the template cache during the first wait
+        self.scheduler = TimelineScheduler(
+            self.clock.now, self._sleep, self._check_interrupted
+        )
+        for asset_name in ('double.png', 'charm.png', 'the_soul.png'):
+            self.scheduler.submit(
+                lambda name=asset_name: self.screen.load_asset(name)
+            )
+        self.verifier = ActionVerifier(self.clock.now, self._sleep)
+        self._iteration_reports: list[TimelineReport] = []
+        self._soul_match: Optional[ScanResult] = None
+
+        # Stall detection, fed with the scan and post-reset frame
+        self.watchdog = StallWatchdog()
+        self._last_context: Optional[DecisionContext] = None
+        self._reset_frame: Optional[np.ndarray] = None
+        self._stall_reason: Optional[str] = None
+
+        # Observed tag hit rates and scan costs, ordering lazy scans
+        self.probe_stats = ProbeStatistics()
+
+        # Decision policy, fed with the measured outcome of each iteration
+        self.policy = policy or RuleBasedPolicy()
+        self._packs_checked = 0
+
+        # Adaptive delays, resumed from values learned in earlier sessions
+        self.timing = DelayTuner.from_baselines(
+            {
+                'action': self.ACTION_DELAY,
+                'click': self.CLICK_DELAY,
+                'reset': self.RESET_DELAY,
+            },
+            learned=self.profile.delays,
+        )
+        delays = ' '.join(
+            f'{name}={round(value * 1000)}ms'
+            for name, value in self.timing.learned_values().items()
+        )
+        logger.info('TIMING: starting delays %s', delays)
+        self.events.emit(
+            SessionStarted(
+                self.clock.now(),
+                time.time(),
+                self.profile.name,
+                self.timing.learned_values(),
+            )
+        )
+
     def _setup_hotkeys(self) -> None:
         """Register keyboard hotkeys for control."""
 
@@ -91,102 +268,291 @@ class FarmingService:
         self.input.register_hotkey('m', on_pause)
         self.input.register_hotkey('l', on_stop)
 
-    def _click_action(self, action_name: str) -> bool:
+    def _check_interrupted(self) -> None:
+        """Abort the current iteration if paused or stopped."""
+        if self.state.interrupted.is_set():
+            raise FarmingInterrupted()
+
+    def _sleep(self, seconds: float) -> None:
+        """Wait, returning early by raising if paused or stopped."""
+        if self.clock.wait(self.state.interrupted, seconds):
+            raise FarmingInterrupted()
+
+    def _click_action(
+        self,
+        action_name: str,
+        postcondition: Optional[Postcondition] = None,
+        delay: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> bool:
         """
         Click a named action from the profile.
 
         Args:
             action_name: Name of the action in the profile.
+            postcondition: Optional visual check confirming the click;
+                the click is retried until it holds or retries run out.
+            delay: Name of the adaptive delay that preceded the click;
+                the verification outcome is fed back to it.
+            max_retries: Override of the verifier's retry count.
 
         Returns:
-            True if action was found and clicked.
+            True if action was found, clicked and (if checked) confirmed.
         """
         coords = self.profile.get_action(action_name)
         if not coords:
             logger.warning(f"Action '{action_name}' not found in profile")
             return False
 
-        self.input.click(coords)
-        logger.info(f'ACTION: {action_name}')
-        return True
+        logger.info('ACTION: %s', action_name)
+        self.events.emit(ActionClicked(self.clock.now(), action_name))
+        return self._verified_click(
+            action_name, coords, postcondition, delay, max_retries
+        )
 
-    def _buy_the_soul(self) -> bool:
+    def _verified_click(
+        self,
+        name: str,
+        coords: Coordinates,
+        postcondition: Optional[Postcondition],
+        delay: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> bool:
+        """Click, verifying the postcondition if one is given."""
+        if postcondition is None:
+            self.input.click(coords)
+            return True
+
+        result = self.verifier.perform(
+            name, lambda: self.input.click(coords), postcondition, max_retries
+        )
+        if delay:
+            self.timing.record(delay, result.verified and result.attempts == 1)
+        return result.verified
+
+    def _roi_changed(self, roi_name: str) -> Optional[Postcondition]:
+        """Postcondition that the first ROI of the given name changes."""
+        rois = self.profile.get_rois(roi_name)
+        return RoiChanged(self.scanner, rois[0]) if rois else None
+
+    def _delay(self, name: str) -> Callable[[], float]:
+        """Get a lazily resolved adaptive delay for a timeline step."""
+        return lambda: self.timing.get(name)
+
+    def _click_step(
+        self,
+        action_name: str,
+        verify_roi: Optional[str] = None,
+        delay: Optional[str] = None,
+    ) -> Callable[[], object]:
         """
-        Attempt to find and buy The Soul card.
+        Get a timeline action clicking a named profile action.
 
-        Returns:
-            True if soul was found and purchased.
+        Skips and new games are not idempotent: a transition that shows
+        up after the verification timeout would be applied twice by a
+        retry. The click is therefore never repeated; an unconfirmed
+        postcondition is reported and backs the delay off instead.
+
+        Args:
+            action_name: Name of the action in the profile.
+            verify_roi: ROI expected to change once the click lands.
+            delay: Name of the adaptive delay preceding the click.
         """
-        time.sleep(self.SOUL_WAIT_TIME)
 
-        soul_match = self.scanner.scan_for_soul()
-        if not soul_match:
-            return False
+        def action() -> bool:
+            postcondition = (
+                self._roi_changed(verify_roi) if verify_roi else None
+            )
+            return self._click_action(
+                action_name, postcondition, delay, max_retries=0
+            )
+
+        return action
 
-        logger.info(f'Selecting SOUL card at {soul_match.position.to_tuple()}')
-        self.state.record_soul_found()
+    def _run_timeline(self, timeline: Timeline) -> TimelineReport:
+        """Execute a timeline and keep its report for this iteration."""
+        report = self.scheduler.run(timeline)
+        self._iteration_reports.append(report)
+        return report
 
-        # Click the soul card
-        self.input.click(soul_match.position)
-        time.sleep(self.CLICK_DELAY)
+    def _add_soul_steps(self, timeline: Timeline) -> Timeline:
+        """
+        Append the steps that find, select and use The Soul card.
 
-        # Click "Use" button (offset below the card)
-        use_button = soul_match.position.offset(0, 100)
-        self.input.click(use_button)
-        time.sleep(self.ACTION_DELAY)
+        The selection steps only run if the scan found the card.
+        """
 
-        return True
+        def found() -> bool:
+            return self._soul_match is not None
 
-    def _skip_slot_1(self) -> None:
-        """Skip the first tag slot and check for soul."""
-        self._click_action('skip_slot_1')
-        self._buy_the_soul()
+        return (
+            timeline.step(
+                'scan_for_soul', self._scan_for_soul, self.SOUL_WAIT_TIME
+            )
+            .step('select_soul', self._select_soul, when=found)
+            .step('use_soul', self._use_soul, self._delay('click'), found)
+            .wait(self._delay('action'), when=found)
+        )
 
-    def _skip_slot_2(self) -> None:
-        """Skip the second tag slot and check for soul."""
-        self._click_action('skip_slot_1')
-        time.sleep(self.ACTION_DELAY)
-        self._click_action('skip_slot_2')
-        self._buy_the_soul()
+    def _scan_for_soul(self) -> None:
+        """Scan the open pack for The Soul card."""
+        self._soul_match = self.scanner.scan_for_soul()
+        self._packs_checked += 1
+        if self._soul_match:
+            position = self._soul_match.position.to_tuple()
+            logger.info('Selecting SOUL card at %s', position)
+            now = self.clock.now()
+            self.events.emit(SoulFound(now, *position))
+            self.state.record_soul_found()
+            self.state.stats.record_soul(now)
+
+    def _select_soul(self) -> None:
+        """Click the soul card found by the last scan."""
+        soul_roi = self._soul_roi(self._soul_match)
+        postcondition = (
+            RoiChanged(self.scanner, soul_roi) if soul_roi else None
+        )
+        # Clicking again would deselect the card, so never retry
+        self._verified_click(
+            'select_soul', self._soul_match.position, postcondition, None, 0
+        )
 
-    def _skip_both_slots(self) -> None:
-        """Skip first slot, buy specialized skip, skip second slot."""
-        self._click_action('skip_slot_1')
-        self._buy_the_soul()
+    def _use_soul(self) -> None:
+        """Click the "Use" button (offset below the card)."""
+        soul_roi = self._soul_roi(self._soul_match)
+        postcondition = None
+        if soul_roi:
+            postcondition = AssetAbsent(self.scanner, 'the_soul.png', soul_roi)
+        self._verified_click(
+            'use_soul',
+            self._soul_match.position.offset(0, 100),
+            postcondition,
+            'click',
+        )
 
-        self._click_action('package_specialized_skip')
-        time.sleep(self.ACTION_DELAY)
+    def _buy_the_soul(self) -> bool:
+        """
+        Attempt to find and buy The Soul card.
 
-        self._click_action('skip_slot_2')
-        self._buy_the_soul()
+        Returns:
+            True if soul was found and purchased.
+        """
+        self._run_timeline(self._add_soul_steps(Timeline('buy_the_soul')))
+        return self._soul_match is not None
+
+    def _soul_roi(self, soul_match: ScanResult) -> Optional[Region]:
+        """Get the soul ROI a match was found in, if known."""
+        soul_rois = self.profile.get_rois('the_soul')
+        index = soul_match.slot - 1
+        if 0 <= index < len(soul_rois):
+            return soul_rois[index]
+        return None
+
+    def _add_click_step(self, timeline: Timeline, click: ClickStep) -> None:
+        """Append a step clicking a profile action after its delay."""
+        timeline.step(
+            click.action,
+            self._click_step(*click),
+            self._delay(click.delay) if click.delay else 0.0,
+        )
 
     def _execute_decision(self, decision: FarmingDecision) -> None:
         """Execute the given farming decision."""
-        if decision == FarmingDecision.SKIP_SLOT_1:
-            self._skip_slot_1()
-        elif decision == FarmingDecision.SKIP_SLOT_2:
-            self._skip_slot_2()
-        elif decision == FarmingDecision.SKIP_BOTH_SLOTS:
-            self._skip_both_slots()
-        # NONE decision - do nothing
+        packs = DECISION_PACKS[decision]
+        if not packs:
+            return
+
+        timeline = Timeline(decision.name.lower())
+        for clicks in packs:
+            for click in clicks:
+                self._add_click_step(timeline, click)
+            self._add_soul_steps(timeline)
+        self._run_timeline(timeline)
 
     def _new_game(self) -> None:
         """Reset game state and start a new run."""
-        self.input.press_key('esc')
-        time.sleep(self.ACTION_DELAY)
+        slot_rois = self.profile.get_rois('skip_slots_1')
+        check_roi = slot_rois[0] if slot_rois else None
+        captures: dict[str, np.ndarray] = {}
+
+        def capture(key: str) -> Callable[[], object]:
+            def action() -> None:
+                captures[key] = self.scanner.capture_roi(check_roi)
 
-        self._click_action('new_game_top')
-        time.sleep(self.ACTION_DELAY)
+            return action
 
-        self._click_action('new_game_confirm')
-        time.sleep(self.ACTION_DELAY)
+        def has_reference() -> bool:
+            return check_roi is not None
 
+        timeline = (
+            Timeline('new_game')
+            .step('capture_reference', capture('before'), when=has_reference)
+            .step('esc', lambda: self.input.press_key('esc'))
+        )
+        for click in NEW_GAME_CLICKS:
+            self._add_click_step(timeline, click)
         # Move mouse out of the way
-        self.input.move_to(Coordinates(5, 5))
-        time.sleep(self.RESET_DELAY)
+        timeline.step(
+            'move_away',
+            lambda: self.input.move_to(Coordinates(5, 5)),
+            self._delay('action'),
+        ).step(
+            'capture_reset',
+            capture('first'),
+            self._delay('reset'),
+            has_reference,
+        ).step(
+            'capture_settled',
+            capture('second'),
+            self.SETTLE_CHECK_DELAY,
+            has_reference,
+        )
+        self._run_timeline(timeline)
+        self._reset_frame = captures.get('second')
+
+        if check_roi is not None:
+            success = self._verify_reset(captures)
+            self.timing.record('action', success)
+            self.timing.record('reset', success)
 
         self.state.increment_run()
         logger.info('ACTION: New Game Started')
+        now = self.clock.now()
+        self.events.emit(NewGameStarted(now, self.state.current_run))
+        self.state.stats.record_reset(now)
+
+        saved = self.timing.complete_reset()
+        logger.info(
+            'TIMING: saved %.2fs this reset (avg %.2fs)',
+            saved,
+            self.timing.average_saved_per_reset,
+        )
+
+    def _verify_reset(self, captures: dict[str, np.ndarray]) -> bool:
+        """
+        Verify a reset landed on a new, settled blind selection screen.
+
+        Args:
+            captures: Tag slot captures taken before the reset ('before'),
+                after the reset delay ('first') and shortly after that
+                ('second').
+
+        Returns:
+            True if the region changed and is no longer animating.
+        """
+        return reset_landed(
+            self.scanner.has_changed,
+            captures['before'],
+            captures['first'],
+            captures['second'],
+        )
+
+    def _save_learned_delays(self) -> None:
+        """Persist the learned delays into the active profile."""
+        self.profile = save_learned_delays(
+            self.config, self.profile, self.timing
+        )
+        self.scanner.profile = self.profile
 
     def scan_and_decide(self) -> FarmingDecision:
         """
@@ -195,22 +561,155 @@ class FarmingService:
         Returns:
             The farming decision based on detected tags.
         """
-        double_matches, charm_matches = self.scanner.scan_slots_for_tags()
-        context = DecisionContext.from_scan_results(
-            double_matches, charm_matches
+        probe_tag = self.scanner.make_tag_probe()
+        probed: dict[TagPredicate, bool] = {}
+
+        def probe(predicate: TagPredicate) -> bool:
+            start = self.clock.now()
+            found = bool(probe_tag(predicate.asset_name, predicate.slot))
+            self.probe_stats.record(predicate, found, self.clock.now() - start)
+            probed[predicate] = found
+            return found
+
+        decision, context = decide_farming_action_lazily(
+            probe, self.policy.decide, self.probe_stats
+        )
+        self._last_context = context
+
+        now = self.clock.now()
+        self.events.emit(
+            ScanCompleted(
+                now,
+                probed.get(TagPredicate.DOUBLE_SLOT1),
+                probed.get(TagPredicate.CHARM_SLOT1),
+                probed.get(TagPredicate.CHARM_SLOT2),
+            )
         )
-        decision = decide_farming_action(context)
+        detected = [
+            p.label for p in TagPredicate if getattr(context, p.field_name)
+        ]
+        if detected:
+            logger.info('SCAN_RESULT: detected %s', ', '.join(detected))
 
         if decision != FarmingDecision.NONE:
-            logger.info(f'DECISION: {get_decision_description(decision)}')
+            description = get_decision_description(decision, context)
+            logger.info('DECISION: %s', description)
+            doubles, charms = tags_taken(decision, context)
+            self.events.emit(DecisionMade(now, decision.name, doubles, charms))
+            self.state.stats.record_decision(doubles, charms)
 
         return decision
 
     def run_iteration(self) -> None:
         """Run a single farming iteration (scan, decide, act, reset)."""
+        self._iteration_reports = []
+        start = self.clock.now()
         decision = self.scan_and_decide()
+
+        packs, souls = self._packs_checked, self.state.souls_found
+        execute_start = self.clock.now()
         self._execute_decision(decision)
+        duration = self.clock.now() - execute_start
+        self._new_game()
+
+        elapsed = self.clock.now() - start
+        self.policy.observe(
+            decision,
+            duration,
+            self._packs_checked - packs,
+            self.state.souls_found - souls,
+            elapsed,
+        )
+        self._submit_bookkeeping(elapsed)
+        self._recover_if_stalled()
+
+    def _submit_bookkeeping(self, elapsed: float) -> None:
+        """
+        Queue the finished iteration's bookkeeping for the next waits.
+
+        Statistics, the critical path log line, watchdog frame hashing
+        and the event flush need no screen, so they run while the next
+        iteration waits for the game instead of between iterations.
+        """
+        context = self._last_context
+        tags_found = context is not None and (
+            context.has_double_slot1
+            or context.has_charm_slot1
+            or context.has_charm_slot2
+        )
+        frame, now = self._reset_frame, self.clock.now()
+        reports, run = self._iteration_reports, self.state.current_run
+
+        self.scheduler.submit(
+            lambda: self.state.stats.record_iteration(elapsed)
+        )
+        self.scheduler.submit(lambda: self._log_critical_path(reports, run))
+        self.scheduler.submit(
+            lambda: self._observe_progress(frame, tags_found, now)
+        )
+        self.scheduler.submit(self.events.flush)
+
+    def _observe_progress(
+        self, frame: Optional[np.ndarray], tags_found: bool, now: float
+    ) -> None:
+        """Feed the watchdog; a detected stall is acted on later."""
+        reason = self.watchdog.observe(frame, tags_found, now)
+        if reason:
+            self._stall_reason = reason
+
+    def _recover_if_stalled(self) -> None:
+        """Recover if the watchdog found the loop stopped progressing."""
+        reason, self._stall_reason = self._stall_reason, None
+        if not reason:
+            return
+
+        now = self.clock.now()
+        lost = self.watchdog.record_stall(now)
+        logger.warning(
+            f'STALL: {reason}, lost {lost:.1f}s '
+            f'(total {self.watchdog.total_lost:.1f}s); recovering'
+        )
+        self._recover()
+
+    def _recover(self) -> None:
+        """Leave any open pack or menu and start a fresh run."""
+        timeline = (
+            Timeline('recover')
+            .step(
+                'package_specialized_skip',
+                self._click_step('package_specialized_skip'),
+            )
+            .wait(self._delay('action'))
+        )
+        self._run_timeline(timeline)
         self._new_game()
+        logger.info('ACTION: Recovery completed')
+
+    def _log_critical_path(
+        self, reports: list[TimelineReport], run: int
+    ) -> None:
+        """Log where the time of an iteration went."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        elapsed = sum(r.elapsed for r in reports)
+        waits = sum(r.wait_time for r in reports)
+        actions = sum(r.action_time for r in reports)
+        background = sum(r.background_time for r in reports)
+        path = ' -> '.join(
+            f'{step.name} {step.waited + step.ran:.2f}s'
+            for report in reports
+            for step in report.critical_path
+        )
+        logger.debug(
+            'TIMELINE: run %d took %.2fs '
+            '(waits %.2fs, actions %.2fs, background %.2fs): %s',
+            run,
+            elapsed,
+            waits,
+            actions,
+            background,
+            path,
+        )
 
     def run(self) -> None:
         """
@@ -226,14 +725,34 @@ class FarmingService:
 
         self._setup_hotkeys()
 
+        stats = self.state.stats
+        # An interrupted iteration leaves the game mid-pack or mid-menu
+        needs_recovery = False
         try:
             while self.state.is_running:
-                if self.state.is_farming:
+                # Paused time counts toward no statistic
+                if not self.state.is_farming:
+                    stats.pause(self.clock.now())
+                # Wakes on resume or stop; the slices let Ctrl+C through
+                if not self.state.wait_until_active(self.PAUSE_POLL_INTERVAL):
+                    continue
+                stats.resume(self.clock.now())
+                try:
+                    if needs_recovery:
+                        logger.info('Recovering from interrupted run')
+                        self._recover()
+                        needs_recovery = False
                     self.run_iteration()
-                else:
-                    time.sleep(self.IDLE_SLEEP)
+                except FarmingInterrupted:
+                    run = self.state.current_run
+                    logger.info('Run %d interrupted mid-iteration', run)
+                    needs_recovery = True
         except Exception as e:
             logger.error(f'Error in farming loop: {e}')
             raise
         finally:
+            # Bookkeeping of the last iteration is still queued
+            self.scheduler.drain()
+            stats.pause(self.clock.now())
             self.input.unregister_all_hotkeys()
+            self._save_learned_delays()
@@ -0,0 +1,226 @@
+"""
+Report service aggregating statistics across all session logs.
+
+Session logs are parsed in a process pool, per-file results are cached
+by size and modification time, and sessions are merged into lifetime
+totals and per-period (day, week or month) summaries. Only logs still on
+disk are read: sessions pruned by log retention are not included (their
+summaries live on in the ``query`` index).
+"""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..adapters.file_cache import JsonFileCache
+from .analytics import AnalyticsService, FarmingStatistics, merge_statistics
+
+# Below this many files to parse, a process pool costs more than it saves
+MIN_PARALLEL_FILES = 4
+
+
+def parse_log_file(path: Path) -> FarmingStatistics:
+    """
+    Parse one session log (top-level so process pools can pickle it).
+
+    Args:
+        path: Session log file.
+
+    Returns:
+        Statistics of the session.
+    """
+    return AnalyticsService().parse_file(path, workers=1).result()
+
+
+def _day(start: str) -> str:
+    return start[:10]
+
+
+def _week(start: str) -> str:
+    year, week, _ = date.fromisoformat(start[:10]).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def _month(start: str) -> str:
+    return start[:7]
+
+
+PERIODS: dict[str, Callable[[str], str]] = {
+    'day': _day,
+    'week': _week,
+    'month': _month,
+}
+
+
+@dataclass
+class PeriodStatistics:
+    """Value object with the merged statistics of one period."""
+
+    period: str
+    sessions: int
+    statistics: FarmingStatistics
+
+
+class ReportService:
+    """
+    Service for lifetime and per-period farming reports.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[JsonFileCache] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Initialize the report service.
+
+        Args:
+            cache: Per-file result cache (no caching if omitted).
+            workers: Process pool size (CPU count if omitted, 1 to parse
+                in this process).
+        """
+        self.cache = cache
+        self.workers = workers
+        self.parsed_files = 0
+
+    def collect(
+        self, log_paths: Iterable[Path]
+    ) -> dict[Path, FarmingStatistics]:
+        """
+        Statistics of every session log, parsing only uncached files.
+
+        Args:
+            log_paths: Session log files.
+
+        Returns:
+            Statistics by log file.
+        """
+        log_paths = sorted(log_paths)
+        results: dict[Path, FarmingStatistics] = {}
+        todo = []
+        for path in log_paths:
+            signature = JsonFileCache.signature(path)
+            cached = (
+                self.cache.get(path, signature)
+                if self.cache is not None
+                else None
+            )
+            if cached is not None:
+                results[path] = FarmingStatistics(**cached)
+            else:
+                todo.append((path, signature))
+
+        paths = [path for path, _ in todo]
+        for (path, signature), stats in zip(todo, self._parse(paths)):
+            results[path] = stats
+            if self.cache is not None:
+                self.cache.put(path, signature, asdict(stats))
+        self.parsed_files = len(todo)
+
+        if self.cache is not None:
+            self.cache.retain(log_paths)
+            self.cache.save()
+        return {path: results[path] for path in log_paths}
+
+    def _parse(self, paths: list[Path]) -> Iterable[FarmingStatistics]:
+        """Parse logs, in a process pool when there are enough."""
+        if self.workers == 1 or len(paths) < MIN_PARALLEL_FILES:
+            return [parse_log_file(path) for path in paths]
+
+        workers = self.workers or os.cpu_count() or 1
+        # Batch small files to amortize inter-process overhead
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse_log_file, paths, chunksize=chunksize))
+
+    def summarize(
+        self, sessions: Iterable[FarmingStatistics], by: str = 'day'
+    ) -> list[PeriodStatistics]:
+        """
+        Merge sessions into per-period statistics.
+
+        Sessions are assigned to the period they started in; sessions
+        without timestamps are left out.
+
+        Args:
+            sessions: Statistics of individual sessions.
+            by: 'day', 'week' or 'month'.
+
+        Returns:
+            Statistics per period in chronological order.
+        """
+        period_of = PERIODS[by]
+        grouped: dict[str, list[FarmingStatistics]] = {}
+        for stats in sessions:
+            if stats.start is not None:
+                grouped.setdefault(period_of(stats.start), []).append(stats)
+        return [
+            PeriodStatistics(period, len(group), merge_statistics(group))
+            for period, group in sorted(grouped.items())
+        ]
+
+    def display_report(
+        self,
+        periods: list[PeriodStatistics],
+        lifetime: FarmingStatistics,
+        sessions: int,
+    ) -> None:
+        """
+        Display lifetime totals and a table of periods to stdout.
+
+        Args:
+            periods: Per-period statistics.
+            lifetime: Statistics of all sessions merged.
+            sessions: Number of sessions.
+        """
+        print('\n### Balatro Farming Report ###')
+        print(f'Sessions:              {sessions}')
+        print(f'Total Farming Time:    {lifetime.run_time_str}')
+        print(f'Resets (New Games):    {lifetime.new_game_count}')
+        print(f'Resets per Hour:       {lifetime.resets_per_hour:.2f}')
+        print(f'Souls Clicked:         {lifetime.total_souls}')
+        print(f'Souls per Hour:        {lifetime.souls_per_hour:.2f}')
+        print('(Sessions whose logs were pruned are excluded; see `query`.)')
+        print('-' * 72)
+        print(
+            f'{"Period":<12}{"Sessions":>9}{"Hours":>9}{"Resets":>9}'
+            f'{"Resets/h":>10}{"Souls":>8}{"Souls/h":>9}'
+        )
+        for row in periods:
+            stats = row.statistics
+            print(
+                f'{row.period:<12}{row.sessions:>9}'
+                f'{stats.duration_seconds / 3600:>9.2f}'
+                f'{stats.new_game_count:>9}{stats.resets_per_hour:>10.1f}'
+                f'{stats.total_souls:>8}{stats.souls_per_hour:>9.2f}'
+            )
+        print('-' * 72)
+
+    def report(
+        self, log_paths: Iterable[Path], by: str = 'day'
+    ) -> Optional[list[PeriodStatistics]]:
+        """
+        Collect, summarize and display statistics of session logs.
+
+        Sessions whose logs were pruned are not counted.
+
+        Args:
+            log_paths: Session log files.
+            by: 'day', 'week' or 'month'.
+
+        Returns:
+            Per-period statistics, or None if there are no logs.
+        """
+        sessions = self.collect(log_paths)
+        if not sessions:
+            print('No session logs found.')
+            return None
+
+        periods = self.summarize(sessions.values(), by)
+        lifetime = merge_statistics(sessions.values())
+        self.display_report(periods, lifetime, len(sessions))
+        return periods
@@ -0,0 +1,151 @@
+"""
+Retention of session logs.
+
+When a session shuts down, after its statistics are shown, the logs of
+earlier sessions are finished: they are indexed, compressed and, if the
+policy asks for it, pruned by age or by the total size of the log
+directory. Running at shutdown keeps the compression off the CPU and
+disk while farming. Logs are indexed before they are deleted, so
+``query`` keeps counting them; ``report`` only reads the logs on disk.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ..adapters.log_archive import (
+    compress_log,
+    events_file_for,
+    find_logs,
+    is_compressed,
+)
+from .analytics import AnalyticsService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionPolicy:
+    """Value object describing what happens to finished session logs."""
+
+    # '.gz', '.zst', or None to keep logs uncompressed
+    compression: Optional[str] = '.gz'
+    max_age_days: Optional[float] = None
+    max_total_bytes: Optional[int] = None
+
+
+class RetentionService:
+    """
+    Service compressing and pruning finished session logs.
+
+    Not thread-bound itself, but the analytics index must be created on
+    the thread that runs the service (SQLite connections are).
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        analytics: AnalyticsService,
+        policy: Optional[RetentionPolicy] = None,
+    ):
+        """
+        Initialize the retention service.
+
+        Args:
+            log_dir: Directory with the session logs.
+            analytics: Analytics service with the log index.
+            policy: What to do with finished logs (gzip, no pruning by
+                default).
+        """
+        self.log_dir = log_dir
+        self.analytics = analytics
+        self.policy = policy or RetentionPolicy()
+
+    def compress_finished(self, active: Optional[Path] = None) -> list[Path]:
+        """
+        Index and compress every plain log except the active one.
+
+        Args:
+            active: Log of the running session, left untouched.
+
+        Returns:
+            Paths of the compressed logs.
+        """
+        if self.policy.compression is None:
+            return []
+        compressed = []
+        for path in find_logs(self.log_dir):
+            if path == active or is_compressed(path):
+                continue
+            self.analytics.index_log(path)
+            target = compress_log(path, self.policy.compression)
+            self.analytics.index.rename(path, target)
+            compressed.append(target)
+        return compressed
+
+    def prune(
+        self, active: Optional[Path] = None, now: Optional[float] = None
+    ) -> list[Path]:
+        """
+        Delete logs older than the policy allows, then the oldest ones
+        while the directory exceeds its size budget.
+
+        A log's event file is deleted with it. The active log counts
+        toward the size budget but is never deleted.
+
+        Args:
+            active: Log of the running session.
+            now: Current epoch time (time.time() if omitted).
+
+        Returns:
+            Paths of the deleted logs.
+        """
+        now = time.time() if now is None else now
+        logs = sorted(
+            (path.stat().st_mtime, path) for path in find_logs(self.log_dir)
+        )
+        sizes = {path: self._size(path) for _, path in logs}
+        total = sum(sizes.values())
+        max_age = self.policy.max_age_days
+        max_total = self.policy.max_total_bytes
+
+        deleted = []
+        for mtime, path in logs:
+            too_old = max_age is not None and now - mtime > max_age * 86400
+            too_big = max_total is not None and total > max_total
+            if not (too_old or too_big) or path == active:
+                continue
+            # The summary outlives the log
+            self.analytics.index_log(path)
+            for file in (path, events_file_for(path)):
+                file.unlink(missing_ok=True)
+            total -= sizes[path]
+            deleted.append(path)
+        return deleted
+
+    def _size(self, path: Path) -> int:
+        events = events_file_for(path)
+        size = path.stat().st_size
+        return size + (events.stat().st_size if events.exists() else 0)
+
+    def run(self, active: Optional[Path] = None) -> None:
+        """
+        Apply the policy to all finished logs, logging failures.
+
+        Args:
+            active: Log of the running session.
+        """
+        try:
+            compressed = self.compress_finished(active)
+            deleted = self.prune(active)
+        except (OSError, ImportError, sqlite3.Error) as e:
+            logger.warning(f'Log retention failed: {e}')
+            return
+        if compressed or deleted:
+            logger.info(
+                f'RETENTION: compressed {len(compressed)} logs, '
+                f'deleted {len(deleted)}'
+            )
@@ -5,10 +5,16 @@ Orchestrates screen capture and template matching across configured ROIs.
 """
 
 import logging
-import time
-from typing import Optional
+from typing import Callable, Optional
 
-from ..adapters.ports import AbstractInputPort, AbstractScreenPort
+import numpy as np
+
+from ..adapters.clock import SystemClock
+from ..adapters.ports import (
+    AbstractClockPort,
+    AbstractInputPort,
+    AbstractScreenPort,
+)
 from ..domain.model import Coordinates, ProfileConfig, Region, ScanResult
 
 logger = logging.getLogger(__name__)
@@ -21,11 +27,27 @@ class ScanService:
     Handles the logic of scanning multiple ROIs and aggregating results.
     """
 
+    # Mean absolute pixel difference above which two frames differ
+    CHANGE_THRESHOLD = 8.0
+
+    # Time for the cursor to move and the UI to update before capturing
+    CURSOR_SETTLE_DELAY = 0.1
+
+    # Column standard deviation above which a pack column shows a card;
+    # the real soul card keeps 85% of its ROI's columns above it even
+    # dimmed to 20% brightness, the smooth pack backdrop stays below 1
+    CARD_COLUMN_STD = 6.0
+
+    # Share of a card ROI's columns that must look like a card; a missed
+    # soul costs more than matching an empty ROI, so this stays low
+    CARD_FILL_RATIO = 0.5
+
     def __init__(
         self,
         screen: AbstractScreenPort,
         input_adapter: AbstractInputPort,
         profile: ProfileConfig,
+        clock: Optional[AbstractClockPort] = None,
     ):
         """
         Initialize the scan service.
@@ -34,10 +56,12 @@ class ScanService:
             screen: Screen adapter for capture and matching.
             input_adapter: Input adapter to move cursor out of way.
             profile: Current resolution profile configuration.
+            clock: Clock used for waits (defaults to the system clock).
         """
         self.screen = screen
         self.input = input_adapter
         self.profile = profile
+        self.clock = clock or SystemClock()
 
     def scan_region_for_asset(
         self, asset_name: str, region: Optional[Region] = None, slot: int = 0
@@ -55,7 +79,7 @@ class ScanService:
         """
         # Move cursor to top-left corner to avoid interference
         self.input.move_to(Coordinates(10, 10))
-        time.sleep(0.1)  # Allow time for cursor to move and UI to update
+        self.clock.sleep(self.CURSOR_SETTLE_DELAY)
 
         haystack = self.screen.capture_region(region)
         offset = None
@@ -69,10 +93,64 @@ class ScanService:
             region_offset=offset,
         )
 
+    def capture_roi(self, region: Region) -> np.ndarray:
+        """
+        Capture a region as-is, without moving the cursor or waiting.
+
+        Args:
+            region: Region to capture.
+
+        Returns:
+            The captured image in BGR format.
+        """
+        return self.screen.capture_region(region)
+
+    def is_asset_present(self, asset_name: str, region: Region) -> bool:
+        """
+        Check whether an asset is visible in a region right now.
+
+        Unlike scan_region_for_asset, the cursor is left where it is.
+
+        Args:
+            asset_name: Name of the asset to search for.
+            region: Region to check.
+
+        Returns:
+            True if at least one match was found.
+        """
+        haystack = self.screen.capture_region(region)
+        matches = self.screen.match_template(
+            haystack=haystack,
+            asset_name=asset_name,
+            region_offset=Coordinates(region.left, region.top),
+        )
+        return bool(matches)
+
+    @classmethod
+    def has_changed(cls, before: np.ndarray, after: np.ndarray) -> bool:
+        """
+        Check whether two captures of the same region differ visibly.
+
+        Args:
+            before: Earlier capture of the region.
+            after: Later capture of the region.
+
+        Returns:
+            True if the mean pixel difference exceeds CHANGE_THRESHOLD.
+        """
+        if before.shape != after.shape:
+            return True
+        diff = np.abs(before.astype(np.int16) - after.astype(np.int16))
+        return float(diff.mean()) > cls.CHANGE_THRESHOLD
+
     def scan_slots_for_tags(self) -> tuple[list[ScanResult], list[ScanResult]]:
         """
         Scan both blind slots for double and charm tags.
 
+        Emits no ScanCompleted event and logs no SCAN_RESULT line: the
+        decision path (FarmingService.scan_and_decide) reports each scan
+        exactly once, with the tags it did not probe left unset.
+
         Returns:
             Tuple of (double_matches, charm_matches) across both slots.
         """
@@ -82,7 +160,7 @@ class ScanService:
         # Scan Slot 1
         slot1_rois = self.profile.get_rois('skip_slots_1')
         for roi in slot1_rois:
-            logger.debug(f'Scanning Slot 1 ROI: {roi}')
+            logger.debug('Scanning Slot 1 ROI: %s', roi)
             double_matches.extend(
                 self.scan_region_for_asset('double.png', roi, slot=1)
             )
@@ -93,7 +171,7 @@ class ScanService:
         # Scan Slot 2
         slot2_rois = self.profile.get_rois('skip_slots_2')
         for roi in slot2_rois:
-            logger.debug(f'Scanning Slot 2 ROI: {roi}')
+            logger.debug('Scanning Slot 2 ROI: %s', roi)
             double_matches.extend(
                 self.scan_region_for_asset('double.png', roi, slot=2)
             )
@@ -101,33 +179,128 @@ class ScanService:
                 self.scan_region_for_asset('charm.png', roi, slot=2)
             )
 
-        # Log summary
-        detection_summary = []
-        if any(m.slot == 1 for m in double_matches):
-            detection_summary.append('Double(Slot1)')
-        if any(m.slot == 1 for m in charm_matches):
-            detection_summary.append('Charm(Slot1)')
-        if any(m.slot == 2 for m in charm_matches):
-            detection_summary.append('Charm(Slot2)')
-
-        if detection_summary:
-            logger.info(
-                f'SCAN_RESULT: detected {", ".join(detection_summary)}'
-            )
-
         return double_matches, charm_matches
 
+    def make_tag_probe(self) -> Callable[[str, int], list[ScanResult]]:
+        """
+        Create a probe scanning one asset in one blind slot on demand.
+
+        The cursor is moved out of the way once, before the first capture,
+        and each slot ROI is captured at most once per probe so several
+        assets can be matched against the same frame.
+
+        Returns:
+            Callable taking (asset_name, slot) and returning its matches.
+        """
+        frames: dict[Region, np.ndarray] = {}
+
+        def probe(asset_name: str, slot: int) -> list[ScanResult]:
+            results: list[ScanResult] = []
+            for roi in self.profile.get_rois(f'skip_slots_{slot}'):
+                if roi not in frames:
+                    if not frames:
+                        self.input.move_to(Coordinates(10, 10))
+                        self.clock.sleep(self.CURSOR_SETTLE_DELAY)
+                    logger.debug('Capturing Slot %s ROI: %s', slot, roi)
+                    frames[roi] = self.screen.capture_region(roi)
+                results.extend(
+                    self.screen.match_template(
+                        haystack=frames[roi],
+                        asset_name=asset_name,
+                        slot=slot,
+                        region_offset=Coordinates(roi.left, roi.top),
+                    )
+                )
+            return results
+
+        return probe
+
+    def detect_populated_rois(
+        self, rois: list[Region], strip: np.ndarray
+    ) -> list[int]:
+        """
+        Detect which card ROIs of a pack actually show a card.
+
+        Card faces have strong vertical detail while the pack background
+        is smooth, so the per-column standard deviation of the strip
+        tells populated columns apart. A ROI is populated when at least
+        CARD_FILL_RATIO of its columns exceed CARD_COLUMN_STD.
+
+        Args:
+            rois: Card ROIs, in screen coordinates.
+            strip: Capture of the bounding region of all ROIs.
+
+        Returns:
+            Indices of populated ROIs, or all indices if the strip does
+            not match the expected size or no card could be detected.
+        """
+        bounds = Region.bounding(rois)
+        everything = list(range(len(rois)))
+        if strip.shape[:2] != (bounds.height, bounds.width):
+            return everything
+
+        gray = strip.mean(axis=2) if strip.ndim == 3 else strip
+        textured = gray.std(axis=0) > self.CARD_COLUMN_STD
+
+        populated = []
+        for i, roi in enumerate(rois):
+            start = roi.left - bounds.left
+            columns = textured[start : start + roi.width]
+            if columns.size and columns.mean() >= self.CARD_FILL_RATIO:
+                populated.append(i)
+
+        return populated or everything
+
     def scan_for_soul(self) -> Optional[ScanResult]:
         """
         Scan the soul card ROIs for The Soul card.
 
+        The whole pack strip is captured once and only ROIs that show a
+        card are template-matched.
+
         Returns:
             The best matching ScanResult if found, None otherwise.
         """
         soul_rois = self.profile.get_rois('the_soul')
+        if not soul_rois:
+            return None
+
+        self.input.move_to(Coordinates(10, 10))
+        self.clock.sleep(self.CURSOR_SETTLE_DELAY)
+        bounds = Region.bounding(soul_rois)
+        strip = self.screen.capture_region(bounds)
+        if strip.shape[:2] != (bounds.height, bounds.width):
+            return self._scan_each_soul_roi(soul_rois)
+
+        populated = self.detect_populated_rois(soul_rois, strip)
+        logger.debug(
+            'Pack shows %d of %d card slots', len(populated), len(soul_rois)
+        )
+
+        for i in populated:
+            roi = soul_rois[i]
+            top, left = roi.top - bounds.top, roi.left - bounds.left
+            matches = self.screen.match_template(
+                haystack=strip[
+                    top : top + roi.height, left : left + roi.width
+                ],
+                asset_name='the_soul.png',
+                slot=i + 1,
+                region_offset=Coordinates(roi.left, roi.top),
+            )
+
+            if matches:
+                # Return the best match
+                return max(matches, key=lambda m: m.confidence)
+
+        return None
 
+    def _scan_each_soul_roi(
+        self, soul_rois: list[Region]
+    ) -> Optional[ScanResult]:
+        """Capture and match every soul ROI separately."""
         for i, roi in enumerate(soul_rois):
-            logger.debug(f'Scanning Soul ROI {i + 1}: {roi}')
+            logger.debug('Scanning Soul ROI %d: %s', i + 1, roi)
             matches = self.scan_region_for_asset(
                 'the_soul.png', roi, slot=i + 1
             )
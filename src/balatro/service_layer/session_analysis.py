@@ -0,0 +1,352 @@
+"""
+Columnar analysis of a session's domain events.
+
+Events are loaded into NumPy columns (timestamp, event type, decision,
+duration) and split into iterations, one per reset. Reset time
+percentiles, per-decision duration breakdowns and rolling-window
+throughput are then computed with vectorized operations. Results can
+be displayed or written to CSV.
+"""
+
+import csv
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..domain.decisions import FarmingDecision
+from ..domain.events import (
+    DecisionMade,
+    DomainEvent,
+    NewGameStarted,
+    SessionStarted,
+    SoulFound,
+)
+
+# Event types and decisions indexed by their codes in the columns
+EVENT_KINDS = ('session', 'scan', 'decision', 'action', 'new_game', 'soul')
+DECISIONS = [decision.name for decision in FarmingDecision]
+
+SESSION = EVENT_KINDS.index(SessionStarted.TYPE)
+DECISION = EVENT_KINDS.index(DecisionMade.TYPE)
+NEW_GAME = EVENT_KINDS.index(NewGameStarted.TYPE)
+SOUL = EVENT_KINDS.index(SoulFound.TYPE)
+NO_DECISION = DECISIONS.index(FarmingDecision.NONE.name)
+_KIND_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+_DECISION_CODES = {name: code for code, name in enumerate(DECISIONS)}
+
+PERCENTILES = (50, 95)
+
+
+@dataclass
+class SessionColumns:
+    """
+    One row per event, as parallel arrays.
+
+    Timestamps are seconds of farming time: each SessionStarted continues
+    where the previous session's last event left off, so gaps between
+    processes are not counted.
+    """
+
+    at: np.ndarray
+    kind: np.ndarray
+    # Index into DECISIONS for decision events, -1 otherwise
+    decision: np.ndarray
+    # Seconds until the next event (0 for the last event of a session)
+    duration: np.ndarray
+
+    @classmethod
+    def from_events(cls, events: Iterable[DomainEvent]) -> 'SessionColumns':
+        """
+        Factory method loading events into columns.
+
+        Args:
+            events: Events of one or more sessions, in order.
+        """
+        at, kind, decision = [], [], []
+        offset = None
+        last = 0.0
+        for event in events:
+            if offset is None or isinstance(event, SessionStarted):
+                offset = last - event.at
+            last = event.at + offset
+            at.append(last)
+            kind.append(_KIND_CODES[event.TYPE])
+            decision.append(
+                _DECISION_CODES[event.decision]
+                if isinstance(event, DecisionMade)
+                else -1
+            )
+
+        at_array = np.array(at, dtype=np.float64)
+        return cls(
+            at=at_array,
+            kind=np.array(kind, dtype=np.int8),
+            decision=np.array(decision, dtype=np.int8),
+            duration=np.diff(at_array, append=at_array[-1:]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.at)
+
+
+@dataclass
+class DecisionBreakdown:
+    """Value object with the iteration durations of one decision."""
+
+    decision: str
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    # Fraction of all iteration time spent on this decision's iterations
+    share: float
+    souls: int
+
+
+@dataclass
+class Throughput:
+    """Value object with rolling-window rates sampled over a session."""
+
+    at: np.ndarray
+    resets_per_hour: np.ndarray
+    souls_per_hour: np.ndarray
+
+
+@dataclass
+class IterationColumns:
+    """
+    One row per completed iteration (ending in a new game).
+
+    An iteration starts at the previous new game, or at the session start
+    for the first one; iterations cut short by a restart are left out.
+    """
+
+    start: np.ndarray
+    end: np.ndarray
+    duration: np.ndarray
+    decision: np.ndarray
+    souls: np.ndarray
+
+    @classmethod
+    def from_columns(cls, columns: SessionColumns) -> 'IterationColumns':
+        """
+        Factory method splitting event columns into iterations.
+
+        Args:
+            columns: Event columns of one or more sessions.
+        """
+        if not len(columns):
+            empty = np.empty(0)
+            return cls(
+                empty, empty, empty, np.empty(0, np.int8), np.empty(0, int)
+            )
+
+        boundary = (columns.kind == SESSION) | (columns.kind == NEW_GAME)
+        is_new_game = columns.kind == NEW_GAME
+        # Iteration of every event; a new game closes its iteration
+        label = np.cumsum(boundary) - is_new_game
+        starts = np.concatenate((columns.at[:1], columns.at[boundary]))
+        labels = int(label.max()) + 1
+
+        decisions = np.full(labels, NO_DECISION, dtype=np.int8)
+        is_decision = columns.kind == DECISION
+        decisions[label[is_decision]] = columns.decision[is_decision]
+        souls = np.bincount(
+            label[columns.kind == SOUL], minlength=labels
+        ).astype(np.int64)
+
+        ended = label[is_new_game]
+        start = starts[ended]
+        end = columns.at[is_new_game]
+        return cls(
+            start=start,
+            end=end,
+            duration=end - start,
+            decision=decisions[ended],
+            souls=souls[ended],
+        )
+
+    def __len__(self) -> int:
+        return len(self.duration)
+
+    def percentiles(self, q: Iterable[float] = PERCENTILES) -> np.ndarray:
+        """Percentiles of the iteration duration (NaN if none)."""
+        q = list(q)
+        if not len(self):
+            return np.full(len(q), np.nan)
+        return np.percentile(self.duration, q)
+
+    def decision_breakdown(self) -> list[DecisionBreakdown]:
+        """Duration statistics per decision, in DECISIONS order."""
+        total = float(self.duration.sum())
+        rows = []
+        for index in np.unique(self.decision):
+            mask = self.decision == index
+            durations = self.duration[mask]
+            p50, p95 = np.percentile(durations, PERCENTILES)
+            rows.append(
+                DecisionBreakdown(
+                    decision=DECISIONS[index],
+                    count=int(mask.sum()),
+                    mean=float(durations.mean()),
+                    p50=float(p50),
+                    p95=float(p95),
+                    share=float(durations.sum()) / total if total else 0.0,
+                    souls=int(self.souls[mask].sum()),
+                )
+            )
+        return rows
+
+    def rolling_throughput(
+        self, window: float = 3600.0, step: float = 60.0
+    ) -> Throughput:
+        """
+        Resets and souls per hour over a sliding window.
+
+        Rates are sampled every ``step`` seconds over the iterations
+        that ended in the preceding ``window`` seconds. Near the session
+        start the window is shortened to the elapsed time.
+
+        Args:
+            window: Window length in seconds.
+            step: Sampling interval in seconds.
+        """
+        if not len(self):
+            empty = np.empty(0)
+            return Throughput(empty, empty, empty)
+
+        origin = self.start[0]
+        at = np.arange(origin + step, self.end[-1] + step, step)
+        right = np.searchsorted(self.end, at, side='right')
+        left = np.searchsorted(self.end, at - window, side='right')
+        cumulative_souls = np.concatenate(([0], np.cumsum(self.souls)))
+        souls = cumulative_souls[right] - cumulative_souls[left]
+        hours = np.minimum(window, at - origin) / 3600
+        return Throughput(
+            at=at - origin,
+            resets_per_hour=(right - left) / hours,
+            souls_per_hour=souls / hours,
+        )
+
+
+class SessionAnalysisService:
+    """
+    Service for percentile, per-decision and throughput analysis.
+    """
+
+    def __init__(self, window: float = 3600.0, step: float = 60.0):
+        """
+        Initialize the analysis service.
+
+        Args:
+            window: Rolling throughput window in seconds.
+            step: Rolling throughput sampling interval in seconds.
+        """
+        self.window = window
+        self.step = step
+
+    def analyze(self, events: Iterable[DomainEvent]) -> IterationColumns:
+        """
+        Load events into columns and split them into iterations.
+
+        Args:
+            events: Events of one or more sessions.
+
+        Returns:
+            The completed iterations.
+        """
+        return IterationColumns.from_columns(
+            SessionColumns.from_events(events)
+        )
+
+    def display_analysis(self, iterations: IterationColumns) -> None:
+        """
+        Display percentiles, the decision breakdown and throughput.
+
+        Args:
+            iterations: Iterations to analyze.
+        """
+        p50, p95 = iterations.percentiles()
+        print('\n### Balatro Session Analysis ###')
+        print(f'Iterations:            {len(iterations)}')
+        print(f'Reset Time p50:        {p50:.2f}s')
+        print(f'Reset Time p95:        {p95:.2f}s')
+        print('-' * 66)
+        print(
+            f'{"Decision":<18}{"Count":>7}{"Mean":>8}{"p50":>8}{"p95":>8}'
+            f'{"Time %":>9}{"Souls":>8}'
+        )
+        for row in iterations.decision_breakdown():
+            print(
+                f'{row.decision:<18}{row.count:>7}{row.mean:>8.2f}'
+                f'{row.p50:>8.2f}{row.p95:>8.2f}{row.share:>9.1%}'
+                f'{row.souls:>8}'
+            )
+        print('-' * 66)
+
+        throughput = iterations.rolling_throughput(self.window, self.step)
+        if len(throughput.at):
+            print(
+                f'Rolling {self.window / 60:g} min window: resets/hour '
+                f'{throughput.resets_per_hour.min():.1f}-'
+                f'{throughput.resets_per_hour.max():.1f}, souls/hour '
+                f'{throughput.souls_per_hour.min():.2f}-'
+                f'{throughput.souls_per_hour.max():.2f}'
+            )
+
+    def write_csv(self, iterations: IterationColumns, directory: Path) -> None:
+        """
+        Write iterations, the decision breakdown and throughput to CSV.
+
+        Creates ``iterations.csv``, ``decisions.csv`` and
+        ``throughput.csv`` in the directory.
+
+        Args:
+            iterations: Iterations to analyze.
+            directory: Output directory, created if missing.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        with (directory / 'iterations.csv').open('w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(('start', 'end', 'duration', 'decision', 'souls'))
+            writer.writerows(
+                zip(
+                    iterations.start.round(3),
+                    iterations.end.round(3),
+                    iterations.duration.round(3),
+                    (DECISIONS[index] for index in iterations.decision),
+                    iterations.souls,
+                )
+            )
+
+        with (directory / 'decisions.csv').open('w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ('decision', 'count', 'mean', 'p50', 'p95', 'share', 'souls')
+            )
+            for row in iterations.decision_breakdown():
+                writer.writerow(
+                    (
+                        row.decision,
+                        row.count,
+                        round(row.mean, 3),
+                        round(row.p50, 3),
+                        round(row.p95, 3),
+                        round(row.share, 4),
+                        row.souls,
+                    )
+                )
+
+        throughput = iterations.rolling_throughput(self.window, self.step)
+        with (directory / 'throughput.csv').open('w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(('at', 'resets_per_hour', 'souls_per_hour'))
+            writer.writerows(
+                zip(
+                    throughput.at.round(3),
+                    throughput.resets_per_hour.round(2),
+                    throughput.souls_per_hour.round(3),
+                )
+            )
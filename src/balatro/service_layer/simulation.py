@@ -0,0 +1,315 @@
+"""
+Monte Carlo simulation of farming strategies.
+
+Estimates souls per hour for a decision policy without touching the
+game. Each slot shows one tag, drawn from a categorical distribution,
+and pack outcomes are sampled from configurable probabilities. Time per
+reset comes from a timing model built from the FarmingService delays
+(optionally as learned by its DelayTuner) or from measured durations.
+Everything is vectorized with NumPy so millions of resets take seconds.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..domain.decisions import (
+    DecisionContext,
+    FarmingDecision,
+    decide_farming_action,
+)
+from ..domain.policy import PACKS_OPENED
+from .farming import FarmingService
+from .scanning import ScanService
+
+# Decisions indexed by their position in lookup tables
+DECISIONS = list(FarmingDecision)
+
+
+@dataclass
+class GameModel:
+    """
+    Value object holding the probabilities of the simulated game.
+
+    A slot shows a single tag, so the slot 1 probabilities are exclusive
+    outcomes of one draw; the rest of the probability mass is other tags.
+    """
+
+    double_slot1: float = 0.05
+    charm_slot1: float = 0.05
+    charm_slot2: float = 0.05
+    soul_per_pack: float = 0.01
+
+    def __post_init__(self) -> None:
+        if self.double_slot1 + self.charm_slot1 > 1:
+            raise ValueError(
+                'double_slot1 and charm_slot1 are exclusive outcomes of '
+                'one slot and must sum to at most 1'
+            )
+
+    def sample_codes(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw the tags of ``size`` blind selection screens.
+
+        Args:
+            size: Number of screens.
+            rng: Random generator.
+
+        Returns:
+            Tag combination codes, double1 | charm1 << 1 | charm2 << 2.
+        """
+        slot1 = rng.random(size)
+        double1 = slot1 < self.double_slot1
+        charm1 = ~double1 & (slot1 < self.double_slot1 + self.charm_slot1)
+        charm2 = rng.random(size) < self.charm_slot2
+        return double1 | charm1 << 1 | charm2 << 2
+
+
+@dataclass
+class TimingModel:
+    """
+    Value object describing how long each part of a reset takes.
+
+    Decision durations are either fixed (optionally with multiplicative
+    log-normal jitter) or resampled from measured durations.
+    """
+
+    scan: float
+    reset: float
+    durations: dict[FarmingDecision, float]
+    soul_purchase: float = 0.0
+    jitter: float = 0.0
+    samples: dict[FarmingDecision, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_farming_constants(
+        cls,
+        jitter: float = 0.0,
+        delays: Optional[dict[str, float]] = None,
+    ) -> 'TimingModel':
+        """
+        Factory method deriving timings from the FarmingService delays.
+
+        Args:
+            jitter: Standard deviation of the log-normal duration noise.
+            delays: Current 'action', 'click' and 'reset' delays, e.g.
+                ``DelayTuner.learned_values()``; missing ones use the
+                FarmingService baselines.
+        """
+        delays = {
+            'action': FarmingService.ACTION_DELAY,
+            'click': FarmingService.CLICK_DELAY,
+            'reset': FarmingService.RESET_DELAY,
+            **(delays or {}),
+        }
+        action = delays['action']
+        soul_check = (
+            FarmingService.SOUL_WAIT_TIME + ScanService.CURSOR_SETTLE_DELAY
+        )
+        return cls(
+            scan=ScanService.CURSOR_SETTLE_DELAY,
+            reset=(
+                3 * action
+                + delays['reset']
+                + FarmingService.SETTLE_CHECK_DELAY
+            ),
+            durations={
+                FarmingDecision.NONE: 0.0,
+                FarmingDecision.SKIP_SLOT_1: soul_check,
+                FarmingDecision.SKIP_SLOT_2: action + soul_check,
+                FarmingDecision.SKIP_BOTH_SLOTS: 2 * soul_check + action,
+            },
+            soul_purchase=delays['click'] + action,
+            jitter=jitter,
+        )
+
+    @classmethod
+    def from_measurements(
+        cls,
+        scan: float,
+        reset: float,
+        samples: dict[FarmingDecision, list[float]],
+        soul_purchase: float = 0.0,
+    ) -> 'TimingModel':
+        """
+        Factory method resampling measured decision durations.
+
+        Args:
+            scan: Average scan time in seconds.
+            reset: Average reset time in seconds.
+            samples: Measured execution durations per decision.
+            soul_purchase: Extra seconds spent buying a found soul.
+        """
+        arrays = {d: np.asarray(s, dtype=float) for d, s in samples.items()}
+        return cls(
+            scan=scan,
+            reset=reset,
+            durations={d: float(a.mean()) for d, a in arrays.items()},
+            soul_purchase=soul_purchase,
+            samples=arrays,
+        )
+
+    def sample(
+        self, decisions: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        Draw execution durations for an array of decision indices.
+
+        Args:
+            decisions: Indices into DECISIONS.
+            rng: Random generator.
+
+        Returns:
+            Durations in seconds, one per decision.
+        """
+        means = np.array([self.durations.get(d, 0.0) for d in DECISIONS])
+        durations = means[decisions]
+        if self.jitter:
+            durations = durations * rng.lognormal(
+                -(self.jitter**2) / 2, self.jitter, durations.shape
+            )
+        for index, decision in enumerate(DECISIONS):
+            measured = self.samples.get(decision)
+            if measured is None or not measured.size:
+                continue
+            mask = decisions == index
+            durations[mask] = rng.choice(measured, int(mask.sum()))
+        return durations
+
+
+@dataclass
+class SimulationResult:
+    """Value object summarising a simulation run."""
+
+    resets: int
+    souls: int
+    hours: float
+    souls_per_hour: float
+    ci_low: float
+    ci_high: float
+    decisions: dict[FarmingDecision, int]
+
+    def __str__(self) -> str:
+        return (
+            f'{self.souls_per_hour:.3f} souls/hour '
+            f'(95% CI {self.ci_low:.3f}-{self.ci_high:.3f}) '
+            f'over {self.resets:,} resets'
+        )
+
+
+class MonteCarloSimulator:
+    """
+    Simulates many resets of a farming strategy at once.
+
+    The policy is evaluated once per distinct tag combination and then
+    applied to all sampled resets through a lookup table, so any pure
+    ``decide(context)`` function (or ``policy.decide``) can be used.
+    """
+
+    # Two-sided 95% normal quantile used for confidence intervals
+    Z_95 = 1.96
+
+    def __init__(
+        self,
+        game: Optional[GameModel] = None,
+        timing: Optional[TimingModel] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            game: Tag and soul probabilities (defaults to GameModel()).
+            timing: Timing model (defaults to the FarmingService delays).
+            seed: Seed for reproducible runs.
+        """
+        self.game = game or GameModel()
+        self.timing = timing or TimingModel.from_farming_constants()
+        self.rng = np.random.default_rng(seed)
+
+    def decision_table(
+        self, policy: Callable[[DecisionContext], FarmingDecision]
+    ) -> np.ndarray:
+        """
+        Tabulate the policy for every tag combination.
+
+        Returns:
+            Decision indices, addressed by double1 | charm1 << 1 |
+            charm2 << 2.
+        """
+        table = np.empty(8, dtype=np.intp)
+        for code in range(8):
+            context = DecisionContext(
+                has_double_slot1=bool(code & 1),
+                has_charm_slot1=bool(code & 2),
+                has_charm_slot2=bool(code & 4),
+            )
+            table[code] = DECISIONS.index(policy(context))
+        return table
+
+    def run(
+        self,
+        policy: Callable[
+            [DecisionContext], FarmingDecision
+        ] = decide_farming_action,
+        resets: int = 1_000_000,
+        batches: int = 20,
+    ) -> SimulationResult:
+        """
+        Simulate resets and estimate souls per hour.
+
+        The confidence interval uses batch means: resets are split into
+        equally sized batches whose rates are treated as independent.
+
+        Args:
+            policy: Decision function to evaluate.
+            resets: Total number of simulated resets.
+            batches: Number of batches for the confidence interval.
+
+        Returns:
+            The estimated rate with its 95% confidence interval.
+        """
+        table = self.decision_table(policy)
+        packs_by_decision = np.array([PACKS_OPENED[d] for d in DECISIONS])
+        batch_size = max(resets // batches, 1)
+        rates = []
+        total_souls = 0
+        total_time = 0.0
+        counts = np.zeros(len(DECISIONS), dtype=np.int64)
+
+        for _ in range(batches):
+            codes = self.game.sample_codes(batch_size, self.rng)
+            decisions = table[codes]
+            souls = self.rng.binomial(
+                packs_by_decision[decisions], self.game.soul_per_pack
+            )
+            seconds = (
+                self.timing.scan
+                + self.timing.reset
+                + self.timing.sample(decisions, self.rng)
+                + souls * self.timing.soul_purchase
+            ).sum()
+
+            rates.append(souls.sum() / seconds * 3600)
+            total_souls += int(souls.sum())
+            total_time += float(seconds)
+            counts += np.bincount(decisions, minlength=len(DECISIONS))
+
+        rates_array = np.array(rates)
+        rate = total_souls / total_time * 3600
+        margin = 0.0
+        if batches > 1:
+            margin = self.Z_95 * rates_array.std(ddof=1) / np.sqrt(batches)
+
+        return SimulationResult(
+            resets=batch_size * batches,
+            souls=total_souls,
+            hours=total_time / 3600,
+            souls_per_hour=rate,
+            ci_low=max(rate - margin, 0.0),
+            ci_high=rate + margin,
+            decisions={
+                d: int(counts[i]) for i, d in enumerate(DECISIONS) if counts[i]
+            },
+        )
@@ -0,0 +1,225 @@
+"""
+Timeline scheduler for declarative action sequences.
+
+A timeline is an ordered list of steps, each with an action, the earliest
+time it may start (relative to the previous step) and an optional
+precondition. The scheduler runs queued background work while it waits
+for a step's earliest time and reports where the time went.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Delay = Union[float, Callable[[], float]]
+
+
+@dataclass
+class TimelineStep:
+    """
+    A single step of a timeline.
+
+    The delay may be a callable so adaptive delays are only resolved
+    (and accounted for) when the step actually runs.
+    """
+
+    name: str
+    action: Callable[[], object]
+    after: Delay = 0.0
+    precondition: Optional[Callable[[], bool]] = None
+
+    def resolve_delay(self) -> float:
+        """Get the delay to wait before this step, in seconds."""
+        return self.after() if callable(self.after) else self.after
+
+
+class Timeline:
+    """
+    Ordered sequence of steps built with a fluent interface.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize an empty timeline.
+
+        Args:
+            name: Name used when reporting the timeline.
+        """
+        self.name = name
+        self.steps: list[TimelineStep] = []
+
+    def step(
+        self,
+        name: str,
+        action: Callable[[], object],
+        after: Delay = 0.0,
+        when: Optional[Callable[[], bool]] = None,
+    ) -> 'Timeline':
+        """
+        Append a step to the timeline.
+
+        Args:
+            name: Name of the step.
+            action: Callable executing the step.
+            after: Seconds to wait after the previous step completes.
+            when: Precondition checked before waiting; the step (and its
+                wait) is skipped when it returns False.
+
+        Returns:
+            The timeline, for chaining.
+        """
+        self.steps.append(TimelineStep(name, action, after, when))
+        return self
+
+    def wait(
+        self, after: Delay, when: Optional[Callable[[], bool]] = None
+    ) -> 'Timeline':
+        """Append a trailing wait with no action."""
+        return self.step('wait', lambda: None, after, when)
+
+
+@dataclass
+class StepTiming:
+    """Value object recording how long a step waited and ran."""
+
+    name: str
+    waited: float = 0.0
+    ran: float = 0.0
+    skipped: bool = False
+
+
+@dataclass
+class TimelineReport:
+    """Value object describing the execution of one timeline."""
+
+    name: str
+    elapsed: float = 0.0
+    background_time: float = 0.0
+    background_tasks: int = 0
+    steps: list[StepTiming] = field(default_factory=list)
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds spent idle while waiting for steps."""
+        return sum(s.waited for s in self.steps)
+
+    @property
+    def action_time(self) -> float:
+        """Seconds spent executing step actions."""
+        return sum(s.ran for s in self.steps)
+
+    @property
+    def critical_path(self) -> list[StepTiming]:
+        """Executed steps, in the order that determined elapsed time."""
+        return [s for s in self.steps if not s.skipped]
+
+
+class TimelineScheduler:
+    """
+    Executes timelines, filling waits with queued background work.
+
+    Background tasks only start if at least MIN_BACKGROUND_SLACK seconds
+    remain before the next step, so they rarely delay the timeline.
+    """
+
+    MIN_BACKGROUND_SLACK = 0.02
+
+    def __init__(
+        self,
+        now: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        checkpoint: Callable[[], None] = lambda: None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            now: Monotonic time source in seconds.
+            sleep: Function blocking for the given number of seconds.
+            checkpoint: Called before every step; may raise to abort the
+                timeline (e.g. when the automation is paused).
+        """
+        self._now = now
+        self._sleep = sleep
+        self._checkpoint = checkpoint
+        self._background: deque[Callable[[], object]] = deque()
+
+    @property
+    def pending_background(self) -> int:
+        """Number of background tasks waiting for idle time."""
+        return len(self._background)
+
+    def submit(self, task: Callable[[], object]) -> None:
+        """
+        Queue a background task to run during the next waits.
+
+        Args:
+            task: Short callable; exceptions are logged and swallowed.
+        """
+        self._background.append(task)
+
+    def drain(self) -> int:
+        """
+        Run all pending background tasks now, e.g. before shutting down.
+
+        Returns:
+            Number of tasks run.
+        """
+        report = TimelineReport(name='drain')
+        self._fill_wait(float('inf'), report)
+        return report.background_tasks
+
+    def run(self, timeline: Timeline) -> TimelineReport:
+        """
+        Execute a timeline step by step.
+
+        Args:
+            timeline: The timeline to execute.
+
+        Returns:
+            A report of waits, actions and background work.
+        """
+        report = TimelineReport(name=timeline.name)
+        start = self._now()
+
+        for step in timeline.steps:
+            if step.precondition is not None and not step.precondition():
+                report.steps.append(StepTiming(step.name, skipped=True))
+                continue
+
+            self._checkpoint()
+            timing = StepTiming(step.name)
+            deadline = self._now() + step.resolve_delay()
+            self._fill_wait(deadline, report)
+            remaining = deadline - self._now()
+            if remaining > 0:
+                self._sleep(remaining)
+                timing.waited = remaining
+
+            self._checkpoint()
+            action_start = self._now()
+            step.action()
+            timing.ran = self._now() - action_start
+            report.steps.append(timing)
+
+        report.elapsed = self._now() - start
+        return report
+
+    def _fill_wait(self, deadline: float, report: TimelineReport) -> None:
+        """Run background tasks while enough slack remains."""
+        while (
+            self._background
+            and deadline - self._now() > self.MIN_BACKGROUND_SLACK
+        ):
+            task = self._background.popleft()
+            task_start = self._now()
+            try:
+                task()
+            except Exception as e:
+                logger.warning(f'Background task failed: {e}')
+            report.background_time += self._now() - task_start
+            report.background_tasks += 1
@@ -0,0 +1,167 @@
+"""
+Closed-loop verification of input actions.
+
+Each action may carry a cheap visual postcondition (a region changing,
+or an asset appearing/disappearing) that is polled for a short time
+after the action. Unconfirmed actions are retried a bounded number of
+times so desyncs are caught within a few hundred milliseconds.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Protocol
+
+import numpy as np
+
+from ..domain.model import Region
+from .scanning import ScanService
+
+logger = logging.getLogger(__name__)
+
+
+class Postcondition(Protocol):
+    """A visual check confirming that an action took effect."""
+
+    description: str
+
+    def prepare(self) -> None:
+        """Capture any reference state, right before the action."""
+        ...
+
+    def check(self) -> bool:
+        """Check whether the expected effect is visible."""
+        ...
+
+
+class RoiChanged:
+    """Postcondition: a region looks different than before the action."""
+
+    def __init__(self, scanner: ScanService, region: Region):
+        self.scanner = scanner
+        self.region = region
+        self.description = f'{region} changed'
+        self._reference: Optional[np.ndarray] = None
+
+    def prepare(self) -> None:
+        self._reference = self.scanner.capture_roi(self.region)
+
+    def check(self) -> bool:
+        current = self.scanner.capture_roi(self.region)
+        return self.scanner.has_changed(self._reference, current)
+
+
+class AssetPresent:
+    """Postcondition: an asset is visible in a region."""
+
+    def __init__(self, scanner: ScanService, asset_name: str, region: Region):
+        self.scanner = scanner
+        self.asset_name = asset_name
+        self.region = region
+        self.description = f'{asset_name} present'
+
+    def prepare(self) -> None:
+        pass
+
+    def check(self) -> bool:
+        return self.scanner.is_asset_present(self.asset_name, self.region)
+
+
+class AssetAbsent(AssetPresent):
+    """Postcondition: an asset is no longer visible in a region."""
+
+    def __init__(self, scanner: ScanService, asset_name: str, region: Region):
+        super().__init__(scanner, asset_name, region)
+        self.description = f'{asset_name} absent'
+
+    def check(self) -> bool:
+        return not super().check()
+
+
+@dataclass
+class VerificationResult:
+    """Value object describing the outcome of a verified action."""
+
+    verified: bool
+    attempts: int
+    elapsed: float
+
+
+class ActionVerifier:
+    """
+    Performs actions and polls their postconditions with bounded retries.
+    """
+
+    TIMEOUT = 0.4
+    POLL_INTERVAL = 0.05
+    MAX_RETRIES = 2
+
+    def __init__(
+        self,
+        now: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            now: Monotonic time source in seconds.
+            sleep: Function blocking for the given number of seconds.
+        """
+        self._now = now
+        self._sleep = sleep
+        self.retries = 0
+        self.failures = 0
+
+    def perform(
+        self,
+        name: str,
+        action: Callable[[], object],
+        postcondition: Postcondition,
+        max_retries: Optional[int] = None,
+    ) -> VerificationResult:
+        """
+        Run an action until its postcondition holds or retries run out.
+
+        Args:
+            name: Action name used in log messages.
+            action: Callable performing the action.
+            postcondition: Check confirming the action took effect.
+            max_retries: Override of MAX_RETRIES (use 0 for toggles).
+
+        Returns:
+            Whether the action was confirmed, and after how many attempts.
+        """
+        retries = self.MAX_RETRIES if max_retries is None else max_retries
+        start = self._now()
+
+        for attempt in range(1, retries + 2):
+            postcondition.prepare()
+            action()
+            if self._poll(postcondition):
+                return VerificationResult(True, attempt, self._now() - start)
+            if attempt <= retries:
+                self.retries += 1
+                logger.info(
+                    f'VERIFY: {name} not confirmed '
+                    f'({postcondition.description}), '
+                    f'retry {attempt}/{retries}'
+                )
+
+        self.failures += 1
+        logger.warning(
+            f'VERIFY: {name} failed after {retries + 1} attempts '
+            f'({postcondition.description})'
+        )
+        return VerificationResult(False, retries + 1, self._now() - start)
+
+    def _poll(self, postcondition: Postcondition) -> bool:
+        """Check the postcondition until it holds or TIMEOUT elapses."""
+        deadline = self._now() + self.TIMEOUT
+        while True:
+            if postcondition.check():
+                return True
+            remaining = deadline - self._now()
+            if remaining <= 0:
+                return False
+            self._sleep(min(self.POLL_INTERVAL, remaining))
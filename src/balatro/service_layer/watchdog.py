@@ -0,0 +1,136 @@
+"""
+Stall and desync detection for the farming loop.
+
+A click landing during an animation can leave the game in the shop or a
+pack screen, after which every iteration replays the same clicks without
+resetting. The watchdog notices when expected screen transitions stop
+happening so the farming service can recover.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class StallWatchdog:
+    """
+    Detects iterations that no longer make progress.
+
+    Two symptoms are tracked:
+    - the post-reset frame is unchanged across consecutive iterations;
+    - no tags were detected for many consecutive iterations.
+    """
+
+    # Side length of the grayscale thumbnail used as frame fingerprint
+    FINGERPRINT_SIZE = 16
+
+    # Mean absolute difference below which two fingerprints are the same
+    UNCHANGED_THRESHOLD = 4.0
+
+    def __init__(self, max_unchanged: int = 3, max_tagless: int = 100):
+        """
+        Initialize the watchdog.
+
+        Args:
+            max_unchanged: Consecutive unchanged frames that mean a stall.
+            max_tagless: Consecutive iterations without any detected tag
+                that mean a stall.
+        """
+        self.max_unchanged = max_unchanged
+        self.max_tagless = max_tagless
+        self.unchanged_count = 0
+        self.tagless_count = 0
+        self.stalls = 0
+        self.total_lost = 0.0
+        self._last_fingerprint: Optional[np.ndarray] = None
+        self._last_changed: Optional[float] = None
+        self._last_tagged: Optional[float] = None
+        self._stalled_since: Optional[float] = None
+
+    def fingerprint(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Reduce a frame to a small grayscale thumbnail.
+
+        Args:
+            frame: Captured BGR (or grayscale) image.
+
+        Returns:
+            A FINGERPRINT_SIZE x FINGERPRINT_SIZE float array (or the
+            grayscale frame itself if it is smaller than that).
+        """
+        gray = frame.mean(axis=2) if frame.ndim == 3 else frame
+        size = self.FINGERPRINT_SIZE
+        block_h, block_w = gray.shape[0] // size, gray.shape[1] // size
+        if block_h == 0 or block_w == 0:
+            return gray.astype(np.float64)
+
+        # Average non-overlapping blocks of the cropped frame
+        cropped = gray[: block_h * size, : block_w * size]
+        return cropped.reshape(size, block_h, size, block_w).mean(axis=(1, 3))
+
+    def observe(
+        self, frame: Optional[np.ndarray], tags_found: bool, now: float
+    ) -> Optional[str]:
+        """
+        Record the outcome of one iteration.
+
+        Args:
+            frame: Capture of the tag area after the reset, if any.
+            tags_found: Whether the iteration's scan detected any tag.
+            now: Current clock time in seconds.
+
+        Returns:
+            A description of the stall if one was detected, else None.
+        """
+        if self._last_changed is None:
+            self._last_changed = self._last_tagged = now
+
+        if frame is not None and frame.size:
+            current = self.fingerprint(frame)
+            previous = self._last_fingerprint
+            self._last_fingerprint = current
+            if (
+                previous is not None
+                and previous.shape == current.shape
+                and float(np.abs(current - previous).mean())
+                < self.UNCHANGED_THRESHOLD
+            ):
+                self.unchanged_count += 1
+            else:
+                self.unchanged_count = 0
+                self._last_changed = now
+
+        if tags_found:
+            self.tagless_count = 0
+            self._last_tagged = now
+        else:
+            self.tagless_count += 1
+
+        if self.unchanged_count >= self.max_unchanged:
+            self._stalled_since = self._last_changed
+            return f'screen unchanged for {self.unchanged_count} iterations'
+        if self.tagless_count >= self.max_tagless:
+            self._stalled_since = self._last_tagged
+            return f'no tags detected for {self.tagless_count} iterations'
+        return None
+
+    def record_stall(self, now: float) -> float:
+        """
+        Account for a detected stall and restart detection.
+
+        Args:
+            now: Current clock time in seconds.
+
+        Returns:
+            Seconds lost since the loop last made progress.
+        """
+        since = self._stalled_since if self._stalled_since is not None else now
+        lost = max(now - since, 0.0)
+        self.stalls += 1
+        self.total_lost += lost
+        self.unchanged_count = 0
+        self.tagless_count = 0
+        self._last_fingerprint = None
+        self._last_changed = self._last_tagged = now
+        self._stalled_since = None
+        return lost
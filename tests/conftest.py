@@ -0,0 +1,73 @@
+"""
+Shared fixtures: the shipped profile, the simulated game and farming
+services wired to fakes or to the simulator.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import balatro
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.config import JsonConfigRepository
+from balatro.adapters.simulated_game import (
+    SimulatedGame,
+    SimulatedInputAdapter,
+    SimulatedScreenAdapter,
+)
+from balatro.service_layer.farming import FarmingService
+
+from .fakes import FakeConfigRepository, FakeInputAdapter, FakeScreenAdapter
+
+PACKAGE_DIR = Path(balatro.__file__).parent
+
+
+@pytest.fixture
+def profile():
+    """The shipped 1080p profile."""
+    return JsonConfigRepository(PACKAGE_DIR / 'config.json').load_profile(
+        '1080p'
+    )
+
+
+@pytest.fixture
+def clock():
+    """Virtual clock shared by the game and the service under test."""
+    return VirtualClock()
+
+
+@pytest.fixture
+def make_game(profile, clock):
+    """Factory of simulated games rendering the real assets."""
+
+    def make(**kwargs) -> SimulatedGame:
+        return SimulatedGame(profile, PACKAGE_DIR / 'assets', clock, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def make_simulated_farming(profile, clock):
+    """Factory of FarmingServices playing a simulated game."""
+
+    def make(game, input_adapter=None, **kwargs) -> FarmingService:
+        return FarmingService(
+            SimulatedScreenAdapter(game),
+            input_adapter or SimulatedInputAdapter(game),
+            FakeConfigRepository(profile),
+            clock=clock,
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def fake_farming(clock):
+    """FarmingService on a blank fake screen and a virtual clock."""
+    return FarmingService(
+        FakeScreenAdapter(),
+        FakeInputAdapter(),
+        FakeConfigRepository(),
+        clock=clock,
+    )
@@ -5,6 +5,7 @@ These provide in-memory implementations of the adapter ports
 for fast unit testing without real screen/keyboard I/O.
 """
 
+import asyncio
 from typing import Callable, Optional
 
 import numpy as np
@@ -17,16 +18,24 @@ class FakeScreenAdapter:
     Fake screen adapter for testing.
 
     Configurable scan results allow testing decision logic
-    without actual screen capture.
+    without actual screen capture. An optional frame provider supplies
+    the captured images (blank frames by default).
     """
 
-    def __init__(self, scan_results: Optional[list[ScanResult]] = None):
+    def __init__(
+        self,
+        scan_results: Optional[list[ScanResult]] = None,
+        frame_provider: Optional[Callable[[], np.ndarray]] = None,
+    ):
         self.scan_results = scan_results or []
+        self.frame_provider = frame_provider
         self.captured_regions: list[Optional[Region]] = []
         self.match_calls: list[tuple[str, int]] = []
 
     def capture_region(self, region: Optional[Region] = None) -> np.ndarray:
         self.captured_regions.append(region)
+        if self.frame_provider:
+            return self.frame_provider()
         return np.zeros((100, 100, 3), dtype=np.uint8)
 
     def match_template(
@@ -119,3 +128,84 @@ class FakeConfigRepository:
 
     def save_profile(self, config: ProfileConfig) -> None:
         self.saved_profiles.append(config)
+
+
+class FakeAsyncScreenAdapter:
+    """
+    Fake async screen adapter for testing.
+
+    Delegates to FakeScreenAdapter; an optional delay simulates slow
+    matching to exercise scan deadlines.
+    """
+
+    def __init__(
+        self,
+        scan_results: Optional[list[ScanResult]] = None,
+        match_delay: float = 0.0,
+        frame_provider: Optional[Callable[[], np.ndarray]] = None,
+    ):
+        self.screen = FakeScreenAdapter(scan_results, frame_provider)
+        self.match_delay = match_delay
+
+    @property
+    def match_calls(self) -> list[tuple[str, int]]:
+        return self.screen.match_calls
+
+    async def capture_region(
+        self, region: Optional[Region] = None
+    ) -> np.ndarray:
+        return self.screen.capture_region(region)
+
+    async def match_template(
+        self,
+        haystack: np.ndarray,
+        asset_name: str,
+        confidence_threshold: Optional[float] = None,
+        slot: int = 0,
+        region_offset: Optional[Coordinates] = None,
+    ) -> list[ScanResult]:
+        if self.match_delay:
+            await asyncio.sleep(self.match_delay)
+        return self.screen.match_template(
+            haystack, asset_name, slot=slot, region_offset=region_offset
+        )
+
+
+class FakeAsyncInputAdapter:
+    """
+    Fake async input adapter for testing.
+
+    Records all actions for verification.
+    """
+
+    def __init__(self):
+        self.clicks: list[Coordinates] = []
+        self.moves: list[Coordinates] = []
+        self.key_presses: list[str] = []
+
+    async def click(self, coords: Coordinates) -> None:
+        self.clicks.append(coords)
+
+    async def move_to(self, coords: Coordinates) -> None:
+        self.moves.append(coords)
+
+    async def press_key(self, key: str) -> None:
+        self.key_presses.append(key)
+
+
+class FakeEventLog:
+    """
+    Fake event adapter for testing.
+
+    Records emitted events in memory.
+    """
+
+    def __init__(self):
+        self.events: list = []
+        self.flushes = 0
+
+    def emit(self, event) -> None:
+        self.events.append(event)
+
+    def flush(self) -> None:
+        self.flushes += 1
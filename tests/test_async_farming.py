@@ -0,0 +1,243 @@
+"""
+Tests for the asyncio farming service and its control server.
+"""
+
+import asyncio
+import json
+
+import numpy as np
+
+from balatro.adapters.control_server import serve_control
+from balatro.domain.decisions import FarmingDecision
+from balatro.domain.events import (
+    ActionClicked,
+    DecisionMade,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+)
+from balatro.domain.model import Coordinates, ScanResult
+from balatro.service_layer.async_farming import AsyncFarmingService
+
+from .fakes import (
+    FakeAsyncInputAdapter,
+    FakeAsyncScreenAdapter,
+    FakeConfigRepository,
+    FakeEventLog,
+)
+
+
+def make_service(
+    scan_results=None,
+    match_delay=0.0,
+    sleep=None,
+    frame_provider=None,
+    config=None,
+) -> AsyncFarmingService:
+    sleeps: list[float] = []
+
+    async def instant_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        await asyncio.sleep(0)
+
+    service = AsyncFarmingService(
+        FakeAsyncScreenAdapter(scan_results, match_delay, frame_provider),
+        FakeAsyncInputAdapter(),
+        config or FakeConfigRepository(),
+        sleep=sleep or instant_sleep,
+        events=FakeEventLog(),
+    )
+    service.sleeps = sleeps
+    return service
+
+
+class TestAsyncFarmingService:
+    """Tests for async iterations, scan deadlines and cancellation."""
+
+    def test_iteration_skips_charm_and_resets(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)]
+        )
+
+        asyncio.run(service.run_iteration())
+
+        assert Coordinates(715, 850) in service.input.clicks
+        assert service.input.key_presses == ['esc']
+        assert service.state.current_run == 1
+        assert AsyncFarmingService.SOUL_WAIT_TIME in service.sleeps
+
+    def test_slow_scans_hit_deadline(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)],
+            match_delay=0.5,
+        )
+        service.SCAN_TIMEOUT = 0.01
+
+        decision = asyncio.run(service.scan_and_decide())
+
+        assert decision == FarmingDecision.NONE
+        assert service.scan_timeouts == 4
+
+    def test_pause_cancels_iteration_and_stop_exits(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)],
+            sleep=asyncio.sleep,
+        )
+
+        async def scenario():
+            loop_task = asyncio.create_task(service.run())
+            service.start()
+            await asyncio.sleep(0.3)  # inside the 5s soul wait
+            service.pause()
+            await asyncio.sleep(0.01)
+            assert not loop_task.done()
+            service.stop()
+            await asyncio.wait_for(loop_task, timeout=1.0)
+
+        asyncio.run(scenario())
+
+        assert service.state.current_run == 0
+        assert not service.state.is_running
+
+    def test_next_scan_overlaps_reset_delay(self):
+        log: list[tuple[str, float]] = []
+
+        async def scaled_sleep(seconds: float) -> None:
+            log.append(('sleep', seconds))
+            await asyncio.sleep(seconds / 100)
+            log.append(('woke', seconds))
+
+        service = make_service(sleep=scaled_sleep)
+        reset = service.timing.get('reset')
+        settle = AsyncFarmingService.CURSOR_SETTLE_DELAY
+
+        async def scenario():
+            await service.run_iteration()
+            pending = service._next_scan
+            await service.run_iteration()
+            return pending
+
+        pending = asyncio.run(scenario())
+
+        # The cursor is parked for the next scan during the reset delay
+        reset_start = log.index(('sleep', reset))
+        reset_end = log.index(('woke', reset), reset_start + 1)
+        assert ('woke', settle) in log[reset_start:reset_end]
+        # The next iteration uses that scan instead of scanning again
+        assert pending.done()
+        assert service.state.current_run == 2
+
+    def test_clicks_feed_the_delay_tuner(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(950, 900), 0.95, slot=2)]
+        )
+        action = service.timing.delays['action']
+
+        asyncio.run(service.run_iteration())
+
+        # A blank screen confirms neither the skip nor the reset
+        assert action.failures == 2
+        assert service.timing.delays['reset'].failures == 1
+        assert service.verify_failures == 2
+
+    def test_confirmed_clicks_shorten_delays(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(950, 900), 0.95, slot=2)],
+            frame_provider=lambda: np.full(
+                (100, 100, 3),
+                len(service.input.clicks) * 50 % 256,
+                dtype=np.uint8,
+            ),
+        )
+        action = service.timing.delays['action']
+
+        asyncio.run(service._execute_decision(FarmingDecision.SKIP_SLOT_2))
+
+        assert action.successes == 1
+        assert action.failures == 0
+        assert service.timing.get('action') < AsyncFarmingService.ACTION_DELAY
+        assert service.verify_failures == 0
+
+
+class TestAsyncSessionWiring:
+    """Tests for the events, statistics, watchdog and delay saving."""
+
+    def test_iteration_emits_events_and_statistics(self):
+        service = make_service(
+            [ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)]
+        )
+
+        asyncio.run(service.run_iteration())
+
+        types = [type(event) for event in service.events.events]
+        assert types[:3] == [SessionStarted, ScanCompleted, DecisionMade]
+        assert ActionClicked in types
+        assert types[-1] is NewGameStarted
+        scan = service.events.events[1]
+        assert (scan.double_slot1, scan.charm_slot1) == (False, True)
+        stats = service.state.stats
+        assert (stats.resets, stats.charms, stats.iterations) == (1, 1, 1)
+        assert service.events.flushes == 1
+
+    def test_frozen_screen_triggers_recovery(self):
+        service = make_service()
+        max_unchanged = service.watchdog.max_unchanged
+
+        async def scenario():
+            for _ in range(max_unchanged + 1):
+                await service.run_iteration()
+
+        asyncio.run(scenario())
+
+        assert service.watchdog.stalls == 1
+        assert service.metrics()['stalls'] == 1
+        assert Coordinates(1335, 975) in service.input.clicks
+        assert service.state.current_run == max_unchanged + 2
+
+    def test_run_saves_learned_delays(self):
+        config = FakeConfigRepository()
+        service = make_service(config=config)
+
+        async def scenario():
+            loop_task = asyncio.create_task(service.run())
+            service.start()
+            await asyncio.sleep(0.05)
+            service.stop()
+            await loop_task
+
+        asyncio.run(scenario())
+
+        assert service.state.current_run > 0
+        saved = config.saved_profiles[-1]
+        assert saved.delays == service.timing.learned_values()
+        assert service.profile.delays == saved.delays
+
+
+class TestControlServer:
+    """Tests for the start/pause/stop/metrics line protocol."""
+
+    def test_commands_and_metrics(self):
+        service = make_service()
+
+        async def scenario():
+            server = await serve_control(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            replies = []
+            for command in ('pause', 'metrics', 'bogus'):
+                writer.write(command.encode() + b'\n')
+                await writer.drain()
+                replies.append(json.loads(await reader.readline()))
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return replies
+
+        paused, metrics, bogus = asyncio.run(scenario())
+
+        assert paused == {'ok': True, 'command': 'pause'}
+        assert metrics['metrics']['runs'] == 0
+        assert metrics['metrics']['farming'] is False
+        assert bogus['ok'] is False
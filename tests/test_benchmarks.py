@@ -0,0 +1,141 @@
+"""
+Tests for the benchmark harness.
+"""
+
+import logging
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+from benchmarks.macro import (
+    MacroResult,
+    compare_macro,
+    load_macro,
+    run_macro,
+    save_macro,
+)
+
+
+def result(name, ns, peak=0):
+    return BenchmarkResult(name, ns, ns, peak, loops=1)
+
+
+class TestHarness:
+    """Tests for measuring and comparing benchmarks."""
+
+    def test_run_benchmark_measures_time_and_allocations(self):
+        measured = run_benchmark(
+            'alloc', lambda: bytearray(100_000), min_time=0.01
+        )
+        assert measured.ns_per_op > 0
+        assert measured.peak_bytes_per_op >= 100_000
+
+    def test_compare_flags_only_regressions_above_threshold(self):
+        baseline = {'fast': result('fast', 100), 'slow': result('slow', 100)}
+        fresh = [result('fast', 105), result('slow', 150)]
+
+        regressions = compare(fresh, baseline, threshold=10)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith('slow')
+
+    def test_compare_flags_allocation_growth(self):
+        baseline = {'a': result('a', 100, peak=10_000)}
+        regressions = compare([result('a', 100, 50_000)], baseline, 10)
+        assert 'peak allocation' in regressions[0]
+
+    def test_results_round_trip(self, tmp_path):
+        path = tmp_path / 'results.json'
+        save_results(path, [result('a', 123.0, 456)])
+        assert load_results(path) == {'a': result('a', 123.0, 456)}
+
+
+def macro(cpu_seconds, virtual_seconds=10.0):
+    return MacroResult(
+        iterations=10,
+        wall_seconds=cpu_seconds,
+        cpu_seconds=cpu_seconds,
+        virtual_seconds=virtual_seconds,
+    )
+
+
+class TestMacro:
+    """Tests for the end-to-end farming benchmark."""
+
+    def test_run_macro_splits_cpu_time_by_stage(self):
+        measured = run_macro(iterations=2)
+
+        assert measured.iterations == 2
+        assert measured.virtual_seconds > 0
+        assert set(measured.stage_cpu_seconds) == {
+            'scan',
+            'execute',
+            'reset',
+            'other',
+        }
+        assert sum(measured.stage_cpu_seconds.values()) >= (
+            measured.cpu_seconds * 0.99
+        )
+        assert (
+            0
+            < measured.projected_resets_per_hour
+            < (3600 * measured.iterations / measured.virtual_seconds)
+        )
+
+    def test_compare_macro_flags_cpu_regression(self):
+        regressions = compare_macro(macro(2.0), macro(1.0), threshold=10)
+        assert any('cpu per iteration' in r for r in regressions)
+        assert compare_macro(macro(1.05), macro(1.0), threshold=10) == []
+
+    def test_compare_macro_flags_slower_resets(self):
+        regressions = compare_macro(
+            macro(1.0, virtual_seconds=20.0), macro(1.0), threshold=10
+        )
+        assert regressions == [regressions[0]]
+        assert 'resets/hour' in regressions[0]
+
+    def test_macro_round_trip(self, tmp_path):
+        path = tmp_path / 'macro.json'
+        save_macro(path, macro(1.0))
+        assert load_macro(path) == macro(1.0)
+
+
+class TestMain:
+    """Tests for the regression gate's exit codes."""
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        """main() disables INFO logging process-wide."""
+        yield
+        logging.disable(logging.NOTSET)
+
+    def args(self, tmp_path, *extra):
+        return [
+            '--suite',
+            'macro',
+            '--iterations',
+            '2',
+            '--baseline',
+            str(tmp_path / 'baseline.json'),
+            '--output',
+            str(tmp_path / 'results.json'),
+            *extra,
+        ]
+
+    def test_missing_baseline_fails(self, tmp_path):
+        assert main(self.args(tmp_path)) == 2
+
+    def test_missing_baseline_can_be_allowed(self, tmp_path):
+        assert main(self.args(tmp_path, '--allow-missing-baseline')) == 0
+
+    def test_stored_baseline_is_compared(self, tmp_path):
+        assert main(self.args(tmp_path, '--update-baseline')) == 0
+        assert (tmp_path / 'macro_baseline.json').exists()
+        assert main(self.args(tmp_path, '--threshold', '1000')) == 0
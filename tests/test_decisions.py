@@ -2,10 +2,15 @@
 Tests for the domain layer decision logic.
 """
 
+from itertools import product
+
 from balatro.domain.decisions import (
     DecisionContext,
     FarmingDecision,
+    ProbeStatistics,
+    TagPredicate,
     decide_farming_action,
+    decide_farming_action_lazily,
     get_decision_description,
 )
 from balatro.domain.model import Coordinates, ScanResult
@@ -81,3 +86,52 @@ class TestDecisionDescription:
             desc = get_decision_description(decision)
             assert isinstance(desc, str)
             assert len(desc) > 0
+
+
+class TestLazyDecision:
+    """Tests for decide_farming_action_lazily."""
+
+    def _run(self, truth, statistics=None):
+        probed = []
+
+        def probe(predicate):
+            probed.append(predicate)
+            return truth[predicate]
+
+        decision, _ = decide_farming_action_lazily(
+            probe, statistics=statistics
+        )
+        return decision, probed
+
+    def test_matches_eager_decision_for_every_screen(self):
+        for values in product((False, True), repeat=3):
+            truth = dict(zip(TagPredicate, values))
+            context = DecisionContext(
+                **{p.field_name: v for p, v in truth.items()}
+            )
+            decision, probed = self._run(truth)
+            assert decision == decide_farming_action(context)
+            assert len(probed) == len(set(probed)) <= 3
+
+    def test_empty_screen_needs_only_charm_checks(self):
+        truth = dict.fromkeys(TagPredicate, False)
+        _, probed = self._run(truth)
+        assert set(probed) == {
+            TagPredicate.CHARM_SLOT1,
+            TagPredicate.CHARM_SLOT2,
+        }
+
+    def test_expensive_predicate_is_probed_last(self):
+        statistics = ProbeStatistics()
+        statistics.costs[TagPredicate.CHARM_SLOT2] = 10.0
+        truth = dict.fromkeys(TagPredicate, False)
+        _, probed = self._run(truth, statistics)
+        assert probed == [TagPredicate.CHARM_SLOT1, TagPredicate.CHARM_SLOT2]
+
+    def test_probe_statistics_smooth_hit_rates(self):
+        statistics = ProbeStatistics()
+        for _ in range(9):
+            statistics.record(TagPredicate.CHARM_SLOT1, True, 0.2)
+        rate = statistics.hit_probability(TagPredicate.CHARM_SLOT1)
+        assert 0.9 < rate < 1.0
+        assert statistics.cost(TagPredicate.CHARM_SLOT1) == 0.2
@@ -2,6 +2,8 @@
 Tests for the domain models.
 """
 
+import threading
+
 import pytest
 
 from balatro.domain.model import (
@@ -61,6 +63,10 @@ class TestRegion:
         region = Region(10, 20, 100, 50)
         assert region.to_tuple() == (10, 20, 100, 50)
 
+    def test_bounding(self):
+        regions = [Region(10, 20, 100, 50), Region(150, 5, 20, 30)]
+        assert Region.bounding(regions) == Region(10, 5, 160, 65)
+
     def test_contains_inside(self):
         region = Region(100, 100, 50, 50)
         inside = Coordinates(125, 125)
@@ -140,6 +146,27 @@ class TestGameState:
         assert not state.is_running
         assert not state.is_farming
 
+    def test_pause_sets_interrupted(self):
+        state = GameState()
+        state.start_farming()
+        assert not state.interrupted.is_set()
+        state.pause_farming()
+        assert state.interrupted.is_set()
+        state.start_farming()
+        assert not state.interrupted.is_set()
+
+    def test_wait_until_active_wakes_on_start(self):
+        state = GameState()
+        timer = threading.Timer(0.05, state.start_farming)
+        timer.start()
+        assert state.wait_until_active(timeout=2.0)
+        timer.join()
+
+    def test_wait_until_active_returns_false_on_stop(self):
+        state = GameState()
+        state.stop()
+        assert not state.wait_until_active(timeout=2.0)
+
     def test_increment_run(self):
         state = GameState()
         assert state.current_run == 0
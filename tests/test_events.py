@@ -0,0 +1,283 @@
+"""
+Tests for domain events, the JSONL event log and event-based statistics.
+"""
+
+import io
+import logging
+from datetime import datetime
+
+import pytest
+
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.event_log import JsonlEventLog, read_events
+from balatro.domain.decisions import (
+    DecisionContext,
+    FarmingDecision,
+    TagPredicate,
+    get_decision_description,
+    tags_taken,
+)
+from balatro.domain.events import (
+    ActionClicked,
+    DecisionMade,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+    SoulFound,
+    event_from_dict,
+)
+from balatro.service_layer.analytics import (
+    AnalyticsService,
+    EventStatisticsAccumulator,
+)
+
+from .fakes import FakeEventLog
+
+WALL_TIME = datetime(2026, 3, 2, 10).timestamp()
+
+
+def session(at=0.0, wall_time=WALL_TIME):
+    return SessionStarted(
+        at=at, wall_time=wall_time, profile='1080p', delays={'click': 1.5}
+    )
+
+
+class TestDecisionTags:
+    """Tests for context-aware decision descriptions and tag counts."""
+
+    def test_both_slots_with_double_is_described_as_double(self):
+        context = DecisionContext(has_double_slot1=True, has_charm_slot2=True)
+
+        assert (
+            get_decision_description(FarmingDecision.SKIP_BOTH_SLOTS, context)
+            == 'Skip for double and charm'
+        )
+        assert tags_taken(FarmingDecision.SKIP_BOTH_SLOTS, context) == (1, 1)
+
+    def test_both_slots_with_two_charms(self):
+        context = DecisionContext(has_charm_slot1=True, has_charm_slot2=True)
+
+        assert (
+            get_decision_description(FarmingDecision.SKIP_BOTH_SLOTS, context)
+            == 'Skip for charm and charm'
+        )
+        assert tags_taken(FarmingDecision.SKIP_BOTH_SLOTS, context) == (0, 2)
+
+    def test_single_slot_takes_only_its_tag(self):
+        context = DecisionContext(has_charm_slot1=True, has_charm_slot2=True)
+
+        assert tags_taken(FarmingDecision.SKIP_SLOT_2, context) == (0, 1)
+        assert tags_taken(FarmingDecision.NONE, context) == (0, 0)
+
+
+class TestJsonlEventLog:
+    """Tests for writing and reading the event file."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'session.events.jsonl'
+        written = [
+            session(),
+            ScanCompleted(1.0, True, False, True),
+            DecisionMade(1.5, 'SKIP_BOTH_SLOTS', 1, 1),
+            ActionClicked(2.0, 'skip_slot_1'),
+            SoulFound(3.0, 700, 760),
+            NewGameStarted(4.0, 2),
+        ]
+        log = JsonlEventLog(path)
+        for event in written:
+            log.emit(event)
+        log.close()
+
+        with path.open(encoding='utf-8') as stream:
+            assert list(read_events(stream)) == written
+
+    def test_appends_to_existing_file(self, tmp_path):
+        path = tmp_path / 'session.events.jsonl'
+        for run in (1, 2):
+            log = JsonlEventLog(path)
+            log.emit(NewGameStarted(float(run), run))
+            log.close()
+
+        with path.open(encoding='utf-8') as stream:
+            assert [event.run for event in read_events(stream)] == [1, 2]
+
+    def test_events_are_flushed_in_batches(self, tmp_path):
+        path = tmp_path / 'session.events.jsonl'
+        log = JsonlEventLog(path, now=lambda: 0.0)
+        log.FLUSH_EVERY = 3
+
+        for run in (1, 2):
+            log.emit(NewGameStarted(float(run), run))
+        assert path.read_text(encoding='utf-8') == ''
+        log.emit(NewGameStarted(3.0, 3))
+        assert path.read_text(encoding='utf-8').count('\n') == 3
+        log.emit(NewGameStarted(4.0, 4))
+        log.close()
+        assert path.read_text(encoding='utf-8').count('\n') == 4
+
+    def test_events_are_flushed_after_interval(self, tmp_path):
+        path = tmp_path / 'session.events.jsonl'
+        clock = VirtualClock()
+        log = JsonlEventLog(path, now=clock.now)
+
+        log.emit(NewGameStarted(1.0, 1))
+        assert path.read_text(encoding='utf-8') == ''
+        clock.advance(JsonlEventLog.FLUSH_INTERVAL)
+        log.emit(NewGameStarted(2.0, 2))
+        assert path.read_text(encoding='utf-8').count('\n') == 2
+        log.close()
+
+    def test_unprobed_tags_round_trip_as_none(self, tmp_path):
+        path = tmp_path / 'session.events.jsonl'
+        log = JsonlEventLog(path)
+        log.emit(ScanCompleted(1.0, None, True, None))
+        log.close()
+
+        with path.open(encoding='utf-8') as stream:
+            assert list(read_events(stream)) == [
+                ScanCompleted(1.0, None, True, None)
+            ]
+
+    def test_torn_last_line_is_skipped(self):
+        stream = io.StringIO(
+            '{"type":"new_game","at":1.0,"run":2}\n{"type":"soul","at":2.'
+        )
+
+        assert list(read_events(stream)) == [NewGameStarted(1.0, 2)]
+
+    def test_unknown_types_are_skipped(self):
+        stream = io.StringIO(
+            '{"type":"future","at":1.0}\n{"type":"soul","at":2.0,"x":1,"y":2}\n'
+        )
+
+        assert list(read_events(stream)) == [SoulFound(2.0, 1, 2)]
+        assert event_from_dict({'type': 'future'}) is None
+
+
+class TestEventStatistics:
+    """Tests for statistics computed from events."""
+
+    def test_counts_and_duration(self):
+        stats = AnalyticsService().parse_events(
+            [
+                session(at=100.0),
+                DecisionMade(101.0, 'SKIP_BOTH_SLOTS', 1, 1),
+                DecisionMade(102.0, 'SKIP_BOTH_SLOTS', 0, 2),
+                SoulFound(103.0, 1, 1),
+                NewGameStarted(160.0, 2),
+            ]
+        )
+
+        assert stats.total_doubles == 1
+        assert stats.total_charms == 3
+        assert stats.total_souls == 1
+        assert stats.new_game_count == 1
+        assert stats.duration_seconds == 60.0
+        assert stats.start == '2026-03-02 10:00:00,000'
+        assert stats.end == '2026-03-02 10:01:00,000'
+
+    def test_sessions_are_separate_clock_segments(self):
+        # The second process restarts the monotonic clock near zero
+        stats = AnalyticsService().parse_events(
+            [
+                session(at=5000.0),
+                NewGameStarted(5030.0, 2),
+                session(at=10.0, wall_time=WALL_TIME + 3600),
+                NewGameStarted(25.0, 2),
+            ]
+        )
+
+        assert stats.new_game_count == 2
+        assert stats.duration_seconds == 45.0
+        assert stats.start == '2026-03-02 10:00:00,000'
+        assert stats.end == '2026-03-02 11:00:15,000'
+
+    def test_unprobed_tags_count_toward_no_rate(self):
+        accumulator = EventStatisticsAccumulator().feed_events(
+            [
+                ScanCompleted(1.0, None, True, False),
+                ScanCompleted(2.0, None, False, None),
+                ScanCompleted(3.0, None, None, True),
+            ]
+        )
+
+        assert accumulator.tag_rates() == {
+            TagPredicate.DOUBLE_SLOT1: None,
+            TagPredicate.CHARM_SLOT1: 0.5,
+            TagPredicate.CHARM_SLOT2: 0.5,
+        }
+        assert accumulator.tag_probes[TagPredicate.CHARM_SLOT2] == 2
+
+    def test_empty_file_returns_none(self, tmp_path, capsys):
+        path = tmp_path / 'empty.events.jsonl'
+        path.write_text('', encoding='utf-8')
+
+        assert AnalyticsService().process_event_file(path) is None
+        assert 'empty' in capsys.readouterr().out
+
+
+class TestFarmingEvents:
+    """Runs the simulated game and checks the emitted events."""
+
+    @pytest.fixture
+    def run_session(self, make_game, make_simulated_farming):
+        """Runs 30 simulated iterations; returns game, service, events."""
+
+        def run():
+            game = make_game(
+                seed=3,
+                charm_probability=0.5,
+                double_probability=0.4,
+                soul_per_pack=0.3,
+            )
+            events = FakeEventLog()
+            farming = make_simulated_farming(game, events=events)
+            for _ in range(30):
+                farming.run_iteration()
+            return game, farming, events.events
+
+        return run
+
+    def test_events_match_the_game(self, run_session):
+        game, _, events = run_session()
+
+        assert isinstance(events[0], SessionStarted)
+        assert events[0].profile == '1080p'
+        timestamps = [event.at for event in events]
+        assert timestamps == sorted(timestamps)
+
+        stats = AnalyticsService().parse_events(events)
+        assert stats.new_game_count == game.runs - 1
+        assert stats.total_souls == game.souls_obtained
+        assert stats.total_doubles + stats.total_charms > 0
+
+    def test_lazy_scans_leave_unprobed_tags_unset(self, run_session):
+        _, _, events = run_session()
+        scans = [event for event in events if isinstance(event, ScanCompleted)]
+
+        assert len(scans) == 30
+        # Without a charm in slot 2 a double in slot 1 need not be checked
+        assert any(
+            scan.double_slot1 is None and scan.charm_slot2 is False
+            for scan in scans
+        )
+
+    def test_text_log_agrees_with_events(self, caplog, run_session):
+        with caplog.at_level(logging.INFO):
+            _, _, events = run_session()
+        log_text = '\n'.join(
+            f'2026-03-02 10:00:00,000 - INFO - {record.getMessage()}'
+            for record in caplog.records
+        )
+
+        from_events = AnalyticsService().parse_events(events)
+        from_text = AnalyticsService().parse_log(log_text)
+
+        assert from_text.total_doubles == from_events.total_doubles
+        assert from_text.total_charms == from_events.total_charms
+        assert from_text.total_souls == from_events.total_souls
+        assert from_text.new_game_count == from_events.new_game_count
+        assert any(
+            isinstance(event, DecisionMade) and event.doubles
+            for event in events
+        )
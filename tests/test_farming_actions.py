@@ -4,10 +4,40 @@ Integration tests for FarmingService.
 Focused on state machine transitions and complex action sequences.
 """
 
-from balatro.domain.model import Coordinates
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from balatro.adapters.clock import VirtualClock
+from balatro.domain.decisions import FarmingDecision
+from balatro.domain.exceptions import FarmingInterrupted
+from balatro.domain.model import Coordinates, ScanResult
 from balatro.service_layer.farming import FarmingService
 
-from .fakes import FakeConfigRepository, FakeInputAdapter, FakeScreenAdapter
+from .fakes import (
+    FakeConfigRepository,
+    FakeEventLog,
+    FakeInputAdapter,
+    FakeScreenAdapter,
+)
+
+
+class SlowFlushEventLog(FakeEventLog):
+    """Event log whose flush takes simulated time."""
+
+    FLUSH_TIME = 0.2
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__()
+        self.clock = clock
+        self.flushed_at: list[float] = []
+
+    def flush(self) -> None:
+        super().flush()
+        self.flushed_at.append(self.clock.now())
+        self.clock.advance(self.FLUSH_TIME)
 
 
 class TestStateMachine:
@@ -19,7 +49,9 @@ class TestStateMachine:
         input_adapter = FakeInputAdapter()
         config = FakeConfigRepository()
 
-        farming = FarmingService(screen, input_adapter, config)
+        farming = FarmingService(
+            screen, input_adapter, config, clock=VirtualClock()
+        )
         farming._setup_hotkeys()
 
         assert not farming.state.is_farming
@@ -32,7 +64,9 @@ class TestStateMachine:
         input_adapter = FakeInputAdapter()
         config = FakeConfigRepository()
 
-        farming = FarmingService(screen, input_adapter, config)
+        farming = FarmingService(
+            screen, input_adapter, config, clock=VirtualClock()
+        )
         farming._setup_hotkeys()
         farming.state.start_farming()
 
@@ -46,7 +80,9 @@ class TestStateMachine:
         input_adapter = FakeInputAdapter()
         config = FakeConfigRepository()
 
-        farming = FarmingService(screen, input_adapter, config)
+        farming = FarmingService(
+            screen, input_adapter, config, clock=VirtualClock()
+        )
         farming._setup_hotkeys()
         farming.state.start_farming()
 
@@ -65,10 +101,277 @@ class TestComplexActions:
         input_adapter = FakeInputAdapter()
         config = FakeConfigRepository()
 
-        farming = FarmingService(screen, input_adapter, config)
-        farming._skip_both_slots()
+        farming = FarmingService(
+            screen, input_adapter, config, clock=VirtualClock()
+        )
+        farming._execute_decision(FarmingDecision.SKIP_BOTH_SLOTS)
 
         # Must include: skip_slot_1, package_specialized_skip, skip_slot_2
         assert Coordinates(715, 850) in input_adapter.clicks  # skip_slot_1
         assert Coordinates(1335, 975) in input_adapter.clicks  # specialized
         assert Coordinates(1070, 850) in input_adapter.clicks  # skip_slot_2
+
+    def test_scan_only_matches_tags_the_decision_needs(self):
+        """Verify an empty screen is decided without matching double."""
+        screen = FakeScreenAdapter()
+        farming = FarmingService(
+            screen,
+            FakeInputAdapter(),
+            FakeConfigRepository(),
+            clock=VirtualClock(),
+        )
+
+        farming.scan_and_decide()
+
+        assert ('double.png', 1) not in screen.match_calls
+        assert len(screen.match_calls) == 2
+
+    def test_scan_finds_skip_both_lazily(self):
+        """Verify double + charm is still detected as skip both."""
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('double.png', Coordinates(600, 800), 0.9, slot=1),
+                ScanResult('charm.png', Coordinates(950, 900), 0.9, slot=2),
+            ]
+        )
+        farming = FarmingService(
+            screen,
+            FakeInputAdapter(),
+            FakeConfigRepository(),
+            clock=VirtualClock(),
+        )
+
+        decision = farming.scan_and_decide()
+
+        assert decision == FarmingDecision.SKIP_BOTH_SLOTS
+
+
+class TestAdaptiveTiming:
+    """Tests for delays learned from verified resets and their saving."""
+
+    def test_unverified_reset_backs_off_delays(self, fake_farming):
+        """A reset whose screen never changes counts as a failure."""
+        farming = fake_farming
+        farming.timing.delays['reset'].value = 1.0
+        farming._new_game()
+
+        assert farming.timing.delays['reset'].failures == 1
+        assert farming.timing.delays['reset'].value == 1.5
+
+    def test_learned_delays_saved_to_profile(self, fake_farming):
+        """Learned delays are persisted through the config port."""
+        farming = fake_farming
+        farming.timing.record('action', success=True)
+        farming._save_learned_delays()
+
+        saved = farming.config.saved_profiles[-1]
+        assert saved.delays['action'] < FarmingService.ACTION_DELAY
+        assert set(saved.delays) == {'action', 'click', 'reset'}
+
+
+class TestVirtualClock:
+    """Tests for waits and iterations running on a virtual clock."""
+
+    def test_many_iterations_run_instantly(self):
+        """Thousands of iterations take simulated, not wall, time."""
+        input_adapter = FakeInputAdapter()
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)
+            ],
+            # Every click or key press changes what is on screen
+            frame_provider=lambda: np.full(
+                (100, 100, 3),
+                (len(input_adapter.clicks) + len(input_adapter.key_presses))
+                * 16
+                % 256,
+            ).astype(np.uint8),
+        )
+        config = FakeConfigRepository()
+        clock = VirtualClock()
+
+        farming = FarmingService(screen, input_adapter, config, clock=clock)
+        wall_start = time.monotonic()
+        for _ in range(2000):
+            farming.run_iteration()
+        wall_elapsed = time.monotonic() - wall_start
+
+        assert farming.state.current_run == 2000
+        # Every iteration waits at least for the soul pack to open
+        assert clock.now() > 2000 * FarmingService.SOUL_WAIT_TIME
+        assert wall_elapsed < 30
+
+    def test_bookkeeping_runs_inside_waits(self):
+        """An iteration's bookkeeping is absorbed by the next one's waits."""
+        ends: dict[str, list[float]] = {}
+        reports = []
+        for name in ('free', 'slow'):
+            clock = VirtualClock()
+            events = (
+                SlowFlushEventLog(clock) if name == 'slow' else FakeEventLog()
+            )
+            farming = FarmingService(
+                FakeScreenAdapter(),
+                FakeInputAdapter(),
+                FakeConfigRepository(),
+                clock=clock,
+                events=events,
+            )
+            ends[name] = []
+            for _ in range(2):
+                farming.run_iteration()
+                ends[name].append(clock.now())
+            reports = farming._iteration_reports
+
+        # The first iteration's flush ran during the second iteration...
+        first_end, second_end = ends['slow']
+        assert first_end < events.flushed_at[0] < second_end
+        assert sum(r.background_tasks for r in reports) == 4
+        # ...without making it any longer
+        assert ends['slow'] == ends['free']
+
+
+class TestInterruptibleControl:
+    """Tests for pausing, stopping and recovering around an iteration."""
+
+    def test_pause_interrupts_soul_wait(self):
+        """A pause during an action aborts the iteration immediately."""
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)
+            ]
+        )
+        input_adapter = FakeInputAdapter()
+        config = FakeConfigRepository()
+        clock = VirtualClock()
+
+        farming = FarmingService(screen, input_adapter, config, clock=clock)
+        farming._setup_hotkeys()
+        input_adapter.trigger_hotkey('p')
+        input_adapter.click = lambda coords: input_adapter.trigger_hotkey('m')
+
+        start = clock.now()
+        with pytest.raises(FarmingInterrupted):
+            farming.run_iteration()
+
+        assert clock.now() - start < FarmingService.SOUL_WAIT_TIME
+        assert farming.state.current_run == 0
+
+    def test_stop_takes_effect_within_milliseconds(self):
+        """Real-time waits are cut short and the idle loop wakes on stop."""
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('charm.png', Coordinates(600, 800), 0.95, slot=1)
+            ]
+        )
+        input_adapter = FakeInputAdapter()
+        config = FakeConfigRepository()
+
+        farming = FarmingService(screen, input_adapter, config)
+        thread = threading.Thread(target=farming.run)
+        thread.start()
+        time.sleep(0.05)
+
+        # Farm into the 5s soul wait, pause, then stop while idle
+        input_adapter.trigger_hotkey('p')
+        time.sleep(0.7)
+        input_adapter.trigger_hotkey('m')
+        time.sleep(0.05)
+        start = time.monotonic()
+        input_adapter.trigger_hotkey('l')
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert time.monotonic() - start < 0.5
+        assert farming.state.current_run == 0
+
+    def test_resume_recovers_before_next_iteration(
+        self, monkeypatch, fake_farming
+    ):
+        """The first iteration after an interrupted one starts a new game."""
+        farming = fake_farming
+        calls = []
+
+        def iteration():
+            calls.append('iteration')
+            if len(calls) == 1:
+                raise FarmingInterrupted()
+            if calls.count('iteration') == 3:
+                farming.state.stop()
+
+        monkeypatch.setattr(farming, 'run_iteration', iteration)
+        monkeypatch.setattr(
+            farming, '_recover', lambda: calls.append('recover')
+        )
+        farming.state.start_farming()
+        farming.run()
+
+        assert calls == ['iteration', 'recover', 'iteration', 'iteration']
+
+    def test_paused_wait_is_sliced(self, monkeypatch, fake_farming):
+        """While paused, the loop waits with a timeout, never forever."""
+        farming = fake_farming
+        timeouts = []
+
+        def wait_until_active(timeout=None):
+            timeouts.append(timeout)
+            if len(timeouts) == 3:
+                farming.state.stop()
+            return False
+
+        monkeypatch.setattr(
+            farming.state, 'wait_until_active', wait_until_active
+        )
+        farming.run()
+
+        assert timeouts == [FarmingService.PAUSE_POLL_INTERVAL] * 3
+
+
+class TestStallRecovery:
+    """Tests for FarmingService resetting once the watchdog fires."""
+
+    def test_unchanged_screen_triggers_recovery(self, fake_farming):
+        """A frozen screen is detected and a recovery reset is issued."""
+        farming = fake_farming
+        max_unchanged = farming.watchdog.max_unchanged
+        # Frames are observed during the next iteration's waits
+        for _ in range(max_unchanged + 2):
+            farming.run_iteration()
+
+        assert farming.watchdog.stalls == 1
+        assert farming.watchdog.total_lost > 0
+        # Recovery skips any open pack, then starts a new game
+        assert Coordinates(1335, 975) in farming.input.clicks
+        assert farming.state.current_run == max_unchanged + 3
+
+
+class TestClickVerification:
+    """Tests for confirming clicks by their screen postconditions."""
+
+    def test_unconfirmed_skip_is_reported_not_retried(self, fake_farming):
+        """A skip click that never changes the screen is not repeated."""
+        farming = fake_farming
+        verified = farming._click_step('skip_slot_1', 'skip_slots_1')()
+
+        assert not verified
+        assert farming.input.clicks == [Coordinates(715, 850)]
+        assert farming.verifier.failures == 1
+        assert farming.verifier.retries == 0
+
+    def test_confirmed_click_is_not_repeated(self):
+        """A click whose ROI changes is confirmed on the first attempt."""
+        input_adapter = FakeInputAdapter()
+        screen = FakeScreenAdapter(
+            frame_provider=lambda: np.full(
+                (100, 100, 3), len(input_adapter.clicks) * 50, dtype=np.uint8
+            )
+        )
+        config = FakeConfigRepository()
+
+        farming = FarmingService(
+            screen, input_adapter, config, clock=VirtualClock()
+        )
+        verified = farming._click_step('skip_slot_1', 'skip_slots_1')()
+
+        assert verified
+        assert input_adapter.clicks == [Coordinates(715, 850)]
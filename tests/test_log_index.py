@@ -0,0 +1,180 @@
+"""
+Tests for the SQLite log index.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from balatro.adapters.log_index import SqliteLogIndex
+from balatro.service_layer import analytics
+from balatro.service_layer.analytics import AnalyticsService
+
+SESSION = """\
+2025-12-29 21:00:00,000 - INFO - Using Profile: 1080p
+2025-12-29 21:00:00,000 - INFO - TIMING: starting delays action=500ms \
+click=1500ms reset=2000ms
+2025-12-29 21:00:01,000 - INFO - ACTION: New Game Started
+2025-12-29 21:00:02,000 - INFO - DECISION: Skip for double and charm
+2025-12-29 21:00:05,000 - INFO - ACTION: New Game Started
+2025-12-29 21:00:06,000 - INFO - DECISION: Skip for charm (slot 2)
+2025-12-29 21:00:07,000 - INFO - Selecting SOUL card at (500, 500)
+"""
+MORE = """\
+2025-12-29 21:30:00,000 - INFO - ACTION: New Game Started
+2025-12-29 22:00:00,000 - INFO - Selecting SOUL card at (500, 500)
+"""
+
+
+@pytest.fixture
+def index():
+    index = SqliteLogIndex(':memory:')
+    yield index
+    index.close()
+
+
+def write(path, text, mode='w'):
+    with path.open(mode, encoding='utf-8', newline='') as log:
+        log.write(text)
+
+
+class TestIndexing:
+    """Tests for incremental ingestion."""
+
+    def test_statistics_match_parsing(self, index, tmp_path):
+        log = tmp_path / 'a.log'
+        write(log, SESSION + MORE)
+        service = AnalyticsService(index=index)
+
+        session = service.index_log(log)
+
+        expected = AnalyticsService().parse_log(SESSION + MORE)
+        assert service.session_statistics(session) == expected
+        assert session.profile == '1080p'
+        assert session.delays == 'action=500ms click=1500ms reset=2000ms'
+
+    def test_ingests_only_appended_bytes(self, index, tmp_path):
+        log = tmp_path / 'a.log'
+        write(log, SESSION + '2025-12-29 21:30:00,000 - INFO - ACTION: New')
+        service = AnalyticsService(index=index)
+
+        first = service.index_log(log)
+        assert first.new_games == 2
+        assert first.byte_offset == len(SESSION.encode())
+
+        write(log, ' Game Started\n' + MORE.split('\n', 1)[1], mode='a')
+        second = service.index_log(log)
+
+        assert second.new_games == 3
+        assert second.souls == 2
+        assert service.session_statistics(second) == (
+            AnalyticsService().parse_log(SESSION + MORE)
+        )
+        iterations = index.connection.execute(
+            'SELECT seq, started FROM iterations ORDER BY seq'
+        ).fetchall()
+        assert iterations == [
+            (0, '2025-12-29 21:00:01,000'),
+            (1, '2025-12-29 21:00:05,000'),
+            (2, '2025-12-29 21:30:00,000'),
+        ]
+
+    def test_records_decisions(self, index, tmp_path):
+        log = tmp_path / 'a.log'
+        write(log, SESSION)
+        AnalyticsService(index=index).index_log(log)
+
+        decisions = index.connection.execute(
+            'SELECT at, decision FROM decisions ORDER BY at'
+        ).fetchall()
+
+        assert decisions == [
+            ('2025-12-29 21:00:02,000', 'double_and_charm'),
+            ('2025-12-29 21:00:06,000', 'charm_slot_2'),
+        ]
+
+    def test_truncated_log_is_reindexed(self, index, tmp_path):
+        log = tmp_path / 'a.log'
+        write(log, SESSION + MORE)
+        service = AnalyticsService(index=index)
+        service.index_log(log)
+
+        write(log, MORE)
+        session = service.index_log(log)
+
+        assert session.new_games == 1
+        assert index.connection.execute(
+            'SELECT COUNT(*) FROM iterations'
+        ).fetchone() == (1,)
+
+    def test_process_log_file_reads_the_index(self, index, tmp_path, capsys):
+        log = tmp_path / 'a.log'
+        write(log, SESSION)
+
+        stats = AnalyticsService(index=index).process_log_file(log)
+
+        assert stats.new_game_count == 2
+        assert index.session(log).lines == 7
+        assert 'Resets (New Games):    2' in capsys.readouterr().out
+
+    def test_large_appends_are_parsed_in_parallel(
+        self, index, tmp_path, monkeypatch
+    ):
+        log = tmp_path / 'a.log'
+        write(log, SESSION + MORE * 50)
+        monkeypatch.setattr(
+            analytics, 'MIN_PARALLEL_BYTES', log.stat().st_size // 2
+        )
+        pools = []
+
+        def pool(**kwargs):
+            pools.append(kwargs)
+            return ProcessPoolExecutor(**kwargs)
+
+        monkeypatch.setattr(analytics, 'ProcessPoolExecutor', pool)
+        service = AnalyticsService(index=index, workers=2)
+
+        stats = service.process_log_file(log)
+
+        assert pools == [{'max_workers': 2}]
+        assert stats == AnalyticsService().parse_log(SESSION + MORE * 50)
+        assert index.session(log).profile == '1080p'
+        started = index.connection.execute(
+            'SELECT started FROM iterations ORDER BY seq'
+        ).fetchall()
+        assert len(started) == 52
+        assert started == sorted(started)
+
+        # Small appends stay in this process
+        write(log, MORE, mode='a')
+        assert service.index_log(log).new_games == 53
+        assert len(pools) == 1
+
+
+class TestRates:
+    """Tests for grouped souls per hour."""
+
+    def test_groups_by_profile_week_and_delays(self, index, tmp_path):
+        service = AnalyticsService(index=index)
+        write(tmp_path / 'a.log', SESSION + MORE)
+        write(
+            tmp_path / 'b.log',
+            SESSION.replace('1080p', '1440p').replace(
+                '2025-12-29', '2026-01-05'
+            )
+            + MORE.replace('2025-12-29', '2026-01-05'),
+        )
+        for log in sorted(tmp_path.glob('*.log')):
+            service.index_log(log)
+
+        by_profile = index.rates('profile')
+        assert [r.key for r in by_profile] == ['1080p', '1440p']
+        assert by_profile[0].hours == 1.0
+        assert by_profile[0].souls_per_hour == 2.0
+
+        assert [r.key for r in index.rates('week')] == ['2026-W01', '2026-W02']
+
+        (by_delays,) = index.rates('delays')
+        assert by_delays.key == 'action=500ms click=1500ms reset=2000ms'
+        assert by_delays.sessions == 2
+        assert by_delays.resets_per_hour == 3.0
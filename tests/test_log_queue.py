@@ -0,0 +1,122 @@
+"""
+Tests for queue-based logging.
+"""
+
+import logging
+
+import pytest
+
+from balatro.adapters.log_queue import (
+    DeferredQueueHandler,
+    SamplingFilter,
+    start_queue_logging,
+)
+from balatro.service_layer.analytics import AnalyticsService
+
+FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+@pytest.fixture
+def root():
+    """Root logger, restored after the test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers = handlers
+    root.setLevel(level)
+
+
+def file_handler(path, level=logging.NOTSET):
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    handler.setLevel(level)
+    return handler
+
+
+def record(msg, *args):
+    return logging.LogRecord(
+        'test', logging.INFO, __file__, 1, msg, args, None
+    )
+
+
+class TestQueueLogging:
+    """Tests for routing log records through the listener thread."""
+
+    def test_stop_flushes_formatted_records(self, root, tmp_path):
+        log = tmp_path / 'a.log'
+        listener = start_queue_logging([file_handler(log)])
+
+        logging.getLogger('balatro.test').info('ACTION: %s', 'skip_slot_1')
+        logging.getLogger('balatro.test').debug('hidden')
+        listener.stop()
+
+        lines = log.read_text().splitlines()
+        assert len(lines) == 1
+        assert lines[0].endswith(' - INFO - ACTION: skip_slot_1')
+
+    def test_replaces_root_handlers(self, root, tmp_path):
+        listener = start_queue_logging([file_handler(tmp_path / 'a.log')])
+        listener.stop()
+
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], DeferredQueueHandler)
+
+    def test_respects_handler_levels(self, root, tmp_path):
+        warnings = tmp_path / 'warnings.log'
+        listener = start_queue_logging(
+            [file_handler(tmp_path / 'a.log'), file_handler(warnings, 30)]
+        )
+
+        logging.getLogger('balatro.test').info('ACTION: New Game Started')
+        logging.getLogger('balatro.test').warning('Recovery')
+        listener.stop()
+
+        assert warnings.read_text().count('\n') == 1
+
+    def test_log_still_parses(self, root, tmp_path):
+        log = tmp_path / 'a.log'
+        listener = start_queue_logging([file_handler(log)])
+        test_logger = logging.getLogger('balatro.test')
+
+        for _ in range(3):
+            test_logger.info('ACTION: New Game Started')
+        test_logger.info('DECISION: %s', 'Skip for double and charm')
+        test_logger.info('Selecting SOUL card at %s', (500, 500))
+        listener.stop()
+
+        stats = AnalyticsService().parse_file(log).result()
+        assert stats.new_game_count == 3
+        assert stats.total_souls == 1
+        assert stats.total_doubles == 1
+
+
+class TestDeferredQueueHandler:
+    """Tests for leaving formatting to the listener."""
+
+    def test_record_is_enqueued_unformatted(self):
+        handler = DeferredQueueHandler(None)
+        original = record('Found %s | Slot %s', 'charm.png', 1)
+
+        prepared = handler.prepare(original)
+
+        assert prepared is original
+        assert prepared.msg == 'Found %s | Slot %s'
+        assert prepared.getMessage() == 'Found charm.png | Slot 1'
+
+
+class TestSamplingFilter:
+    """Tests for sampling high-volume lines."""
+
+    def test_keeps_every_nth_matching_record(self):
+        sampler = SamplingFilter('Found ', 3)
+
+        kept = [sampler.filter(record('Found %s', i)) for i in range(7)]
+
+        assert kept == [True, False, False, True, False, False, True]
+
+    def test_other_records_pass(self):
+        sampler = SamplingFilter('Found ', 100)
+        sampler.filter(record('Found %s', 'charm.png'))
+
+        assert sampler.filter(record('ACTION: %s', 'skip_slot_1'))
+        assert sampler.filter(record('DECISION: %s', 'Found nothing'))
@@ -0,0 +1,154 @@
+"""
+Tests for following session logs.
+"""
+
+import io
+import os
+import threading
+
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.log_tail import LogTailer
+from balatro.service_layer.analytics import AnalyticsService
+
+NEW_GAME = '2025-12-29 21:00:{:02d},000 - INFO - ACTION: New Game Started\n'
+
+
+def append(path, text):
+    with path.open('a', encoding='utf-8', newline='') as log:
+        log.write(text)
+
+
+def touch_later(path, seconds):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime + seconds, stat.st_mtime + seconds))
+
+
+class TestLogTailer:
+    """Tests for incremental reading of the current log."""
+
+    def test_returns_only_appended_complete_lines(self, tmp_path):
+        log = tmp_path / 'a.log'
+        append(log, 'first\nsec')
+        tailer = LogTailer(tmp_path)
+
+        assert tailer.poll() == ['first\n']
+        assert tailer.poll() == []
+
+        append(log, 'ond\nthird\n')
+        assert tailer.poll() == ['second\n', 'third\n']
+
+    def test_no_logs_yet(self, tmp_path):
+        tailer = LogTailer(tmp_path)
+        assert tailer.poll() == []
+        assert tailer.path is None
+
+    def test_rotation_drains_old_file_then_reads_new(self, tmp_path):
+        log = tmp_path / 'a.log'
+        append(log, 'one\n')
+        tailer = LogTailer(tmp_path)
+        tailer.poll()
+
+        append(log, 'two\n')
+        log.rename(tmp_path / 'a.log.1')
+        append(log, 'three\n')
+
+        assert tailer.poll() == ['two\n', 'three\n']
+        assert tailer.path == log
+        tailer.close()
+
+    def test_truncation_rereads_from_start(self, tmp_path):
+        log = tmp_path / 'a.log'
+        append(log, 'one\ntwo\n')
+        tailer = LogTailer(tmp_path)
+        tailer.poll()
+
+        log.write_text('new\n', encoding='utf-8')
+
+        assert tailer.poll() == ['new\n']
+
+    def test_switches_to_newer_session_after_finishing_old(self, tmp_path):
+        old = tmp_path / 'old.log'
+        append(old, 'one\n')
+        tailer = LogTailer(tmp_path)
+        tailer.poll()
+
+        append(old, 'two\n')
+        new = tmp_path / 'new.log'
+        append(new, 'fresh\n')
+        touch_later(new, 10)
+
+        assert tailer.poll() == ['two\n']
+        assert tailer.path == old
+        assert tailer.poll() == ['fresh\n']
+        assert tailer.path == new
+
+
+class StubTailer:
+    """Tailer replaying scripted polls, then stopping the follower."""
+
+    def __init__(self, polls, stop):
+        self.polls = list(polls)
+        self.stop = stop
+        self.path = None
+
+    def poll(self):
+        path, lines = self.polls.pop(0)
+        self.path = path
+        if not self.polls:
+            self.stop.set()
+        return lines
+
+
+class TestFollow:
+    """Tests for refreshing statistics in place."""
+
+    def test_accumulates_across_polls(self):
+        stop = threading.Event()
+        tailer = StubTailer(
+            [
+                ('a.log', [NEW_GAME.format(0)]),
+                ('a.log', []),
+                ('a.log', [NEW_GAME.format(30), NEW_GAME.format(36)]),
+            ],
+            stop,
+        )
+        output = io.StringIO()
+        clock = VirtualClock()
+
+        stats = AnalyticsService().follow(
+            tailer, clock, interval=2.0, stop=stop, output=output
+        )
+
+        assert stats.new_game_count == 3
+        assert stats.avg_reset_time == 12.0
+        assert clock.total_slept == 4.0
+        assert output.getvalue().count('\r\x1b[2K') == 3
+        assert 'Resets: 3 (300.0/h)' in output.getvalue()
+
+    def test_restarts_on_new_session(self):
+        stop = threading.Event()
+        tailer = StubTailer(
+            [
+                ('a.log', [NEW_GAME.format(0), NEW_GAME.format(1)]),
+                ('b.log', [NEW_GAME.format(5)]),
+            ],
+            stop,
+        )
+        output = io.StringIO()
+
+        stats = AnalyticsService().follow(
+            tailer, VirtualClock(), stop=stop, output=output
+        )
+
+        assert stats.new_game_count == 1
+        assert 'Following b.log' in output.getvalue()
+
+    def test_nothing_to_follow(self):
+        stop = threading.Event()
+        tailer = StubTailer([(None, [])], stop)
+
+        stats = AnalyticsService().follow(
+            tailer, VirtualClock(), stop=stop, output=io.StringIO()
+        )
+
+        assert stats is None
@@ -0,0 +1,130 @@
+"""
+Tests for the farming policies.
+"""
+
+import random
+from itertools import product
+
+from balatro.adapters.clock import VirtualClock
+from balatro.domain.decisions import (
+    DecisionContext,
+    FarmingDecision,
+    decide_farming_action,
+)
+from balatro.domain.model import Coordinates, ScanResult
+from balatro.domain.policy import (
+    PACKS_OPENED,
+    ExpectedValuePolicy,
+    RuleBasedPolicy,
+    feasible_decisions,
+)
+from balatro.service_layer.farming import FarmingService
+
+from .fakes import FakeConfigRepository, FakeInputAdapter, FakeScreenAdapter
+
+ALL_CONTEXTS = [
+    DecisionContext(*values) for values in product((False, True), repeat=3)
+]
+
+
+def simulate(policy, durations, iterations=3000, soul_probability=0.01):
+    """Run a policy against a simple game model; return souls/second."""
+    rng = random.Random(42)
+    expected_souls = 0.0
+    elapsed = 0.0
+    for _ in range(iterations):
+        context = DecisionContext(
+            has_double_slot1=rng.random() < 0.3,
+            has_charm_slot1=rng.random() < 0.3,
+            has_charm_slot2=rng.random() < 0.3,
+        )
+        decision = policy.decide(context)
+        duration = durations.get(decision, 0.0)
+        packs = PACKS_OPENED[decision]
+        souls = sum(rng.random() < soul_probability for _ in range(packs))
+        iteration_time = 3.0 + duration
+        policy.observe(decision, duration, packs, souls, iteration_time)
+        expected_souls += packs * soul_probability
+        elapsed += iteration_time
+    return expected_souls / elapsed
+
+
+class TestFeasibleDecisions:
+    """Tests for feasible_decisions."""
+
+    def test_reset_is_always_feasible(self):
+        for context in ALL_CONTEXTS:
+            assert FarmingDecision.NONE in feasible_decisions(context)
+
+    def test_rule_decision_is_always_feasible(self):
+        for context in ALL_CONTEXTS:
+            decision = decide_farming_action(context)
+            assert decision in feasible_decisions(context)
+
+
+class TestExpectedValuePolicy:
+    """Tests for ExpectedValuePolicy."""
+
+    def test_matches_rules_without_history(self):
+        policy = ExpectedValuePolicy()
+        for context in ALL_CONTEXTS:
+            assert policy.decide(context) == decide_farming_action(context)
+
+    def test_declines_slow_decision_when_rate_is_high(self):
+        policy = ExpectedValuePolicy(total_time=100.0, packs_opened=10)
+        policy.durations[FarmingDecision.SKIP_BOTH_SLOTS] = 500.0
+        context = DecisionContext(has_double_slot1=True, has_charm_slot2=True)
+        assert policy.decide(context) == FarmingDecision.SKIP_SLOT_2
+
+    def test_observe_tracks_measured_durations(self):
+        policy = ExpectedValuePolicy(smoothing=1.0)
+        policy.observe(FarmingDecision.SKIP_SLOT_1, 4.0, 1, 0, 6.0)
+        assert policy.durations[FarmingDecision.SKIP_SLOT_1] == 4.0
+        assert policy.packs_opened == 1
+        assert policy.total_time == 6.0
+
+    def test_beats_rules_when_skip_both_is_slow(self):
+        durations = {
+            FarmingDecision.SKIP_SLOT_1: 6.0,
+            FarmingDecision.SKIP_SLOT_2: 6.5,
+            FarmingDecision.SKIP_BOTH_SLOTS: 60.0,
+        }
+        rules = simulate(RuleBasedPolicy(), durations)
+        expected_value = simulate(ExpectedValuePolicy(), durations)
+        assert expected_value > rules * 1.05
+
+    def test_no_worse_than_rules_with_default_timings(self):
+        durations = {
+            FarmingDecision.SKIP_SLOT_1: 7.0,
+            FarmingDecision.SKIP_SLOT_2: 7.5,
+            FarmingDecision.SKIP_BOTH_SLOTS: 14.5,
+        }
+        rules = simulate(RuleBasedPolicy(), durations)
+        expected_value = simulate(ExpectedValuePolicy(), durations)
+        assert expected_value >= rules * 0.99
+
+
+class TestPolicyInFarmingService:
+    """Tests for plugging a policy into FarmingService."""
+
+    def test_policy_learns_from_virtual_iterations(self):
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('charm.png', Coordinates(600, 800), 0.9, slot=1),
+            ]
+        )
+        policy = ExpectedValuePolicy()
+        farming = FarmingService(
+            screen,
+            FakeInputAdapter(),
+            FakeConfigRepository(),
+            clock=VirtualClock(),
+            policy=policy,
+        )
+
+        for _ in range(5):
+            farming.run_iteration()
+
+        assert policy.packs_opened == 5
+        assert policy.total_time > 0
+        assert policy.durations[FarmingDecision.SKIP_SLOT_1] != 7.0
@@ -1,6 +1,11 @@
 """Tests for log parsing statistics."""
 
 from balatro.process_log import parse_log_statistics
+from balatro.service_layer import analytics
+from balatro.service_layer.analytics import (
+    AnalyticsService,
+    StatisticsAccumulator,
+)
 
 # Expected values for test cases
 EXPECTED_BASIC_GAMES = 2
@@ -76,3 +81,131 @@ def test_parse_log_statistics_metrics():
     assert stats['new_game_count'] == EXPECTED_METRICS_GAMES
     assert stats['resets_per_hour'] == EXPECTED_METRICS_RESETS_PER_HOUR
     assert stats['avg_reset_time'] == EXPECTED_METRICS_AVG_RESET
+
+
+def test_parse_stream_matches_parse_log(tmp_path):
+    """Test streaming a file gives the same statistics as parsing text."""
+    log_content = """2025-12-29 21:00:00,000 - Start
+2025-12-29 21:00:01,000 - ACTION: New Game Started
+2025-12-29 21:00:02,000 - DECISION: Skip for charm and charm
+2025-12-29 21:00:03,500 - Selecting SOUL card at (1, 1)
+"""
+    path = tmp_path / 'automation.log'
+    path.write_text(log_content, encoding='utf-8')
+    service = AnalyticsService()
+
+    with path.open(encoding='utf-8') as stream:
+        streamed = service.parse_stream(stream)
+
+    assert streamed == service.parse_log(log_content)
+    assert streamed.duration_seconds == 3.5
+
+
+def test_parse_log_counts_one_decision_per_line():
+    """Test a line with several decisions counts only the first rule."""
+    log_content = (
+        '2025-12-29 21:00:00,000 - DECISION: Skip for charm (slot 2) '
+        'DECISION: Skip for double and charm '
+        'ACTION: New Game Started ACTION: New Game Started\n'
+    )
+    stats = AnalyticsService().parse_log(log_content)
+
+    assert stats.total_doubles == 1
+    assert stats.total_charms == 1
+    assert stats.new_game_count == 2
+
+
+def test_parse_log_ignores_invalid_and_unordered_timestamps():
+    """Test invalid dates are skipped and min/max ignore line order."""
+    log_content = """2025-12-29 22:00:00,000 - Later
+2025-13-29 23:00:00,000 - Invalid month
+2025-12-29 21:00:00,000 - Earlier
+"""
+    stats = AnalyticsService().parse_log(log_content)
+
+    assert stats.duration_seconds == EXPECTED_METRICS_DURATION
+
+
+def test_accumulator_is_incremental():
+    """Test results are available after every fed line."""
+    accumulator = StatisticsAccumulator()
+    accumulator.feed('2025-12-29 21:00:00,000 - ACTION: New Game Started\n')
+    assert accumulator.result().new_game_count == 1
+
+    accumulator.feed('2025-12-29 21:00:10,000 - ACTION: New Game Started\n')
+    stats = accumulator.result()
+    assert stats.new_game_count == 2
+    assert stats.avg_reset_time == 5.0
+
+
+EDGE_CASE_LOG = (
+    b'\n'
+    b'2025-12-29 22:00:00,000 - DECISION: Skip for charm (slot 2) '
+    b'DECISION: Skip for double and charm\n'
+    b'   \t\n'
+    b'2025-13-29 23:00:00,000 - Invalid month\n'
+    b'2025-12-29 21:00:00,000 - ACTION: New Game Started\n'
+    b'2025-12-29 21:30:00,000 - Selecting SOUL card at (1, 1)\n'
+    b'2025-12-29 21:40:00,000 - DECISION: Skip for charm and charm\n'
+    b'2025-12-29 21:50:00,000 - DECISION: Skip for double/charm and charm\n'
+    b'no timestamp - ACTION: New Game Started\n'
+    b'2025-12-29 21:55:00,000 - last line without newline'
+)
+
+
+def test_parse_file_matches_parse_stream(tmp_path):
+    """Test the bytes parser agrees with the line parser."""
+    path = tmp_path / 'automation.log'
+    path.write_bytes(EDGE_CASE_LOG)
+    service = AnalyticsService()
+
+    with path.open(encoding='utf-8') as stream:
+        expected = StatisticsAccumulator().feed_lines(stream)
+    accumulator = service.parse_file(path, workers=1)
+
+    assert accumulator.lines == expected.lines
+    assert accumulator.result() == expected.result()
+    assert accumulator.result().duration_seconds == EXPECTED_METRICS_DURATION
+
+
+def test_log_chunks_merge_to_whole(tmp_path, monkeypatch):
+    """Test chunks split at newlines merge to the whole-file result."""
+    monkeypatch.setattr(analytics, 'WINDOW_BYTES', 40)
+    path = tmp_path / 'automation.log'
+    path.write_bytes(EDGE_CASE_LOG * 3)
+    whole = analytics.parse_log_range(path, 0, path.stat().st_size)
+
+    ranges = analytics.split_log(path, 7)
+    merged = analytics.ByteStatisticsAccumulator()
+    for start, end in ranges:
+        merged.merge(analytics.parse_log_range(path, start, end))
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == path.stat().st_size
+    assert merged.lines == whole.lines
+    assert merged.result() == whole.result()
+
+
+def test_parse_file_in_parallel(tmp_path, monkeypatch):
+    """Test large logs are parsed by a process pool with equal results."""
+    monkeypatch.setattr(analytics, 'MIN_PARALLEL_BYTES', 0)
+    path = tmp_path / 'automation.log'
+    path.write_bytes(EDGE_CASE_LOG * 20)
+
+    parallel = AnalyticsService().parse_file(path, workers=2)
+    serial = analytics.parse_log_range(path, 0, path.stat().st_size)
+
+    assert parallel.lines == serial.lines
+    assert parallel.result() == serial.result()
+    assert parallel.result().new_game_count == 40
+
+
+def test_parse_file_empty(tmp_path):
+    """Test an empty log parses without mapping it."""
+    path = tmp_path / 'automation.log'
+    path.write_bytes(b'')
+
+    accumulator = AnalyticsService().parse_file(path, workers=1)
+
+    assert accumulator.lines == 0
+    assert accumulator.result().new_game_count == 0
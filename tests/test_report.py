@@ -0,0 +1,165 @@
+"""
+Tests for reports across session logs.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from balatro.adapters.file_cache import JsonFileCache
+from balatro.service_layer.analytics import (
+    FarmingStatistics,
+    merge_statistics,
+)
+from balatro.service_layer.report import ReportService
+
+
+def session_log(day, start_hour, resets, souls=0):
+    """Log of one session with a reset every 36 seconds."""
+    start = datetime(2025, 12, day, start_hour)
+    lines = []
+    for i in range(resets):
+        stamp = (start + timedelta(seconds=i * 36)).strftime(
+            '%Y-%m-%d %H:%M:%S'
+        )
+        lines.append(f'{stamp},000 - INFO - ACTION: New Game Started')
+        if i < souls:
+            lines.append(f'{stamp},500 - INFO - Selecting SOUL card at (1, 1)')
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.fixture
+def logs(tmp_path):
+    log_dir = tmp_path / 'logs'
+    log_dir.mkdir()
+    contents = {
+        'a.log': session_log(29, 10, resets=101, souls=2),
+        'b.log': session_log(29, 20, resets=51),
+        'c.log': session_log(30, 10, resets=101, souls=1),
+    }
+    for name, text in contents.items():
+        (log_dir / name).write_text(text, encoding='utf-8')
+    return log_dir
+
+
+class TestMergeStatistics:
+    """Tests for combining sessions."""
+
+    def test_sums_counters_and_durations(self):
+        merged = merge_statistics(
+            [
+                FarmingStatistics.from_totals(
+                    total_doubles=1,
+                    total_charms=2,
+                    total_souls=3,
+                    new_game_count=100,
+                    duration_seconds=1800,
+                    start='2025-12-29 10:00:00,000',
+                    end='2025-12-29 10:30:00,000',
+                ),
+                FarmingStatistics.from_totals(
+                    total_doubles=0,
+                    total_charms=1,
+                    total_souls=1,
+                    new_game_count=100,
+                    duration_seconds=1800,
+                    start='2025-12-30 10:00:00,000',
+                    end='2025-12-30 10:30:00,000',
+                ),
+            ]
+        )
+
+        assert merged.total_souls == 4
+        assert merged.duration_seconds == 3600
+        assert merged.resets_per_hour == 200
+        assert merged.run_time_str == '1h 0m 0s'
+        assert merged.start == '2025-12-29 10:00:00,000'
+        assert merged.end == '2025-12-30 10:30:00,000'
+
+    def test_nothing_to_merge(self):
+        assert merge_statistics([]) == FarmingStatistics()
+
+
+class TestReportService:
+    """Tests for collecting and summarizing session logs."""
+
+    def test_summarizes_by_day(self, logs):
+        service = ReportService(workers=1)
+        sessions = service.collect(logs.glob('*.log'))
+
+        periods = service.summarize(sessions.values(), by='day')
+
+        assert [p.period for p in periods] == ['2025-12-29', '2025-12-30']
+        first = periods[0]
+        assert first.sessions == 2
+        assert first.statistics.new_game_count == 152
+        assert first.statistics.duration_seconds == 5400
+        assert first.statistics.total_souls == 2
+
+    def test_summarizes_by_week(self, logs):
+        service = ReportService(workers=1)
+        sessions = service.collect(logs.glob('*.log'))
+
+        periods = service.summarize(sessions.values(), by='week')
+
+        assert [(p.period, p.sessions) for p in periods] == [('2026-W01', 3)]
+
+    def test_process_pool_matches_serial(self, logs):
+        for i in range(3):
+            (logs / f'extra{i}.log').write_text(
+                session_log(28, i, resets=11), encoding='utf-8'
+            )
+
+        serial = ReportService(workers=1).collect(logs.glob('*.log'))
+        parallel = ReportService(workers=2).collect(logs.glob('*.log'))
+
+        assert parallel == serial
+
+    def test_cache_reparses_only_changed_files(self, logs, tmp_path):
+        cache_path = tmp_path / 'cache.json'
+        first = ReportService(JsonFileCache(cache_path), workers=1)
+        expected = first.collect(logs.glob('*.log'))
+        assert first.parsed_files == 3
+
+        rerun = ReportService(JsonFileCache(cache_path), workers=1)
+        assert rerun.collect(logs.glob('*.log')) == expected
+        assert rerun.parsed_files == 0
+
+        changed = logs / 'b.log'
+        changed.write_text(session_log(29, 20, resets=11), encoding='utf-8')
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        again = ReportService(JsonFileCache(cache_path), workers=1)
+        sessions = again.collect(logs.glob('*.log'))
+        assert again.parsed_files == 1
+        assert sessions[changed].new_game_count == 11
+
+    def test_cache_drops_deleted_files(self, logs, tmp_path):
+        cache_path = tmp_path / 'cache.json'
+        ReportService(JsonFileCache(cache_path), workers=1).collect(
+            logs.glob('*.log')
+        )
+        deleted = logs / 'a.log'
+        signature = JsonFileCache.signature(deleted)
+        assert JsonFileCache(cache_path).get(deleted, signature) is not None
+        deleted.unlink()
+
+        ReportService(JsonFileCache(cache_path), workers=1).collect(
+            logs.glob('*.log')
+        )
+
+        assert JsonFileCache(cache_path).get(deleted, signature) is None
+
+    def test_report_displays_totals(self, logs, capsys):
+        ReportService(workers=1).report(logs.glob('*.log'))
+
+        output = capsys.readouterr().out
+        assert 'Sessions:              3' in output
+        assert 'pruned are excluded' in output
+        assert '2025-12-30' in output
+
+    def test_report_without_logs(self, tmp_path, capsys):
+        assert ReportService(workers=1).report([]) is None
+        assert 'No session logs found.' in capsys.readouterr().out
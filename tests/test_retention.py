@@ -0,0 +1,228 @@
+"""
+Tests for compressed log storage and the retention service.
+"""
+
+import gzip
+import os
+
+import pytest
+
+from balatro.adapters import log_archive
+from balatro.adapters.log_archive import (
+    compress_log,
+    events_file_for,
+    find_logs,
+    open_log,
+    session_name,
+)
+from balatro.adapters.log_index import SqliteLogIndex
+from balatro.service_layer.analytics import AnalyticsService
+from balatro.service_layer.report import ReportService
+from balatro.service_layer.retention import RetentionPolicy, RetentionService
+
+SESSION = """\
+2025-12-29 21:00:00,000 - INFO - Using Profile: 1080p
+2025-12-29 21:00:01,000 - INFO - ACTION: New Game Started
+2025-12-29 21:00:02,000 - INFO - DECISION: Skip for double and charm
+2025-12-29 21:00:05,000 - INFO - ACTION: New Game Started
+2025-12-29 21:00:07,000 - INFO - Selecting SOUL card at (500, 500)
+2025-12-29 21:10:00,000 - INFO - End
+"""
+DAY = 86400
+NOW = 1767225600.0  # 2026-01-01
+
+needs_zstd = pytest.mark.skipif(
+    log_archive.zstd is None, reason='no zstd module available'
+)
+
+
+@pytest.fixture
+def index():
+    index = SqliteLogIndex(':memory:')
+    yield index
+    index.close()
+
+
+def write_log(log_dir, name, age_days=0.0, text=SESSION):
+    """Write a session log (and event file) aged relative to NOW."""
+    path = log_dir / f'{name}.log'
+    path.write_text(text, encoding='utf-8')
+    events = events_file_for(path)
+    events.write_text('{"type":"new_game","at":1.0,"run":2}\n')
+    mtime = NOW - age_days * DAY
+    for file in (path, events):
+        os.utime(file, (mtime, mtime))
+    return path
+
+
+class TestLogArchive:
+    """Tests for compressing and opening session logs."""
+
+    def test_gzip_round_trip_keeps_mtime(self, tmp_path):
+        log = write_log(tmp_path, 'a', age_days=3)
+
+        target = compress_log(log)
+
+        assert target.name == 'a.log.gz'
+        assert not log.exists()
+        assert target.stat().st_mtime == NOW - 3 * DAY
+        with open_log(target) as stream:
+            assert stream.read() == SESSION.encode()
+
+    @needs_zstd
+    def test_zstd_round_trip(self, tmp_path):
+        target = compress_log(write_log(tmp_path, 'a'), '.zst')
+
+        assert target.name == 'a.log.zst'
+        with open_log(target) as stream:
+            assert stream.read() == SESSION.encode()
+
+    @pytest.mark.skipif(log_archive.zstd is not None, reason='zstd present')
+    def test_zstd_without_module_raises(self, tmp_path):
+        with pytest.raises(ImportError, match='zstandard'):
+            compress_log(write_log(tmp_path, 'a'), '.zst')
+
+    def test_names_of_compressed_logs(self, tmp_path):
+        log = tmp_path / 'a.log.gz'
+
+        assert session_name(log) == 'a'
+        assert events_file_for(log) == tmp_path / 'a.events.jsonl'
+
+    def test_find_logs_prefers_plain_copy(self, tmp_path):
+        write_log(tmp_path, 'a')
+        compress_log(write_log(tmp_path, 'b'))
+        # Interrupted compression leaves both copies of 'a'
+        (tmp_path / 'a.log.gz').write_bytes(gzip.compress(b'partial'))
+        (tmp_path / 'c.log.gz.tmp').write_bytes(b'')
+
+        assert [p.name for p in find_logs(tmp_path)] == ['a.log', 'b.log.gz']
+
+
+class TestCompressedReads:
+    """Tests for analytics over compressed logs."""
+
+    def test_parse_file_streams_gzip(self, tmp_path):
+        log = compress_log(write_log(tmp_path, 'a'))
+
+        stats = AnalyticsService().parse_file(log).result()
+
+        assert stats == AnalyticsService().parse_log(SESSION)
+
+    def test_index_survives_compression(self, index, tmp_path):
+        log = write_log(tmp_path, 'a')
+        service = AnalyticsService(index=index)
+        service.index_log(log)
+
+        target = compress_log(log)
+        index.rename(log, target)
+        session = service.index_log(target)
+
+        assert session.new_games == 2
+        assert session.byte_offset == len(SESSION.encode())
+
+    def test_index_compressed_log(self, index, tmp_path):
+        log = compress_log(write_log(tmp_path, 'a'))
+
+        session = AnalyticsService(index=index).index_log(log)
+
+        assert session.souls == 1
+        assert session.profile == '1080p'
+
+    def test_report_reads_compressed_logs(self, tmp_path):
+        write_log(tmp_path, 'a')
+        compress_log(write_log(tmp_path, 'b'))
+
+        sessions = ReportService(workers=1).collect(find_logs(tmp_path))
+
+        assert [s.new_game_count for s in sessions.values()] == [2, 2]
+
+
+class TestRetentionService:
+    """Tests for compressing and pruning finished logs."""
+
+    def service(self, tmp_path, index, **policy):
+        return RetentionService(
+            tmp_path,
+            AnalyticsService(index=index),
+            RetentionPolicy(**policy),
+        )
+
+    def test_compresses_all_but_active(self, tmp_path, index):
+        old = write_log(tmp_path, 'a', age_days=1)
+        active = write_log(tmp_path, 'b')
+
+        compressed = self.service(tmp_path, index).compress_finished(active)
+
+        assert compressed == [tmp_path / 'a.log.gz']
+        assert active.exists()
+        assert not old.exists()
+        assert index.session(compressed[0]).new_games == 2
+        assert index.session(old) is None
+
+    def test_recompresses_over_stale_archive(self, tmp_path, index):
+        log = write_log(tmp_path, 'a', age_days=1)
+        # Interrupted compression left an indexed archive next to the log
+        stale = tmp_path / 'a.log.gz'
+        stale.write_bytes(gzip.compress(SESSION.encode()[:60]))
+        AnalyticsService(index=index).index_log(stale)
+
+        compressed = self.service(tmp_path, index).compress_finished()
+
+        assert compressed == [stale]
+        assert not log.exists()
+        assert index.session(stale).new_games == 2
+        assert index.session(log) is None
+
+    def test_no_compression(self, tmp_path, index):
+        write_log(tmp_path, 'a', age_days=1)
+
+        service = self.service(tmp_path, index, compression=None)
+
+        assert service.compress_finished() == []
+        assert (tmp_path / 'a.log').exists()
+
+    def test_prune_by_age(self, tmp_path, index):
+        old = write_log(tmp_path, 'a', age_days=40)
+        recent = write_log(tmp_path, 'b', age_days=2)
+        service = self.service(tmp_path, index, max_age_days=30)
+
+        deleted = service.prune(now=NOW)
+
+        assert deleted == [old]
+        assert not events_file_for(old).exists()
+        assert recent.exists()
+        # The summary is kept for queries
+        assert index.session(old).new_games == 2
+
+    def test_prune_by_size_keeps_active(self, tmp_path, index):
+        logs = [
+            write_log(tmp_path, n, age_days=3 - i) for i, n in enumerate('abc')
+        ]
+        active = write_log(tmp_path, 'd', age_days=-1)
+        one = logs[0].stat().st_size + events_file_for(logs[0]).stat().st_size
+        service = self.service(tmp_path, index, max_total_bytes=2 * one)
+
+        deleted = service.prune(active, now=NOW)
+
+        assert deleted == logs[:2]
+        assert logs[2].exists()
+        assert active.exists()
+
+    def test_run_logs_failures(self, tmp_path, index, caplog, monkeypatch):
+        monkeypatch.setitem(log_archive.COMPRESSORS, '.zst', None)
+        write_log(tmp_path, 'a')
+        service = self.service(tmp_path, index, compression='.zst')
+
+        service.run()
+
+        assert 'Log retention failed' in caplog.text
+        assert (tmp_path / 'a.log').exists()
+
+    def test_run_logs_index_failures(self, tmp_path, caplog):
+        write_log(tmp_path, 'a')
+        index = SqliteLogIndex(':memory:')
+        index.close()
+
+        self.service(tmp_path, index).run()
+
+        assert 'Log retention failed' in caplog.text
@@ -4,6 +4,11 @@ Integration tests for the ScanService.
 Focused on core scanning logic: multi-asset detection and best match selection.
 """
 
+import numpy as np
+import pytest
+
+from balatro.adapters.clock import VirtualClock
+from balatro.adapters.simulated_game import GamePhase, SimulatedScreenAdapter
 from balatro.domain.model import Coordinates, ProfileConfig, Region, ScanResult
 from balatro.service_layer.scanning import ScanService
 
@@ -103,3 +108,132 @@ class TestScanServiceCore:
         result = scanner.scan_for_soul()
 
         assert result is None
+
+    def test_tag_probe_captures_each_roi_once(self):
+        """Verify lazy probes reuse captures and move the cursor once."""
+        screen = FakeScreenAdapter(
+            scan_results=[
+                ScanResult('charm.png', Coordinates(600, 800), 0.90, slot=1),
+            ]
+        )
+        input_adapter = FakeInputAdapter()
+        profile = ProfileConfig(
+            name='test',
+            description='Test profile',
+            actions={},
+            rois={
+                'skip_slots_1': [Region(543, 784, 296, 153)],
+                'skip_slots_2': [Region(910, 852, 266, 108)],
+            },
+        )
+
+        scanner = ScanService(screen, input_adapter, profile, VirtualClock())
+        probe = scanner.make_tag_probe()
+
+        assert probe('double.png', 1) == []
+        assert len(probe('charm.png', 1)) == 1
+        assert len(screen.captured_regions) == 1
+        assert len(input_adapter.moves) == 1
+
+
+class PackScreen(FakeScreenAdapter):
+    """Fake screen rendering a pack with textured cards on a flat strip."""
+
+    def __init__(self, card_rois):
+        super().__init__()
+        self.card_rois = card_rois
+
+    def capture_region(self, region=None):
+        self.captured_regions.append(region)
+        frame = np.full((region.height, region.width, 3), 90, np.uint8)
+        rng = np.random.default_rng(0)
+        for roi in self.card_rois:
+            top, left = roi.top - region.top, roi.left - region.left
+            frame[top : top + roi.height, left : left + roi.width] = (
+                rng.integers(0, 255, (roi.height, roi.width, 3))
+            )
+        return frame
+
+
+class TestPackCardDetection:
+    """Tests for detecting populated soul ROIs."""
+
+    SOUL_ROIS = [
+        Region(613, 651, 174, 241),
+        Region(786, 657, 173, 236),
+        Region(958, 652, 171, 247),
+        Region(1130, 655, 168, 236),
+        Region(1303, 654, 167, 236),
+    ]
+
+    def _scanner(self, screen):
+        profile = ProfileConfig(
+            name='test',
+            description='Test profile',
+            actions={},
+            rois={'the_soul': self.SOUL_ROIS},
+        )
+        return ScanService(screen, FakeInputAdapter(), profile, VirtualClock())
+
+    def test_only_populated_cards_are_matched(self):
+        """Verify a three-card pack matches three ROIs from one capture."""
+        screen = PackScreen(self.SOUL_ROIS[:3])
+        scanner = self._scanner(screen)
+
+        assert scanner.scan_for_soul() is None
+        assert screen.match_calls == [
+            ('the_soul.png', 1),
+            ('the_soul.png', 2),
+            ('the_soul.png', 3),
+        ]
+        assert len(screen.captured_regions) == 1
+
+    def test_falls_back_to_all_rois_without_any_card(self):
+        """Verify every ROI is scanned when no card can be detected."""
+        screen = PackScreen([])
+        scanner = self._scanner(screen)
+
+        scanner.scan_for_soul()
+
+        assert len(screen.match_calls) == 5
+
+
+class TestSoulCardDetection:
+    """Tests for detecting the real soul card art in rendered packs."""
+
+    def render_pack(self, game, cards):
+        """Capture the pack strip showing ``cards`` (ROI index -> image)."""
+        rois = game.profile.get_rois('the_soul')
+        game.phase = GamePhase.PACK
+        game.pack_cards = [cards.get(i) for i in range(len(rois))]
+        game._frame = None
+        return SimulatedScreenAdapter(game).capture_region(
+            Region.bounding(rois)
+        )
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 4])
+    @pytest.mark.parametrize('brightness', [1.0, 0.4, 0.2])
+    def test_soul_roi_is_always_populated(self, make_game, size, brightness):
+        """The soul's ROI is reported in every layout, even when dimmed."""
+        game = make_game(seed=0)
+        rois = game.profile.get_rois('the_soul')
+        scanner = ScanService(
+            SimulatedScreenAdapter(game),
+            FakeInputAdapter(),
+            game.profile,
+            VirtualClock(),
+        )
+        for first in range(len(rois) - size + 1):
+            shown = list(range(first, first + size))
+            for soul in shown:
+                cards = {i: game._card_image(i) for i in shown}
+                cards[soul] = game._soul_image
+                strip = self.render_pack(game, cards) * brightness
+
+                populated = scanner.detect_populated_rois(
+                    rois, strip.astype(np.uint8)
+                )
+
+                assert soul in populated, (first, soul)
+                # Empty ROIs are still skipped
+                assert set(populated) <= set(shown)
@@ -0,0 +1,181 @@
+"""
+Tests for the columnar session analysis.
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from balatro.domain.events import (
+    ActionClicked,
+    DecisionMade,
+    NewGameStarted,
+    ScanCompleted,
+    SessionStarted,
+    SoulFound,
+)
+from balatro.service_layer.session_analysis import (
+    DECISIONS,
+    NEW_GAME,
+    IterationColumns,
+    SessionAnalysisService,
+    SessionColumns,
+)
+
+
+def session(at):
+    return SessionStarted(at, 0.0, '1080p', {})
+
+
+def iteration(start, seconds, decision=None, soul=False):
+    """Events of one iteration starting at ``start``."""
+    events = [ScanCompleted(start + 0.5, False, True, False)]
+    if decision is not None:
+        events.append(DecisionMade(start + 0.5, decision, 0, 1))
+        events.append(ActionClicked(start + 1.0, 'skip_slot_1'))
+    if soul:
+        events.append(SoulFound(start + 2.0, 1, 1))
+    events.append(NewGameStarted(start + seconds, 0))
+    return events
+
+
+@pytest.fixture
+def events():
+    # Iterations of 2s (none), 10s (slot 1, soul) and 4s (none)
+    return [
+        session(100.0),
+        *iteration(100.0, 2.0),
+        *iteration(102.0, 10.0, 'SKIP_SLOT_1', soul=True),
+        *iteration(112.0, 4.0),
+    ]
+
+
+class TestSessionColumns:
+    """Tests for loading events into columns."""
+
+    def test_columns_per_event(self, events):
+        columns = SessionColumns.from_events(events)
+
+        assert len(columns) == len(events)
+        assert columns.at[0] == 0.0
+        assert columns.at[-1] == 16.0
+        assert np.count_nonzero(columns.kind == NEW_GAME) == 3
+        assert DECISIONS[columns.decision[4]] == 'SKIP_SLOT_1'
+        assert np.count_nonzero(columns.decision >= 0) == 1
+        assert columns.duration.sum() == 16.0
+
+    def test_sessions_are_joined_without_gaps(self):
+        columns = SessionColumns.from_events(
+            [
+                session(500.0),
+                *iteration(500.0, 3.0),
+                session(2.0),
+                *iteration(2.0, 5.0),
+            ]
+        )
+
+        assert columns.at[-1] == 8.0
+        assert (columns.duration >= 0).all()
+
+
+class TestIterationColumns:
+    """Tests for iterations and their statistics."""
+
+    def test_iterations(self, events):
+        iterations = SessionAnalysisService().analyze(events)
+
+        assert iterations.duration.tolist() == [2.0, 10.0, 4.0]
+        assert [DECISIONS[d] for d in iterations.decision] == [
+            'NONE',
+            'SKIP_SLOT_1',
+            'NONE',
+        ]
+        assert iterations.souls.tolist() == [0, 1, 0]
+
+    def test_restart_drops_unfinished_iteration(self):
+        iterations = SessionAnalysisService().analyze(
+            [
+                session(0.0),
+                *iteration(0.0, 3.0),
+                ScanCompleted(4.0, False, False, False),
+                session(50.0),
+                *iteration(50.0, 5.0),
+            ]
+        )
+
+        assert iterations.duration.tolist() == [3.0, 5.0]
+
+    def test_percentiles(self, events):
+        iterations = SessionAnalysisService().analyze(events)
+
+        p50, p95 = iterations.percentiles()
+
+        assert p50 == 4.0
+        assert p95 == pytest.approx(9.4)
+
+    def test_decision_breakdown(self, events):
+        rows = SessionAnalysisService().analyze(events).decision_breakdown()
+
+        assert [row.decision for row in rows] == ['NONE', 'SKIP_SLOT_1']
+        none, slot1 = rows
+        assert none.count == 2
+        assert none.mean == 3.0
+        assert none.share == pytest.approx(6 / 16)
+        assert slot1.souls == 1
+
+    def test_rolling_throughput(self, events):
+        iterations = SessionAnalysisService().analyze(events)
+
+        throughput = iterations.rolling_throughput(window=12.0, step=4.0)
+
+        # Samples at 4s, 8s, 12s and 16s after the start
+        assert throughput.at.tolist() == [4.0, 8.0, 12.0, 16.0]
+        assert throughput.resets_per_hour.tolist() == [
+            900.0,
+            450.0,
+            600.0,
+            600.0,
+        ]
+        assert throughput.souls_per_hour[-1] == 300.0
+
+    def test_empty(self):
+        iterations = IterationColumns.from_columns(
+            SessionColumns.from_events([])
+        )
+
+        assert len(iterations) == 0
+        assert np.isnan(iterations.percentiles()).all()
+        assert iterations.decision_breakdown() == []
+        assert len(iterations.rolling_throughput().at) == 0
+
+
+class TestSessionAnalysisService:
+    """Tests for displaying and exporting the analysis."""
+
+    def test_display(self, events, capsys):
+        service = SessionAnalysisService(window=12.0, step=4.0)
+
+        service.display_analysis(service.analyze(events))
+
+        out = capsys.readouterr().out
+        assert 'Reset Time p95:        9.40s' in out
+        assert 'SKIP_SLOT_1' in out
+
+    def test_write_csv(self, events, tmp_path):
+        service = SessionAnalysisService(window=12.0, step=4.0)
+
+        service.write_csv(service.analyze(events), tmp_path / 'out')
+
+        with (tmp_path / 'out' / 'iterations.csv').open() as file:
+            rows = list(csv.DictReader(file))
+        assert [row['decision'] for row in rows] == [
+            'NONE',
+            'SKIP_SLOT_1',
+            'NONE',
+        ]
+        assert rows[1]['duration'] == '10.0'
+        with (tmp_path / 'out' / 'decisions.csv').open() as file:
+            assert len(list(csv.DictReader(file))) == 2
+        with (tmp_path / 'out' / 'throughput.csv').open() as file:
+            assert len(list(csv.DictReader(file))) == 4
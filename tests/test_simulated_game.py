@@ -0,0 +1,117 @@
+"""
+End-to-end tests against the headless game simulator.
+
+Exercises real capture, template matching, clicks and screen changes.
+"""
+
+from balatro.adapters.simulated_game import (
+    GamePhase,
+    SimulatedGame,
+    SimulatedInputAdapter,
+    SimulatedScreenAdapter,
+)
+from balatro.domain.model import Coordinates
+
+
+class RecordingInputAdapter(SimulatedInputAdapter):
+    """Simulated input that also records the clicks sent."""
+
+    def __init__(self, game: SimulatedGame):
+        super().__init__(game)
+        self.clicks: list[Coordinates] = []
+
+    def click(self, coords: Coordinates) -> None:
+        self.clicks.append(coords)
+        super().click(coords)
+
+
+class TestSimulatedGame:
+    """Tests for the simulated game state machine and rendering."""
+
+    def test_charm_is_found_by_the_real_matcher(self, profile, make_game):
+        game = make_game(seed=0, charm_probability=1.0)
+        screen = SimulatedScreenAdapter(game)
+
+        roi = profile.get_rois('skip_slots_2')[0]
+        matches = screen.match_template(
+            screen.capture_region(roi),
+            'charm.png',
+            slot=2,
+            region_offset=Coordinates(roi.left, roi.top),
+        )
+
+        assert len(matches) == 1
+        assert roi.contains(matches[0].position)
+
+    def test_skipping_charm_opens_pack(self, profile, clock, make_game):
+        game = make_game(seed=0, charm_probability=1.0, double_probability=0)
+        SimulatedInputAdapter(game).click(profile.get_action('skip_slot_1'))
+        clock.advance(1.0)
+        game.render()
+
+        assert game.phase == GamePhase.PACK
+        assert game.packs_opened == 1
+
+    def test_clicks_during_animation_are_dropped(
+        self, profile, clock, make_game
+    ):
+        game = make_game(seed=0, animation=0.5)
+        input_adapter = SimulatedInputAdapter(game)
+
+        input_adapter.press_key('esc')
+        clock.advance(0.1)
+        input_adapter.click(profile.get_action('new_game_top'))
+        clock.advance(1.0)
+        game.render()
+
+        assert game.dropped_clicks == 1
+        assert game.phase == GamePhase.MENU
+
+
+class TestFarmingEndToEnd:
+    """Runs the real FarmingService against the simulator."""
+
+    def test_farming_collects_every_offered_soul(
+        self, make_game, make_simulated_farming
+    ):
+        game = make_game(
+            seed=1,
+            charm_probability=0.3,
+            double_probability=0.2,
+            soul_per_pack=0.3,
+        )
+        farming = make_simulated_farming(game)
+
+        for _ in range(30):
+            farming.run_iteration()
+
+        assert game.runs == 31
+        assert game.souls_offered > 0
+        assert farming.state.souls_found == game.souls_obtained
+        assert game.souls_obtained == game.souls_offered
+        assert farming.verifier.failures == 0
+        assert farming.watchdog.stalls == 0
+
+    def test_late_transition_skips_exactly_once(
+        self, profile, clock, make_game, make_simulated_farming
+    ):
+        # The skip shows up only after the verification timeout
+        game = make_game(
+            seed=0,
+            charm_probability=1.0,
+            double_probability=0,
+            latency=0.6,
+        )
+        input_adapter = RecordingInputAdapter(game)
+        farming = make_simulated_farming(game, input_adapter)
+
+        confirmed = farming._click_step('skip_slot_1', 'skip_slots_1')()
+        clock.advance(1.0)
+        game.render()
+
+        skip = profile.get_action('skip_slot_1')
+        assert not confirmed
+        assert input_adapter.clicks == [skip]
+        assert farming.verifier.failures == 1
+        assert game.packs_opened == 1
+        assert game.phase == GamePhase.PACK
@@ -0,0 +1,145 @@
+"""
+Tests for the Monte Carlo strategy simulator.
+"""
+
+import pytest
+
+from balatro.domain.decisions import FarmingDecision, decide_farming_action
+from balatro.domain.policy import PACKS_OPENED, ExpectedValuePolicy
+from balatro.domain.timing import DelayTuner
+from balatro.service_layer.farming import FarmingService
+from balatro.service_layer.simulation import (
+    GameModel,
+    MonteCarloSimulator,
+    TimingModel,
+)
+
+
+def analytic_rate(game, timing):
+    """Exact souls/hour of the rule table under a fixed timing model."""
+    souls = seconds = 0.0
+    for code in range(8):
+        double1, charm1, charm2 = (
+            bool(code & 1),
+            bool(code & 2),
+            bool(code & 4),
+        )
+        # Slot 1 shows one tag: a double, a charm or something else
+        slot1 = {
+            (True, False): game.double_slot1,
+            (False, True): game.charm_slot1,
+            (False, False): 1 - game.double_slot1 - game.charm_slot1,
+        }.get((double1, charm1), 0.0)
+        probability = slot1 * (
+            game.charm_slot2 if charm2 else 1 - game.charm_slot2
+        )
+        simulator = MonteCarloSimulator(game, timing)
+        decision = simulator.decision_table(decide_farming_action)[code]
+        decision = list(FarmingDecision)[decision]
+        expected_souls = PACKS_OPENED[decision] * game.soul_per_pack
+        souls += probability * expected_souls
+        seconds += probability * (
+            timing.scan
+            + timing.reset
+            + timing.durations[decision]
+            + expected_souls * timing.soul_purchase
+        )
+    return souls / seconds * 3600
+
+
+class TestMonteCarloSimulator:
+    """Tests for MonteCarloSimulator."""
+
+    def test_estimate_matches_analytic_rate(self):
+        game = GameModel(
+            double_slot1=0.3,
+            charm_slot1=0.4,
+            charm_slot2=0.3,
+            soul_per_pack=0.2,
+        )
+        timing = TimingModel.from_farming_constants()
+        result = MonteCarloSimulator(game, timing, seed=7).run(resets=400_000)
+
+        expected = analytic_rate(game, timing)
+        assert result.ci_low <= expected <= result.ci_high
+        assert result.resets == 400_000
+
+    def test_same_seed_is_reproducible(self):
+        first = MonteCarloSimulator(seed=3).run(resets=50_000)
+        second = MonteCarloSimulator(seed=3).run(resets=50_000)
+        assert first.souls_per_hour == second.souls_per_hour
+
+    def test_never_skipping_finds_nothing(self):
+        result = MonteCarloSimulator(seed=1).run(
+            lambda context: FarmingDecision.NONE, resets=10_000
+        )
+        assert result.souls == 0
+        assert result.decisions == {FarmingDecision.NONE: 10_000}
+
+    def test_accepts_policy_objects(self):
+        result = MonteCarloSimulator(seed=1).run(
+            ExpectedValuePolicy().decide, resets=10_000
+        )
+        assert result.hours > 0
+
+    def test_measured_durations_are_resampled(self):
+        timing = TimingModel.from_measurements(
+            scan=0.1,
+            reset=3.0,
+            samples={
+                FarmingDecision.SKIP_SLOT_1: [4.0, 6.0],
+                FarmingDecision.SKIP_SLOT_2: [5.0],
+                FarmingDecision.SKIP_BOTH_SLOTS: [11.0],
+            },
+        )
+        game = GameModel(double_slot1=0.0, charm_slot1=1.0, charm_slot2=0.0)
+        result = MonteCarloSimulator(game, timing, seed=2).run(resets=20_000)
+
+        # Every reset skips slot 1: 0.1 + 3.0 + mean(4, 6) seconds
+        assert abs(result.hours * 3600 / 20_000 - 8.1) < 0.05
+
+    def test_slot_1_shows_a_single_tag(self):
+        game = GameModel(double_slot1=0.5, charm_slot1=0.5, charm_slot2=0.0)
+
+        def both_in_slot_1(context):
+            if context.has_double_slot1 and context.has_charm_slot1:
+                return FarmingDecision.SKIP_SLOT_1
+            return FarmingDecision.NONE
+
+        result = MonteCarloSimulator(game, seed=4).run(
+            both_in_slot_1, resets=10_000
+        )
+        assert result.decisions == {FarmingDecision.NONE: 10_000}
+
+    def test_slot_1_probabilities_must_be_exclusive(self):
+        with pytest.raises(ValueError, match='exclusive'):
+            GameModel(double_slot1=0.6, charm_slot1=0.6)
+
+
+class TestTimingModel:
+    """Tests for TimingModel factories."""
+
+    def test_uses_learned_delays(self):
+        tuner = DelayTuner.from_baselines(
+            {
+                'action': FarmingService.ACTION_DELAY,
+                'click': FarmingService.CLICK_DELAY,
+                'reset': FarmingService.RESET_DELAY,
+            },
+            learned={'action': 0.3, 'reset': 1.5},
+        )
+        baseline = TimingModel.from_farming_constants()
+
+        learned = TimingModel.from_farming_constants(
+            delays=tuner.learned_values()
+        )
+
+        assert learned.reset == pytest.approx(baseline.reset - 3 * 0.2 - 0.5)
+        assert learned.soul_purchase == pytest.approx(
+            baseline.soul_purchase - 0.2
+        )
+        assert learned.durations[FarmingDecision.SKIP_SLOT_2] == (
+            pytest.approx(
+                baseline.durations[FarmingDecision.SKIP_SLOT_2] - 0.2
+            )
+        )
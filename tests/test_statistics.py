@@ -0,0 +1,161 @@
+"""
+Tests for the live session statistics.
+"""
+
+import threading
+
+import pytest
+
+from balatro.domain.exceptions import FarmingInterrupted
+from balatro.domain.statistics import LiveStatistics
+from balatro.service_layer.analytics import AnalyticsService
+
+from .fakes import FakeEventLog
+
+
+class TestLiveStatistics:
+    """Tests for counters, active time and rates."""
+
+    def test_active_time_excludes_pauses(self):
+        stats = LiveStatistics()
+        stats.resume(100.0)
+        stats.pause(160.0)
+        stats.pause(200.0)
+        stats.resume(500.0)
+        stats.resume(510.0)
+
+        assert stats.active_time(530.0) == 90.0
+        stats.pause(540.0)
+        assert stats.active_time(9999.0) == 100.0
+
+    def test_rates_ignore_paused_time(self):
+        stats = LiveStatistics()
+        stats.resume(0.0)
+        for at in (10.0, 20.0, 30.0):
+            stats.record_reset(at)
+        stats.record_soul(30.0)
+        stats.pause(36.0)
+
+        # A long pause does not dilute the rates
+        assert stats.resets_per_hour(10_000.0) == 300.0
+        assert stats.souls_per_hour(10_000.0) == 100.0
+
+    def test_rolling_window(self):
+        stats = LiveStatistics(window=60.0)
+        stats.resume(0.0)
+        for at in range(10, 130, 10):
+            stats.record_reset(float(at))
+
+        # Six resets in the last active minute
+        assert stats.resets_per_hour(120.0) == 360.0
+        assert len(stats._reset_times) == 6
+        assert stats.resets == 12
+
+    def test_rolling_window_uses_active_time(self):
+        stats = LiveStatistics(window=60.0)
+        stats.resume(0.0)
+        stats.record_reset(50.0)
+        stats.pause(55.0)
+        stats.resume(1000.0)
+        stats.record_reset(1030.0)
+
+        # Both resets fall within the last 60 active seconds
+        assert stats.resets_per_hour(1030.0) == 120.0
+
+    def test_no_active_time(self):
+        stats = LiveStatistics()
+
+        assert stats.resets_per_hour(50.0) == 0.0
+        assert stats.average_iteration == 0.0
+
+    def test_histogram(self):
+        stats = LiveStatistics(bounds=(2.0, 5.0))
+        for seconds in (1.0, 2.0, 3.5, 4.0, 12.0):
+            stats.record_iteration(seconds)
+
+        assert stats.histogram_rows() == [(2.0, 2), (5.0, 2), (None, 1)]
+        assert stats.average_iteration == 4.5
+
+    def test_decisions(self):
+        stats = LiveStatistics()
+        stats.record_decision(1, 1)
+        stats.record_decision(0, 2)
+
+        assert (stats.doubles, stats.charms) == (1, 3)
+
+
+class TestFarmingLiveStatistics:
+    """Tests for the statistics the farming service keeps."""
+
+    def test_agree_with_events(self, clock, make_game, make_simulated_farming):
+        game = make_game(
+            seed=3,
+            charm_probability=0.5,
+            double_probability=0.4,
+            soul_per_pack=0.3,
+        )
+        events = FakeEventLog()
+        farming = make_simulated_farming(game, events=events)
+        stats = farming.state.stats
+        stats.resume(clock.now())
+        for _ in range(30):
+            farming.run_iteration()
+        farming.scheduler.drain()
+
+        from_events = AnalyticsService().parse_events(events.events)
+        live = AnalyticsService().live_statistics(stats, clock.now())
+        assert live.new_game_count == from_events.new_game_count == 30
+        assert live.total_souls == from_events.total_souls
+        assert live.total_doubles == from_events.total_doubles
+        assert live.total_charms == from_events.total_charms
+        assert stats.iterations == 30
+        assert sum(stats.histogram) == 30
+        assert stats.iteration_seconds == pytest.approx(clock.now())
+
+    def test_run_excludes_paused_time(self, monkeypatch, clock, fake_farming):
+        farming = fake_farming
+        calls = []
+
+        def resume():
+            clock.advance(300.0)
+            farming.state.start_farming()
+
+        def iteration():
+            calls.append(clock.now())
+            clock.advance(10.0)
+            if len(calls) == 2:
+                # Paused for five minutes while the loop waits
+                farming.state.pause_farming()
+                threading.Timer(0.05, resume).start()
+                raise FarmingInterrupted()
+            if len(calls) == 3:
+                farming.state.stop()
+
+        monkeypatch.setattr(farming, 'run_iteration', iteration)
+        # Recovery after the interruption would add its own active time
+        monkeypatch.setattr(farming, '_recover', lambda: None)
+        farming.state.start_farming()
+        farming.run()
+
+        assert farming.state.stats.active_time(clock.now()) == 30.0
+
+
+class TestDisplayLive:
+    """Tests for the exit statistics."""
+
+    def test_display(self, capsys):
+        stats = LiveStatistics()
+        stats.resume(0.0)
+        for seconds, at in ((4.0, 4.0), (4.0, 8.0), (12.0, 20.0)):
+            stats.record_iteration(seconds)
+            stats.record_reset(at)
+        stats.pause(20.0)
+
+        AnalyticsService().display_live(stats, 20.0)
+
+        out = capsys.readouterr().out
+        assert 'Resets (New Games):    3' in out
+        assert 'Resets per Hour:       540.00' in out
+        assert 'Iterations: 3' in out
+        assert '3-4s      2' in out
+        assert '10-15s      1' in out
@@ -0,0 +1,79 @@
+"""
+Tests for the timeline scheduler.
+"""
+
+from balatro.service_layer.timeline import Timeline, TimelineScheduler
+
+
+class ManualClock:
+    """Minimal clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def now(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float) -> None:
+        self.time += seconds
+
+
+class TestTimelineScheduler:
+    """Tests for step order, skipped steps and work run inside waits."""
+
+    def test_steps_run_in_order_after_delays(self):
+        clock = ManualClock()
+        scheduler = TimelineScheduler(clock.now, clock.sleep)
+        calls: list[tuple[str, float]] = []
+
+        timeline = (
+            Timeline('t')
+            .step('a', lambda: calls.append(('a', clock.time)))
+            .step('b', lambda: calls.append(('b', clock.time)), after=0.5)
+            .wait(2.0)
+        )
+        report = scheduler.run(timeline)
+
+        assert calls == [('a', 0.0), ('b', 0.5)]
+        assert report.elapsed == 2.5
+        assert report.wait_time == 2.5
+
+    def test_failed_precondition_skips_step_and_its_wait(self):
+        clock = ManualClock()
+        scheduler = TimelineScheduler(clock.now, clock.sleep)
+        calls: list[str] = []
+
+        timeline = Timeline('t').step(
+            'never', lambda: calls.append('never'), 5.0, when=lambda: False
+        )
+        report = scheduler.run(timeline)
+
+        assert calls == []
+        assert report.elapsed == 0.0
+        assert report.steps[0].skipped
+        assert report.critical_path == []
+
+    def test_background_work_fills_waits(self):
+        clock = ManualClock()
+        scheduler = TimelineScheduler(clock.now, clock.sleep)
+
+        def background():
+            clock.time += 0.3
+
+        scheduler.submit(background)
+        report = scheduler.run(Timeline('t').wait(1.0))
+
+        assert report.background_tasks == 1
+        assert report.elapsed == 1.0
+        assert round(report.wait_time, 6) == 0.7
+        assert scheduler.pending_background == 0
+
+    def test_background_work_waits_for_slack(self):
+        clock = ManualClock()
+        scheduler = TimelineScheduler(clock.now, clock.sleep)
+        scheduler.submit(lambda: None)
+
+        report = scheduler.run(Timeline('t').step('a', lambda: None))
+
+        assert report.background_tasks == 0
+        assert scheduler.pending_background == 1
@@ -0,0 +1,55 @@
+"""
+Tests for the adaptive timing controller.
+"""
+
+from balatro.domain.timing import AdaptiveDelay, DelayTuner
+
+
+class TestAdaptiveDelay:
+    """Tests for AIMD behaviour of a single delay."""
+
+    def test_success_shrinks_additively(self):
+        delay = AdaptiveDelay.from_baseline('action', 0.5)
+        delay.record_success()
+        delay.record_success()
+        assert delay.value == 0.5 - 2 * delay.decrease_step
+
+    def test_failure_backs_off_multiplicatively(self):
+        delay = AdaptiveDelay.from_baseline('action', 0.5)
+        delay.record_failure()
+        assert delay.value == 0.75
+
+    def test_value_stays_within_bounds(self):
+        delay = AdaptiveDelay.from_baseline('reset', 2.0)
+        for _ in range(1000):
+            delay.record_success()
+        assert delay.value == delay.minimum
+        for _ in range(10):
+            delay.record_failure()
+        assert delay.value == delay.maximum
+
+    def test_resumes_from_learned_value(self):
+        delay = AdaptiveDelay.from_baseline('click', 1.5, value=1.2)
+        assert delay.value == 1.2
+
+
+class TestDelayTuner:
+    """Tests for per-reset savings accounting."""
+
+    def test_saving_reported_per_reset(self):
+        tuner = DelayTuner.from_baselines({'action': 0.5}, {'action': 0.3})
+        tuner.get('action')
+        tuner.get('action')
+        saved = tuner.complete_reset()
+        assert round(saved, 6) == 0.4
+        assert round(tuner.average_saved_per_reset, 6) == 0.4
+
+    def test_learned_values_round_trip(self):
+        tuner = DelayTuner.from_baselines({'action': 0.5, 'reset': 2.0})
+        tuner.record('reset', success=True)
+        learned = tuner.learned_values()
+        resumed = DelayTuner.from_baselines(
+            {'action': 0.5, 'reset': 2.0}, learned
+        )
+        assert resumed.delays['reset'].value == learned['reset']
+        assert resumed.delays['action'].value == 0.5
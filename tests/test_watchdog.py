@@ -0,0 +1,42 @@
+"""
+Tests for the stall watchdog.
+"""
+
+import numpy as np
+
+from balatro.service_layer.watchdog import StallWatchdog
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full((64, 64, 3), value, dtype=np.uint8)
+
+
+class TestStallWatchdog:
+    """Tests for unchanged-frame and tagless stalls and lost time."""
+
+    def test_changing_frames_do_not_stall(self):
+        watchdog = StallWatchdog(max_unchanged=2)
+        for i in range(10):
+            assert watchdog.observe(frame(i * 20), False, float(i)) is None
+
+    def test_unchanged_frames_stall(self):
+        watchdog = StallWatchdog(max_unchanged=2)
+        assert watchdog.observe(frame(10), False, 0.0) is None
+        assert watchdog.observe(frame(10), False, 10.0) is None
+        reason = watchdog.observe(frame(10), False, 20.0)
+
+        assert reason is not None
+        assert 'unchanged' in reason
+        assert watchdog.record_stall(25.0) == 25.0
+
+    def test_tagless_iterations_stall(self):
+        watchdog = StallWatchdog(max_tagless=3)
+        watchdog.observe(None, True, 0.0)
+        watchdog.observe(None, False, 10.0)
+        watchdog.observe(None, False, 20.0)
+        reason = watchdog.observe(None, False, 30.0)
+
+        assert reason is not None
+        assert 'no tags' in reason
+        assert watchdog.record_stall(30.0) == 30.0
+        assert watchdog.tagless_count == 0